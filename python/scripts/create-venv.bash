@@ -30,4 +30,4 @@ $PYTHON -m venv "$VENV"
 source "$VENV"/bin/activate
 
 pip install --upgrade pip
-pip install -e .[cli,dev]
+pip install -e .[cli,dev,numpy]
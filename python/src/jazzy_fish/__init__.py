@@ -5,10 +5,29 @@ Jazzy Fish
 This package contains the code required by clients who wish to generate jazzy-fish keyphrases.
 
 Modules:
+    aio - Contains the AsyncGenerator class, which awaits the next time unit instead of blocking the event loop.
+    cache - Contains the CachingWordEncoder class, which caches encode and decode results in bounded LRU or ARC caches.
+    checkpoint - Contains the FileCheckpoint class, which persists a Generator's reserved time units across restarts.
+    cli - Contains the `jazzy-fish` command, which encodes and decodes values in bulk, using a pool of worker processes.
+    clock - Contains the clock sources that a Generator can use to determine the current time.
+    compact - Contains the compact, array-backed structures that a Wordlist can store its words and indexes in.
+    compiled - Contains the reader and writer of compiled wordlists, which are memory-mapped by `Wordlist.open_compiled()`.
     encoder - Contains the WordEncoder class that can encode integers to [word sequences]
               and decode [word sequences] to integers.
-    generator - Contains the Generator and ThreadSafeGenerator classes which can generate unique integer identifiers
+    fuzzy - Contains the FuzzyIndex class, which lets a WordEncoder decode keyphrases and abbreviations that contain typos.
+    generator - Contains the Generator, ThreadSafeGenerator, and ShardedGenerator classes which can generate unique integer identifiers
                 that respect the configured settings and can be later converted to [word sequences] with a WordEncoder.
+    layout - Contains functions that decompose identifiers into their parts, and translate time windows into identifier ranges.
+    lease - Contains the LeaseManager class and its backends, which dynamically claim machine IDs for generators.
+    metrics - Contains the GeneratorMetrics class, which records how a Generator behaves under load.
+    permutation - Contains the FeistelPermutation class, which lets a WordEncoder encode sequential identifiers to unrelated keyphrases.
+    pool - Contains the IdPool class, which pre-generates identifiers in a background thread.
+    prefix - Contains the PrefixIndex class, which lets a WordEncoder autocomplete partial keyphrases into identifier ranges.
+    registry - Contains the WordlistRegistry class, which shares loaded wordlists and encoders across a process.
+    shared - Contains the ProcessSafeGenerator class, which shares its machine IDs with other processes through a state file.
+    verification - Contains the VerificationCache class, which lets unchanged wordlist files skip checksum verification.
+    wait - Contains the strategies used by a Generator to wait for the next time unit, once its sequences are exhausted.
+    writer - Contains the KeyPhraseWriter class, which streams encoded keyphrases to a file without intermediate strings.
 
 Usage:
 
@@ -45,14 +64,79 @@ Usage:
     got2 = encoder.decode_abbr(encoded.abbr)
 """
 
+from .aio import AsyncGenerator
+from .cache import ARCCache, CacheStats, CachingWordEncoder, LRUCache
+from .checkpoint import Checkpoint, FileCheckpoint
+from .clock import Clock, CoarseClock, FunctionClock, MonotonicClock, WallClock
 from .encoder import KeyPhrase, WordEncoder, Wordlist
-from .generator import Generator, Resolution, ThreadSafeGenerator
+from .fuzzy import FuzzyMatch
+from .generator import Generator, Resolution, ShardedGenerator, ThreadSafeGenerator
+from .layout import (
+    IdParts,
+    decompose,
+    decompose_many,
+    id_range,
+    id_ranges,
+    keyphrase_range,
+)
+from .lease import Lease, LeaseBackend, LeaseManager, SQLiteLeaseBackend
+from .metrics import GeneratorMetrics, MetricsSnapshot
+from .permutation import FeistelPermutation
+from .pool import IdPool, PoolStats
+from .prefix import Completion
+from .registry import WordlistRegistry, get_encoder, get_wordlist
+from .shared import ProcessSafeGenerator
+from .verification import VerificationCache
+from .wait import HybridWait, NoWait, SleepWait, SpinWait, WaitResult, WaitStrategy
+from .writer import KeyPhraseWriter
 
 __all__ = [
+    "ARCCache",
+    "AsyncGenerator",
+    "CacheStats",
+    "CachingWordEncoder",
+    "Checkpoint",
+    "Clock",
+    "CoarseClock",
+    "Completion",
+    "decompose",
+    "decompose_many",
+    "FeistelPermutation",
+    "FileCheckpoint",
+    "FuzzyMatch",
+    "FunctionClock",
     "Generator",
+    "GeneratorMetrics",
+    "get_encoder",
+    "get_wordlist",
+    "HybridWait",
+    "id_range",
+    "IdPool",
+    "id_ranges",
+    "IdParts",
     "KeyPhrase",
+    "keyphrase_range",
+    "KeyPhraseWriter",
+    "Lease",
+    "LeaseBackend",
+    "LeaseManager",
+    "LRUCache",
+    "MetricsSnapshot",
+    "MonotonicClock",
+    "NoWait",
+    "PoolStats",
+    "ProcessSafeGenerator",
     "Resolution",
+    "ShardedGenerator",
+    "SleepWait",
+    "SpinWait",
+    "SQLiteLeaseBackend",
     "ThreadSafeGenerator",
+    "VerificationCache",
+    "WaitResult",
+    "WaitStrategy",
+    "WallClock",
     "WordEncoder",
     "Wordlist",
+    "WordlistRegistry",
 ]
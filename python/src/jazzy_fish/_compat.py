@@ -0,0 +1,23 @@
+"""
+Compat
+======
+
+Contains helpers for optional dependencies, which are only required by some of the package's functions.
+"""
+
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+
+def require_numpy() -> Any:
+    """Returns the numpy module, or raises an ImportError explaining how to install it."""
+
+    if np is None:
+        raise ImportError(
+            "This function requires NumPy; install it with: pip install jazzy-fish[numpy]"
+        )
+    return np
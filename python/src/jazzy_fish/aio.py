@@ -0,0 +1,127 @@
+"""
+AIO
+===
+
+Contains the AsyncGenerator class, which generates the same identifiers as a Generator,
+but awaits the next time unit instead of blocking the event loop, once its sequences are exhausted.
+
+Classes:
+    AsyncGenerator - Generator for asyncio applications, exposing awaitable `anext_id()` and `anext_ids()` methods.
+"""
+
+import asyncio
+from typing import List, Optional
+
+from .clock import Clock
+from .generator import Generator, Resolution, SequenceExhaustedException
+from .metrics import GeneratorMetrics
+from .wait import NoWait
+
+
+class AsyncGenerator(Generator):
+    """
+    Generator for asyncio applications. Identifiers use the same bit layout as the ones produced by a Generator.
+    Concurrent coroutines are serialized with an asyncio.Lock, and when all sequences of the current time unit
+    are exhausted, the calling coroutine sleeps until the next time unit, letting the event loop run other tasks.
+
+    Instances must only be used from a single event loop; the synchronous `next_id()` and `next_ids()` methods
+    never wait, and instead behave as if configured with the NoWait strategy.
+
+    Attributes:
+        epoch (float): The epoch that the time component will be relative to; set to 0.0 for UNIX time.
+        resolution (Resolution): The time unit resolution, to which the other parameters will be relative to.
+        machine_ids (List[int]): A list of machine identifiers owned by the current instance;
+                                 at least one value must be provided; duplicates will be ignored.
+        machine_id_bits (int): How many bits are allocated for the machine ID;
+                               only positive integers are valid.
+        sequence_bits (int): How many bits are allocated for the local sequence;
+                             only positive integers are valid.
+                             If set to 0, only one identifier can be generated per machine in each time unit
+        clock (Clock): The clock source used to determine the current time.
+        metrics (Optional[GeneratorMetrics]): If set, records the generator's counters and histograms.
+    """
+
+    def __init__(
+        self,
+        epoch: float,
+        resolution: Resolution,
+        machine_ids: List[int],
+        machine_id_bits: int,
+        sequence_bits: int,
+        clock: Optional[Clock] = None,
+        metrics: Optional[GeneratorMetrics] = None,
+    ):
+        """
+        Constructs a new instance of AsyncGenerator.
+
+        Parameters:
+            epoch (float): The epoch that the time component will be relative to; set to 0.0 for UNIX time.
+            resolution (Resolution): The time unit resolution, to which the other parameters will be relative to.
+            machine_ids (List[int]): A list of machine identifiers owned by the current instance;
+                                    at least one value must be provided; duplicates will be ignored.
+            machine_id_bits (int): How many bits are allocated for the machine ID;
+                                only positive integers are valid.
+            sequence_bits (int): How many bits are allocated for the local sequence;
+                                only positive integers are valid.
+                                If set to 0, only one identifier can be generated per machine in each time unit
+            clock (Optional[Clock]): The clock source used to determine the current time.
+                                     Defaults to the system's wall clock (WallClock).
+            metrics (Optional[GeneratorMetrics]): If set, records the generator's counters and histograms.
+        """
+        super().__init__(
+            epoch,
+            resolution,
+            machine_ids,
+            machine_id_bits,
+            sequence_bits,
+            NoWait(),
+            clock,
+            metrics=metrics,
+        )
+        # Created on first use, so that it is bound to the running event loop (required by Python 3.9)
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def anext_id(self) -> int:
+        """
+        Generates unique values according to the configured class settings.
+        If the maximum sequences per time unit have already been generated,
+        the coroutine sleeps until the next time unit has been reached.
+
+        Returns:
+            int: A unique integer identifier, relative to the configured time unit, and machine ID.
+        """
+
+        async with self._get_lock():
+            while True:
+                try:
+                    return self.next_id()
+                except SequenceExhaustedException:
+                    await self._sleep_until_next_time()
+
+    async def anext_ids(self, count: int) -> List[int]:
+        """
+        Generates a batch of unique values, in the same order as `count` consecutive calls to `anext_id()` would.
+        Whenever the sequences of the current time unit are exhausted, the coroutine sleeps until the next one.
+
+        Parameters:
+            count (int): How many identifiers to generate.
+
+        Returns:
+            List[int]: Unique integer identifiers, relative to the configured time unit, and machine IDs.
+        """
+
+        async with self._get_lock():
+            ids = self.next_ids(count)
+            while len(ids) < count:
+                await self._sleep_until_next_time()
+                ids += self.next_ids(count - len(ids))
+            return ids
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def _sleep_until_next_time(self) -> None:
+        remaining = self._seconds_until(self._current_time() + 1)
+        await asyncio.sleep(max(remaining, 0.0))
@@ -0,0 +1,325 @@
+"""
+Cache
+=====
+
+Contains the CachingWordEncoder class, which caches the results of encoding and decoding hot values,
+along with the bounded caches (and their eviction policies) that it can be configured with.
+
+Classes:
+    ARCCache - Bounded cache that adapts between recency and frequency (Adaptive Replacement Cache).
+    Cache - Base class for thread-safe, bounded caches.
+    CacheStats - A point-in-time copy of a Cache's counters.
+    CachingWordEncoder - WordEncoder that caches encode, decode, and decode_abbr results.
+    LRUCache - Bounded cache that evicts the least recently used entry.
+"""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+import threading
+from typing import Any, Callable, Hashable, NamedTuple, Optional, Union
+
+from .encoder import KeyPhrase, WordEncoder, Wordlist
+
+
+class CacheStats(NamedTuple):
+    """
+    A point-in-time copy of a Cache's counters.
+
+    Attributes:
+        hits (int): How many lookups found a cached value.
+        misses (int): How many lookups did not find a cached value.
+        evictions (int): How many entries were evicted to make room for new ones.
+        size (int): How many entries are cached.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class Cache(ABC):
+    """
+    Base class for thread-safe, bounded caches; subclasses implement the eviction policy.
+
+    Attributes:
+        maxsize (int): The maximum number of cached entries.
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        Constructs a new instance of Cache.
+
+        Parameters:
+            maxsize (int): The maximum number of cached entries.
+        """
+        if maxsize < 1:
+            raise ValueError(f"The cache size must be positive, got: {maxsize}")
+
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Looks up a cached value.
+
+        Parameters:
+            key (Hashable): The key to look up.
+
+        Returns:
+            Optional[Any]: The cached value, or None if the key is not cached.
+        """
+
+        with self._lock:
+            value = self._lookup(key)
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Caches a value, evicting other entries if the cache is full.
+
+        Parameters:
+            key (Hashable): The key to cache the value under.
+            value (Any): The value to cache; must not be None.
+        """
+
+        with self._lock:
+            self._evictions += self._store(key, value)
+
+    def stats(self) -> CacheStats:
+        """Returns a point-in-time copy of the cache's counters."""
+
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self))
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Returns the number of cached entries."""
+        pass
+
+    @abstractmethod
+    def _lookup(self, key: Hashable) -> Optional[Any]:
+        """Returns the cached value (updating the policy's state), or None; called while holding the lock."""
+        pass
+
+    @abstractmethod
+    def _store(self, key: Hashable, value: Any) -> int:
+        """Caches a value, and returns how many entries were evicted; called while holding the lock."""
+        pass
+
+
+class LRUCache(Cache):
+    """
+    Bounded cache that evicts the least recently used entry.
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        Constructs a new instance of LRUCache.
+
+        Parameters:
+            maxsize (int): The maximum number of cached entries.
+        """
+        super().__init__(maxsize)
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, key: Hashable) -> Optional[Any]:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def _store(self, key: Hashable, value: Any) -> int:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            return 1
+        return 0
+
+
+class ARCCache(Cache):
+    """
+    Bounded cache that implements the Adaptive Replacement Cache policy (Megiddo and Modha, 2003).
+
+    Entries seen once and entries seen repeatedly are kept in separate LRU lists, whose target sizes adapt
+    based on the recently evicted keys (ghost entries, which do not store values) that are requested again.
+    Unlike LRU, a scan over many cold values does not evict the hot ones.
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        Constructs a new instance of ARCCache.
+
+        Parameters:
+            maxsize (int): The maximum number of cached entries.
+        """
+        super().__init__(maxsize)
+        # Target size of the recency list
+        self._target = 0
+        # Entries seen once (recency), and entries seen at least twice (frequency)
+        self._recent: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._frequent: "OrderedDict[Hashable, Any]" = OrderedDict()
+        # Keys recently evicted from each of the lists above
+        self._recent_ghosts: "OrderedDict[Hashable, None]" = OrderedDict()
+        self._frequent_ghosts: "OrderedDict[Hashable, None]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._recent) + len(self._frequent)
+
+    def _lookup(self, key: Hashable) -> Optional[Any]:
+        if key in self._recent:
+            value = self._recent.pop(key)
+            self._frequent[key] = value
+            return value
+        if key in self._frequent:
+            self._frequent.move_to_end(key)
+            return self._frequent[key]
+        return None
+
+    def _store(self, key: Hashable, value: Any) -> int:
+        if key in self._recent:
+            del self._recent[key]
+            self._frequent[key] = value
+            return 0
+        if key in self._frequent:
+            self._frequent[key] = value
+            self._frequent.move_to_end(key)
+            return 0
+
+        if key in self._recent_ghosts:
+            # The recency list was too small: grow its target
+            delta = max(len(self._frequent_ghosts) // len(self._recent_ghosts), 1)
+            self._target = min(self._target + delta, self.maxsize)
+            evicted = self._replace(key)
+            del self._recent_ghosts[key]
+            self._frequent[key] = value
+            return evicted
+
+        if key in self._frequent_ghosts:
+            # The frequency list was too small: shrink the recency list's target
+            delta = max(len(self._recent_ghosts) // len(self._frequent_ghosts), 1)
+            self._target = max(self._target - delta, 0)
+            evicted = self._replace(key)
+            del self._frequent_ghosts[key]
+            self._frequent[key] = value
+            return evicted
+
+        evicted = 0
+        recent_size = len(self._recent) + len(self._recent_ghosts)
+        total_size = recent_size + len(self._frequent) + len(self._frequent_ghosts)
+        if recent_size >= self.maxsize:
+            if len(self._recent) < self.maxsize:
+                self._recent_ghosts.popitem(last=False)
+                evicted = self._replace(key)
+            else:
+                self._recent.popitem(last=False)
+                evicted = 1
+        elif total_size >= self.maxsize:
+            if total_size >= 2 * self.maxsize:
+                self._frequent_ghosts.popitem(last=False)
+            evicted = self._replace(key)
+
+        self._recent[key] = value
+        return evicted
+
+    def _replace(self, key: Hashable) -> int:
+        # Evict an entry from one of the lists (remembering its key), if the cache is full
+        if len(self) < self.maxsize:
+            return 0
+
+        if self._recent and (
+            not self._frequent
+            or len(self._recent) > self._target
+            or (key in self._frequent_ghosts and len(self._recent) == self._target)
+        ):
+            evicted, _ = self._recent.popitem(last=False)
+            self._recent_ghosts[evicted] = None
+        else:
+            evicted, _ = self._frequent.popitem(last=False)
+            self._frequent_ghosts[evicted] = None
+        return 1
+
+
+class CachingWordEncoder(WordEncoder):
+    """
+    WordEncoder that caches the results of `encode()`, `decode()`, and `decode_abbr()`, in separate bounded caches.
+    Values that fail to encode or decode are not cached. Instances can be shared across threads.
+
+    Attributes:
+        encode_cache (Cache): Caches keyphrases, by integer.
+        decode_cache (Cache): Caches integers, by keyphrase.
+        decode_abbr_cache (Cache): Caches integers, by keyphrase abbreviation.
+    """
+
+    def __init__(
+        self,
+        wordlist: Wordlist,
+        min_phrase_size: Optional[int] = None,
+        separator: str = "-",
+        maxsize: int = 4096,
+        policy: Callable[[int], Cache] = LRUCache,
+        permutation_key: Optional[Union[bytes, str]] = None,
+    ):
+        """
+        Constructs a new instance of CachingWordEncoder.
+
+        Parameters:
+            wordlist (Wordlist): Word list used to map integers to words.
+            min_phrase_size (Optional[int]): What is the minimum sequence that should be returned.
+            separator (str): The separator character used to delimit sequence parts.
+            maxsize (int): The maximum number of entries in each of the caches.
+            policy (Callable[[int], Cache]): Creates each cache, given its maximum size (e.g., LRUCache, or ARCCache).
+            permutation_key (Optional[Union[bytes, str]]): If provided, integers are shuffled before being encoded.
+        """
+        super().__init__(wordlist, min_phrase_size, separator, permutation_key)
+        self.encode_cache = policy(maxsize)
+        self.decode_cache = policy(maxsize)
+        self.decode_abbr_cache = policy(maxsize)
+
+    def encode(self, number: int) -> KeyPhrase:
+        cached = self.encode_cache.get(number)
+        if cached is not None:
+            return cached
+
+        keyphrase = super().encode(number)
+        self.encode_cache.put(number, keyphrase)
+        return keyphrase
+
+    def decode(self, keyphrase: str) -> int:
+        cached = self.decode_cache.get(keyphrase)
+        if cached is not None:
+            return cached
+
+        number = super().decode(keyphrase)
+        self.decode_cache.put(keyphrase, number)
+        return number
+
+    def decode_abbr(self, abbr: str) -> int:
+        cached = self.decode_abbr_cache.get(abbr)
+        if cached is not None:
+            return cached
+
+        number = super().decode_abbr(abbr)
+        self.decode_abbr_cache.put(abbr, number)
+        return number
+
+    def stats(self) -> CacheStats:
+        """Returns the combined counters of all caches."""
+
+        stats = [
+            self.encode_cache.stats(),
+            self.decode_cache.stats(),
+            self.decode_abbr_cache.stats(),
+        ]
+        return CacheStats(*[sum(counters) for counters in zip(*stats)])
@@ -0,0 +1,155 @@
+"""
+Checkpoint
+==========
+
+Contains the classes that persist a Generator's high-water mark (the last reserved time unit of each machine ID),
+so that a restarted generator never reissues identifiers, even if the clock went backwards.
+
+Classes:
+    Checkpoint - Base class for the storage backends of high-water marks.
+    FileCheckpoint - Stores high-water marks in a JSON file, durably replaced on every save.
+"""
+
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+import json
+import os
+import threading
+from typing import Dict, Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+# Serializes saves within the process, where file locks are not available
+_save_lock = threading.Lock()
+
+
+class Checkpoint(ABC):
+    """
+    Base class for the storage backends of high-water marks.
+
+    To avoid a durable write for every identifier, generators reserve time units ahead of the current one,
+    and only persist the reservation. After a restart, the generator waits (using its wait strategy)
+    until the reserved time units have passed; this wait is not reported as a clock regression.
+
+    Attributes:
+        reserve_ahead (float): How many seconds to reserve ahead of the current time, with every save;
+                               higher values result in fewer writes, but longer waits after a restart.
+    """
+
+    def __init__(self, reserve_ahead: float = 1.0):
+        """
+        Constructs a new instance of Checkpoint.
+
+        Parameters:
+            reserve_ahead (float): How many seconds to reserve ahead of the current time, with every save.
+        """
+        if reserve_ahead < 0:
+            raise ValueError(
+                f"The reservation cannot be negative, got: {reserve_ahead}"
+            )
+        self.reserve_ahead = reserve_ahead
+
+    @abstractmethod
+    def load(self) -> Dict[int, int]:
+        """
+        Loads the persisted high-water marks.
+
+        Returns:
+            Dict[int, int]: The last reserved time unit, for each machine ID; empty if nothing was persisted.
+        """
+        pass
+
+    @abstractmethod
+    def save(self, marks: Dict[int, int]) -> None:
+        """
+        Durably persists the specified high-water marks, before returning.
+
+        Parameters:
+            marks (Dict[int, int]): The last reserved time unit, for each machine ID.
+        """
+        pass
+
+
+class FileCheckpoint(Checkpoint):
+    """
+    Stores high-water marks in a JSON file. Every save writes a temporary file, fsyncs it,
+    and atomically replaces the previous one, so that a crash never leaves a partially written checkpoint.
+
+    Generators that own different machine IDs can share a file: each save merges the saved marks
+    with the ones stored for other machine IDs, while holding an exclusive lock (on a `.lock` file next to it,
+    on POSIX platforms), and marks never decrease.
+
+    Attributes:
+        path (str): Path to the checkpoint file.
+        reserve_ahead (float): How many seconds to reserve ahead of the current time, with every save;
+                               a generator restarted right after a save waits up to this long,
+                               before issuing its first identifier.
+        saves (int): How many times the checkpoint was saved.
+    """
+
+    def __init__(self, path: str, reserve_ahead: float = 1.0):
+        """
+        Constructs a new instance of FileCheckpoint.
+
+        Parameters:
+            path (str): Path to the checkpoint file; it will be created on the first save.
+            reserve_ahead (float): How many seconds to reserve ahead of the current time, with every save;
+                                   also the longest wait after a restart.
+        """
+        super().__init__(reserve_ahead)
+        self.path = path
+        self.saves = 0
+
+    def load(self) -> Dict[int, int]:
+        if not os.path.exists(self.path):
+            return {}
+
+        with open(self.path, "r") as file:
+            data = json.load(file)
+        return {int(mid): int(mark) for mid, mark in data.items()}
+
+    def save(self, marks: Dict[int, int]) -> None:
+        with self._locked():
+            # Keep the marks of the machine IDs owned by other generators
+            merged = self.load()
+            for mid, mark in marks.items():
+                merged[mid] = max(merged.get(mid, mark), mark)
+
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as file:
+                json.dump({str(mid): mark for mid, mark in merged.items()}, file)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, self.path)
+
+            # Persist the rename itself (directories can only be opened, and synced, on POSIX platforms)
+            if os.name == "posix":
+                fd = os.open(
+                    os.path.dirname(os.path.abspath(self.path)),
+                    os.O_RDONLY | os.O_DIRECTORY,
+                )
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+
+        self.saves += 1
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        # Excludes concurrent saves of the same file, from this process, and (with file locks) from others
+        with _save_lock:
+            if fcntl is None:
+                yield
+                return
+
+            fd = os.open(f"{self.path}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                yield
+            finally:
+                # Closing the file also releases its lock
+                os.close(fd)
@@ -0,0 +1,431 @@
+"""
+CLI
+===
+
+Contains the `jazzy-fish` command, which encodes identifiers, and decodes keyphrases or abbreviations, in bulk.
+
+Values are read line by line (one per line) from files or stdin, and grouped into chunks, which are converted by
+a pool of worker processes that each load the wordlist once. Converted chunks are written in their original order,
+as text (one result per line), JSONL, or CSV, while holding at most a few chunks per worker in memory.
+
+Usage:
+
+    seq 0 999999 | jazzy-fish encode --format csv > keyphrases.csv
+    jazzy-fish decode --workers 8 --output ids.jsonl --format jsonl keyphrases.txt
+
+Classes:
+    ConversionConfig - Configures how values are converted, and how the results are formatted.
+    ConversionStats - Summarizes a conversion.
+
+Functions:
+    convert - Converts values in chunks, in parallel, and writes the results in order.
+    main - The entry point of the `jazzy-fish` command.
+"""
+
+import argparse
+from collections import deque
+import csv
+import io
+import json
+import multiprocessing
+from multiprocessing.pool import AsyncResult, Pool
+import os
+import sys
+import time
+from typing import (
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+)
+
+from ._compat import np
+from .encoder import EncoderException, WordEncoder, Wordlist
+from .registry import get_encoder
+
+ENCODE = "encode"
+DECODE = "decode"
+DECODE_ABBR = "decode-abbr"
+
+FORMATS = ("text", "jsonl", "csv")
+
+DEFAULT_WORDLIST = "resources/012_8562fb9"
+DEFAULT_PACKAGE = "jazzy_fish"
+DEFAULT_CHUNK_SIZE = 10_000
+
+# The output columns of each command; the second one is the result, which is the only one written as text
+_COLUMNS = {
+    ENCODE: ("id", "keyphrase", "abbr"),
+    DECODE: ("keyphrase", "id"),
+    DECODE_ABBR: ("abbr", "id"),
+}
+
+# Chunks submitted to the pool, per worker, before waiting for the oldest one to be written
+_PENDING_PER_WORKER = 2
+
+
+class ConversionConfig(NamedTuple):
+    """
+    Configures how values are converted, and how the results are formatted; sent to each worker process.
+
+    Attributes:
+        command (str): One of ENCODE, DECODE, or DECODE_ABBR.
+        wordlist (str): The wordlist directory, or compiled wordlist file (.jfwl).
+        package_name (Optional[str]): If specified, the wordlist will be loaded from a package.
+        min_phrase_size (Optional[int]): What is the minimum sequence that should be encoded.
+        separator (str): The separator character used to delimit keyphrase and abbreviation parts.
+        output_format (str): One of FORMATS.
+        skip_errors (bool): If true, values that cannot be converted are reported and skipped;
+                            otherwise, the conversion stops at the first of them.
+    """
+
+    command: str
+    wordlist: str = DEFAULT_WORDLIST
+    package_name: Optional[str] = DEFAULT_PACKAGE
+    min_phrase_size: Optional[int] = None
+    separator: str = "-"
+    output_format: str = "text"
+    skip_errors: bool = False
+
+
+class ConversionStats(NamedTuple):
+    """
+    Summarizes a conversion.
+
+    Attributes:
+        rows (int): How many values were converted.
+        errors (int): How many values could not be converted.
+        seconds (float): How long the conversion took.
+    """
+
+    rows: int
+    errors: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """The conversion's throughput."""
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+class _ChunkResult(NamedTuple):
+    # The formatted output, the number of converted values, and the values that could not be converted
+    output: str
+    rows: int
+    errors: List[str]
+
+
+# The encoder of the current (worker) process, loaded once by _init_worker()
+_config: Optional[ConversionConfig] = None
+_encoder: Optional[WordEncoder] = None
+
+
+def convert(
+    config: ConversionConfig,
+    lines: Iterable[str],
+    output: TextIO,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    errors: Optional[TextIO] = None,
+    progress: Optional[Callable[[ConversionStats], None]] = None,
+    progress_interval: float = 10.0,
+) -> ConversionStats:
+    """
+    Converts values in chunks, in parallel, and writes the results in their original order.
+    Blank lines are ignored.
+
+    Parameters:
+        config (ConversionConfig): Configures the conversion.
+        lines (Iterable[str]): The values to convert, one per line (e.g., an open file).
+        output (TextIO): Where the results are written.
+        workers (Optional[int]): The number of worker processes; defaults to the number of CPUs.
+                                 If 0, values are converted in the current process.
+        chunk_size (int): How many values are sent to a worker at a time.
+        errors (Optional[TextIO]): Where skipped values are reported (if `config.skip_errors` is set).
+        progress (Optional[Callable[[ConversionStats], None]]): Called with the running totals,
+                                                                 at most once every `progress_interval` seconds.
+        progress_interval (float): The minimum time between progress reports, in seconds.
+
+    Returns:
+        ConversionStats: The conversion's totals.
+    """
+
+    if config.command not in _COLUMNS:
+        raise ValueError(
+            f"Unknown command '{config.command}', expected one of {list(_COLUMNS)}"
+        )
+    if config.output_format not in FORMATS:
+        raise ValueError(
+            f"Unknown format '{config.output_format}', expected one of {list(FORMATS)}"
+        )
+    if chunk_size < 1:
+        raise ValueError(f"The chunk size must be positive, got: {chunk_size}")
+
+    start = time.perf_counter()
+    last_report = start
+    rows = failed = 0
+
+    if config.output_format == "csv":
+        output.write(",".join(_COLUMNS[config.command]) + "\n")
+
+    chunks = _read_chunks(lines, chunk_size)
+    pool: Optional[Pool] = None
+    if workers == 0:
+        _init_worker(config)
+        results: Iterator[_ChunkResult] = map(_convert_chunk, chunks)
+    else:
+        workers = workers or os.cpu_count() or 1
+        pool = multiprocessing.Pool(workers, _init_worker, (config,))
+        results = _imap_ordered(pool, chunks, _PENDING_PER_WORKER * workers)
+
+    try:
+        for result in results:
+            if result.errors and not config.skip_errors:
+                raise EncoderException(result.errors[0])
+
+            output.write(result.output)
+            rows += result.rows
+            failed += len(result.errors)
+            if errors is not None:
+                for error in result.errors:
+                    errors.write(error + "\n")
+
+            now = time.perf_counter()
+            if progress is not None and now - last_report >= progress_interval:
+                progress(ConversionStats(rows, failed, now - start))
+                last_report = now
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    return ConversionStats(rows, failed, time.perf_counter() - start)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """The entry point of the `jazzy-fish` command; returns its exit status."""
+
+    parser = argparse.ArgumentParser(
+        prog="jazzy-fish",
+        description="Encode identifiers, and decode keyphrases or abbreviations, in bulk",
+    )
+    parser.add_argument(
+        "command",
+        choices=list(_COLUMNS),
+        help="Encode integers, decode keyphrases, or decode keyphrase abbreviations.",
+    )
+    parser.add_argument(
+        "files",
+        nargs="*",
+        default=["-"],
+        help="Files that contain one value per line; reads stdin if omitted, or '-'.",
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", help="The output file; defaults to stdout."
+    )
+    parser.add_argument(
+        "-f", "--format", choices=FORMATS, default="text", help="The output format."
+    )
+    parser.add_argument(
+        "-w",
+        "--wordlist",
+        help="A wordlist directory, or compiled wordlist (.jfwl); defaults to the packaged "
+        f"'{DEFAULT_WORDLIST}' wordlist.",
+    )
+    parser.add_argument(
+        "--min-phrase-size",
+        type=int,
+        help="The minimum number of words in encoded keyphrases.",
+    )
+    parser.add_argument(
+        "--separator", default="-", help="The keyphrase separator character."
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        help="The number of worker processes (0 converts in the current process); defaults to the number of CPUs.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="How many values are sent to a worker at a time.",
+    )
+    parser.add_argument(
+        "--skip-errors",
+        action="store_true",
+        help="Report values that cannot be converted on stderr, and continue (exiting with status 1).",
+    )
+    parser.add_argument(
+        "--progress",
+        type=float,
+        default=0,
+        metavar="SECONDS",
+        help="Report the throughput on stderr, every SECONDS.",
+    )
+    parser.add_argument(
+        "-q", "--quiet", action="store_true", help="Do not report the totals."
+    )
+    args = parser.parse_args(argv)
+
+    config = ConversionConfig(
+        command=args.command,
+        wordlist=args.wordlist or DEFAULT_WORDLIST,
+        package_name=None if args.wordlist else DEFAULT_PACKAGE,
+        min_phrase_size=args.min_phrase_size,
+        separator=args.separator,
+        output_format=args.format,
+        skip_errors=args.skip_errors,
+    )
+
+    output = (
+        sys.stdout
+        if args.output == "-"
+        else open(args.output, "w", newline="", encoding="utf-8")
+    )
+    try:
+        stats = convert(
+            config,
+            _read_lines(args.files),
+            output,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            errors=sys.stderr,
+            progress=_report if args.progress > 0 else None,
+            progress_interval=args.progress,
+        )
+    except (EncoderException, OSError, ValueError) as e:
+        print(f"jazzy-fish: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    if not args.quiet:
+        _report(stats)
+    return 1 if stats.errors else 0
+
+
+def _report(stats: ConversionStats) -> None:
+    errors = f", {stats.errors:,} errors" if stats.errors else ""
+    print(
+        f"{stats.rows:,} rows in {stats.seconds:.2f}s ({stats.rows_per_second:,.0f} rows/s){errors}",
+        file=sys.stderr,
+    )
+
+
+def _read_lines(files: Sequence[str]) -> Iterator[str]:
+    for path in files:
+        if path == "-":
+            yield from sys.stdin
+        else:
+            with open(path, "r", encoding="utf-8") as file:
+                yield from file
+
+
+def _read_chunks(lines: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    chunk: List[str] = []
+    for line in lines:
+        value = line.strip()
+        if value:
+            chunk.append(value)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def _imap_ordered(
+    pool: Pool, chunks: Iterator[List[str]], max_pending: int
+) -> Iterator[_ChunkResult]:
+    # Unlike Pool.imap(), which consumes its whole input eagerly, only keeps a bounded number of chunks in flight
+    pending: Deque[AsyncResult] = deque()
+    for chunk in chunks:
+        pending.append(pool.apply_async(_convert_chunk, (chunk,)))
+        if len(pending) >= max_pending:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def _init_worker(config: ConversionConfig) -> None:
+    global _config, _encoder
+
+    _config = config
+    if config.wordlist.endswith(".jfwl"):
+        # Memory-mapped, so that forked workers share the same pages
+        wordlist = Wordlist.open_compiled(config.wordlist, config.package_name)
+        _encoder = WordEncoder(wordlist, config.min_phrase_size, config.separator)
+    else:
+        _encoder = get_encoder(
+            config.wordlist,
+            config.package_name,
+            min_phrase_size=config.min_phrase_size,
+            separator=config.separator,
+        )
+
+
+def _convert_chunk(values: List[str]) -> _ChunkResult:
+    assert _config is not None and _encoder is not None
+
+    try:
+        rows = _convert_values(_encoder, _config.command, values, batch=np is not None)
+        errors: List[str] = []
+    except (EncoderException, KeyError, ValueError, OverflowError):
+        # Convert values one at a time, to identify the ones that cannot be converted
+        rows, errors = [], []
+        for value in values:
+            try:
+                rows += _convert_values(_encoder, _config.command, [value], batch=False)
+            except (EncoderException, KeyError, ValueError, OverflowError) as e:
+                errors.append(f"Could not {_config.command} {value!r}: {e!r}")
+                if not _config.skip_errors:
+                    break
+
+    return _ChunkResult(
+        _format_rows(rows, _config.command, _config.output_format), len(rows), errors
+    )
+
+
+def _convert_values(
+    encoder: WordEncoder, command: str, values: List[str], batch: bool
+) -> List[Tuple]:
+    if command == ENCODE:
+        numbers = [int(value) for value in values]
+        if batch:
+            keyphrases = encoder.encode_many(numbers)
+        else:
+            keyphrases = [encoder.encode(number) for number in numbers]
+        return [(k.id, k.keyphrase, k.abbr) for k in keyphrases]
+
+    decode: Callable[[str], int] = encoder.decode
+    decode_many: Callable[[List[str]], List[int]] = encoder.decode_many
+    if command == DECODE_ABBR:
+        decode, decode_many = encoder.decode_abbr, encoder.decode_abbr_many
+    ids = decode_many(values) if batch else [decode(value) for value in values]
+    return list(zip(values, ids))
+
+
+def _format_rows(rows: List[Tuple], command: str, output_format: str) -> str:
+    if output_format == "text":
+        return "".join(f"{row[1]}\n" for row in rows)
+
+    if output_format == "jsonl":
+        columns = _COLUMNS[command]
+        return "".join(json.dumps(dict(zip(columns, row))) + "\n" for row in rows)
+
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
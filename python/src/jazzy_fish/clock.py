@@ -0,0 +1,83 @@
+"""
+Clock
+=====
+
+Contains the clock sources that a Generator can use to determine the current time.
+
+Classes:
+    Clock - Base class for all clock sources.
+    CoarseClock - Monotonic clock based on the kernel's cached (coarse) clock, falling back to MonotonicClock.
+    FunctionClock - Clock that reads the time from a function returning seconds since the UNIX epoch.
+    MonotonicClock - Monotonic clock with nanosecond precision, anchored once to the wall clock.
+    WallClock - Wall clock based on `time.time()` (the default behavior); can step backwards.
+"""
+
+from abc import ABC, abstractmethod
+from functools import partial
+import time
+from typing import Callable
+
+
+class Clock(ABC):
+    """
+    Base class for all clock sources.
+    """
+
+    @abstractmethod
+    def millis(self) -> int:
+        """Returns the number of milliseconds elapsed since the UNIX epoch."""
+        pass
+
+
+class WallClock(Clock):
+    """
+    Wall clock based on `time.time()`; it follows system time adjustments and can therefore step backwards.
+    """
+
+    def millis(self) -> int:
+        return int(time.time() * 1000)
+
+
+class FunctionClock(Clock):
+    """
+    Clock that reads the time from a function returning the number of seconds since the UNIX epoch
+    (e.g., `time.time`), as the `Generator.current_time` attribute used to.
+    """
+
+    def __init__(self, seconds: Callable[[], float]):
+        self.seconds = seconds
+
+    def millis(self) -> int:
+        return int(self.seconds() * 1000)
+
+
+class MonotonicClock(Clock):
+    """
+    Monotonic clock based on `time.monotonic_ns()`, anchored once to the wall clock when constructed.
+    It only uses integer arithmetic and never steps backwards, but does not follow later system time adjustments.
+    """
+
+    def __init__(self) -> None:
+        self._monotonic_ns: Callable[[], int] = time.monotonic_ns
+        self._offset_ns = time.time_ns() - self._monotonic_ns()
+
+    def millis(self) -> int:
+        return (self._monotonic_ns() + self._offset_ns) // 1_000_000
+
+
+class CoarseClock(MonotonicClock):
+    """
+    Monotonic clock based on the kernel's cached clock (CLOCK_MONOTONIC_COARSE), which is cheaper to read,
+    but only advances once per scheduler tick (typically every 1-4ms).
+    At MILLISECOND resolution, this reduces the number of distinct time units observed by a Generator,
+    and thus its maximum throughput. Falls back to MonotonicClock on platforms without a coarse clock.
+    """
+
+    def __init__(self) -> None:
+        coarse = getattr(time, "CLOCK_MONOTONIC_COARSE", None)
+        if coarse is None:
+            super().__init__()
+            return
+
+        self._monotonic_ns = partial(time.clock_gettime_ns, coarse)
+        self._offset_ns = time.time_ns() - self._monotonic_ns()
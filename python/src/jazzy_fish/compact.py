@@ -0,0 +1,135 @@
+"""
+Compact
+=======
+
+Contains the compact, array-backed structures that a Wordlist can use instead of lists of strings and dictionaries,
+reducing the number of objects kept alive (and tracked by the garbage collector) for each loaded wordlist.
+
+Classes:
+    CompactWords - An immutable sequence of strings, stored in a single UTF-8 buffer.
+    HashIndex - Maps the strings of a sequence to their positions, using an open-addressing hash table.
+"""
+
+from array import array
+from typing import Iterable, Iterator, List, Mapping, Sequence, Union, overload
+
+
+class CompactWords(Sequence[str]):
+    """
+    An immutable sequence of strings, stored in a single UTF-8 buffer.
+    The i-th string spans the bytes between `offsets[i]` and `offsets[i + 1]`.
+    Strings are decoded on access; the buffer and offsets can be any buffers (e.g., slices of a memory-mapped file).
+    """
+
+    def __init__(self, buffer: Union[bytes, memoryview], offsets: Sequence[int]):
+        """
+        Constructs a new instance of CompactWords.
+
+        Parameters:
+            buffer (Union[bytes, memoryview]): The concatenated UTF-8 encoded strings.
+            offsets (Sequence[int]): The start of each string in the buffer, followed by the end of the last one.
+        """
+        if not len(offsets):
+            raise ValueError("The offsets must include the end of the last string")
+
+        self._buffer = buffer
+        self._offsets = offsets
+
+    @staticmethod
+    def from_words(words: Iterable[str]) -> "CompactWords":
+        """Encodes the specified strings into a new CompactWords sequence."""
+
+        buffer = bytearray()
+        offsets = array("I", [0])
+        for word in words:
+            buffer += word.encode("utf-8")
+            offsets.append(len(buffer))
+        return CompactWords(bytes(buffer), offsets)
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the buffer and offsets, in bytes."""
+        return len(self._buffer) + len(self._offsets) * 4
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError(f"Index out of range: {index}")
+        return str(
+            self._buffer[self._offsets[index] : self._offsets[index + 1]], "utf-8"
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        buffer, offsets = self._buffer, self._offsets
+        for i in range(len(self)):
+            yield str(buffer[offsets[i] : offsets[i + 1]], "utf-8")
+
+
+class HashIndex(Mapping[str, int]):
+    """
+    Maps the strings of a sequence (typically, CompactWords) to their positions, using an open-addressing
+    (linear probing) hash table of array-backed slots, sized to a load factor of at most 50%.
+    If a string occurs multiple times, it maps to its last position, like a dictionary built from the same sequence would.
+    """
+
+    def __init__(self, keys: Sequence[str]):
+        """
+        Constructs a new instance of HashIndex.
+
+        Parameters:
+            keys (Sequence[str]): The strings to index; they are not copied.
+        """
+        self._keys = keys
+        self._mask = (1 << max(len(keys) * 2 - 1, 1).bit_length()) - 1
+        self._slots = array("i", [-1]) * (self._mask + 1)
+        self._count = 0
+
+        for position, key in enumerate(keys):
+            slot = self._find_slot(key)
+            if self._slots[slot] == -1:
+                self._count += 1
+            self._slots[slot] = position
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the hash table, in bytes (excluding the indexed keys)."""
+        return len(self._slots) * self._slots.itemsize
+
+    def __getitem__(self, key: str) -> int:
+        position = self._slots[self._find_slot(key)]
+        if position == -1:
+            raise KeyError(key)
+        return position
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._slots[self._find_slot(key)] != -1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        for position in self._slots:
+            if position != -1:
+                yield self._keys[position]
+
+    def _find_slot(self, key: str) -> int:
+        # Returns the slot that holds the key, or the empty slot where it would be inserted
+        slots, keys, mask = self._slots, self._keys, self._mask
+        slot = hash(key) & mask
+        while slots[slot] != -1 and keys[slots[slot]] != key:
+            slot = (slot + 1) & mask
+        return slot
@@ -0,0 +1,307 @@
+"""
+Compiled
+========
+
+Contains the reader and writer of compiled wordlists: single binary files that hold a wordlist's words,
+precomputed abbreviations, minimal perfect hash tables for decoding words and abbreviations, and its checksum.
+Compiled wordlists are memory-mapped without parsing their contents, so that processes (e.g., forked workers)
+share the same pages, instead of each building their own lists and dictionaries.
+
+The file starts with a header (magic, version, number of word lists, checksum, and name), followed by a table
+of 8 sections for each word list, and the sections' data. All integers are little-endian, and all sections are
+8-byte aligned:
+    words - The concatenated UTF-8 encoded words.
+    word offsets - The start of each word in the buffer, followed by the end of the last one (uint32).
+    abbreviations - The concatenated UTF-8 encoded abbreviations.
+    abbreviation offsets - The start of each abbreviation in the buffer, followed by the end of the last one (uint32).
+    word seeds, word values - The minimal perfect hash table of the words (int32, uint32).
+    abbreviation seeds, abbreviation values - The minimal perfect hash table of the abbreviations (int32, uint32).
+
+Classes:
+    CompiledWordlist - The contents of a compiled wordlist.
+    PerfectHashIndex - Maps strings to their positions, using a minimal perfect hash table.
+
+Functions:
+    open_compiled - Memory-maps a compiled wordlist.
+    write_compiled - Writes a compiled wordlist.
+"""
+
+from array import array
+import mmap
+import struct
+import sys
+from typing import Dict, Iterator, List, Mapping, NamedTuple, Sequence, Tuple
+import zlib
+
+from .compact import CompactWords
+
+MAGIC = b"JFWL"
+VERSION = 1
+
+# magic, version, number of word lists, checksum (hex), name (UTF-8, zero-padded)
+_HEADER = struct.Struct("<4sHH40s64s")
+# offset and length (in bytes) of a section
+_SECTION = struct.Struct("<QQ")
+_SECTIONS_PER_LIST = 8
+_ALIGNMENT = 8
+
+_MASK32 = 0xFFFFFFFF
+_GOLDEN32 = 0x9E3779B1
+# Bounds the search for the seeds of each bucket; only exceeded if keys have identical CRC-32 values
+_MAX_SEED = 1 << 20
+
+
+class CompiledWordlist(NamedTuple):
+    """
+    The contents of a compiled wordlist, as views over the memory-mapped file.
+
+    Attributes:
+        name (str): The wordlist's name (e.g., '012_8562fb9').
+        checksum (str): The wordlist's full checksum, as computed by `Wordlist.compute_checksum()`.
+        words (List[CompactWords]): The words of each word list.
+        abbrs (List[CompactWords]): The abbreviations of each word, for each word list.
+        word_indexes (List[PerfectHashIndex]): Maps the words of each word list to their positions.
+        abbr_indexes (List[PerfectHashIndex]): Maps the abbreviations of each word list to their positions.
+    """
+
+    name: str
+    checksum: str
+    words: List[CompactWords]
+    abbrs: List[CompactWords]
+    word_indexes: List["PerfectHashIndex"]
+    abbr_indexes: List["PerfectHashIndex"]
+
+
+class PerfectHashIndex(Mapping[str, int]):
+    """
+    Maps strings to their positions, using a minimal perfect hash table (hash and displace).
+
+    Keys are hashed (CRC-32) into buckets; each bucket stores a seed that places its keys into distinct slots,
+    or directly encodes the slot of its single key. Each slot stores the position of a key, which is compared against
+    the looked up string, since unknown strings also map to a slot. If a string occurs multiple times,
+    it maps to its last position, like a dictionary built from the same sequence would.
+    """
+
+    def __init__(
+        self, keys: Sequence[str], seeds: Sequence[int], values: Sequence[int]
+    ):
+        """
+        Constructs a new instance of PerfectHashIndex, from tables built by `PerfectHashIndex.build()`.
+
+        Parameters:
+            keys (Sequence[str]): The indexed strings.
+            seeds (Sequence[int]): The seed of each bucket.
+            values (Sequence[int]): The position of the key stored in each slot.
+        """
+        self._keys = keys
+        self._seeds = seeds
+        self._values = values
+
+    @staticmethod
+    def build(keys: Sequence[str]) -> Tuple[array, array]:
+        """
+        Builds the minimal perfect hash table of the specified strings.
+
+        Parameters:
+            keys (Sequence[str]): The strings to index.
+
+        Returns:
+            Tuple[array, array]: The seeds (int32) and values (uint32) of the table.
+        """
+
+        positions: Dict[str, int] = {}
+        for position, key in enumerate(keys):
+            positions[key] = position
+
+        count = len(positions)
+        buckets: List[List[Tuple[int, int]]] = [[] for _ in range(max(count, 1))]
+        for key, position in positions.items():
+            hash = zlib.crc32(key.encode("utf-8"))
+            buckets[_fmix32(hash) % len(buckets)].append((hash, position))
+
+        seeds = array("i", [0]) * len(buckets)
+        values = array("I", [0]) * count
+        used = [False] * count
+
+        # Place the largest buckets first, while most slots are free
+        order = sorted(range(len(buckets)), key=lambda b: -len(buckets[b]))
+        free = iter(range(count))
+        for bucket in order:
+            entries = buckets[bucket]
+            if len(entries) > 1:
+                for seed in range(1, _MAX_SEED):
+                    slots = {_slot(hash, seed, count) for hash, _ in entries}
+                    if len(slots) == len(entries) and not any(used[s] for s in slots):
+                        break
+                else:
+                    raise ValueError("Could not build a perfect hash table")
+
+                seeds[bucket] = seed
+                for hash, position in entries:
+                    slot = _slot(hash, seed, count)
+                    used[slot] = True
+                    values[slot] = position
+            elif len(entries) == 1:
+                # Single keys are placed in the next free slot, encoded as a negative seed
+                slot = next(s for s in free if not used[s])
+                used[slot] = True
+                seeds[bucket] = -slot - 1
+                values[slot] = entries[0][1]
+
+        return seeds, values
+
+    def __getitem__(self, key: str) -> int:
+        if not len(self._values):
+            raise KeyError(key)
+
+        hash = zlib.crc32(key.encode("utf-8"))
+        seed = self._seeds[_fmix32(hash) % len(self._seeds)]
+        slot = -seed - 1 if seed < 0 else _slot(hash, seed, len(self._values))
+
+        position = self._values[slot]
+        if self._keys[position] != key:
+            raise KeyError(key)
+        return position
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[str]:
+        for position in self._values:
+            yield self._keys[position]
+
+
+def write_compiled(
+    path: str,
+    name: str,
+    checksum: str,
+    words: Sequence[Sequence[str]],
+    abbrs: Sequence[Sequence[str]],
+) -> None:
+    """
+    Writes a compiled wordlist.
+
+    Parameters:
+        path (str): The file to write.
+        name (str): The wordlist's name (e.g., '012_8562fb9').
+        checksum (str): The wordlist's full checksum, as computed by `Wordlist.compute_checksum()`.
+        words (Sequence[Sequence[str]]): The words of each word list.
+        abbrs (Sequence[Sequence[str]]): The abbreviations of each word, for each word list.
+    """
+
+    if len(name.encode("utf-8")) > 64:
+        raise ValueError(f"The wordlist name is too long: {name}")
+
+    sections: List[bytes] = []
+    for list_words, list_abbrs in zip(words, abbrs):
+        for strings in (list_words, list_abbrs):
+            buffer = bytearray()
+            offsets = array("I", [0])
+            for string in strings:
+                buffer += string.encode("utf-8")
+                offsets.append(len(buffer))
+            sections += [bytes(buffer), _to_bytes(offsets)]
+        for strings in (list_words, list_abbrs):
+            seeds, values = PerfectHashIndex.build(strings)
+            sections += [_to_bytes(seeds), _to_bytes(values)]
+
+    # Lay out the sections after the header and the section table
+    position = _align(_HEADER.size + _SECTION.size * len(sections))
+    table = []
+    for section in sections:
+        table.append((position, len(section)))
+        position = _align(position + len(section))
+
+    with open(path, "wb") as file:
+        file.write(
+            _HEADER.pack(
+                MAGIC,
+                VERSION,
+                len(words),
+                checksum.encode("ascii"),
+                name.encode("utf-8"),
+            )
+        )
+        for offset, length in table:
+            file.write(_SECTION.pack(offset, length))
+        for (offset, _), section in zip(table, sections):
+            file.write(b"\0" * (offset - file.tell()))
+            file.write(section)
+
+
+def open_compiled(path: str) -> CompiledWordlist:
+    """
+    Memory-maps a compiled wordlist (read-only), without parsing its contents.
+
+    Parameters:
+        path (str): The compiled wordlist file.
+
+    Returns:
+        CompiledWordlist: Views over the file's contents.
+    """
+
+    if sys.byteorder != "little":
+        raise ValueError("Compiled wordlists can only be opened on little-endian hosts")
+
+    with open(path, "rb") as file:
+        buffer = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    magic, version, count, checksum, name = _HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError(f"Not a compiled wordlist: {path}")
+    if version != VERSION:
+        raise ValueError(
+            f"Unsupported compiled wordlist version {version}, expected {VERSION}: {path}"
+        )
+
+    def section(index: int, format: str = "B") -> memoryview:
+        offset, length = _SECTION.unpack_from(
+            buffer, _HEADER.size + _SECTION.size * index
+        )
+        return buffer[offset : offset + length].cast(format)
+
+    compiled = CompiledWordlist(
+        name=name.rstrip(b"\0").decode("utf-8"),
+        checksum=checksum.decode("ascii"),
+        words=[],
+        abbrs=[],
+        word_indexes=[],
+        abbr_indexes=[],
+    )
+    for i in range(count):
+        base = i * _SECTIONS_PER_LIST
+        words = CompactWords(section(base), section(base + 1, "I"))
+        abbrs = CompactWords(section(base + 2), section(base + 3, "I"))
+        compiled.words.append(words)
+        compiled.abbrs.append(abbrs)
+        compiled.word_indexes.append(
+            PerfectHashIndex(words, section(base + 4, "i"), section(base + 5, "I"))
+        )
+        compiled.abbr_indexes.append(
+            PerfectHashIndex(abbrs, section(base + 6, "i"), section(base + 7, "I"))
+        )
+    return compiled
+
+
+def _fmix32(hash: int) -> int:
+    # MurmurHash3's finalizer: spreads the bits of the hash
+    hash ^= hash >> 16
+    hash = (hash * 0x85EBCA6B) & _MASK32
+    hash ^= hash >> 13
+    hash = (hash * 0xC2B2AE35) & _MASK32
+    return hash ^ (hash >> 16)
+
+
+def _slot(hash: int, seed: int, count: int) -> int:
+    return _fmix32(hash ^ ((seed * _GOLDEN32) & _MASK32)) % count
+
+
+def _align(position: int) -> int:
+    return (position + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _to_bytes(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
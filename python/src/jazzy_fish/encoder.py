@@ -11,16 +11,55 @@ Classes:
     Wordlist - Represents a wordlist used by a WordEncoder to generate key phrases.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import hashlib
 from importlib import resources
-import io
+from itertools import repeat
+import mmap
 from pathlib import Path
-from typing import List, Optional, NamedTuple
-
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    NamedTuple,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from ._compat import require_numpy
+from .compact import CompactWords, HashIndex
+from .compiled import open_compiled, write_compiled
+from .fuzzy import MAX_FUZZY_DISTANCE, FuzzyIndex, FuzzyMatch
+from .permutation import FeistelPermutation
+from .prefix import Completion, PrefixIndex
+from .verification import FileIdentity, VerificationCache
+
+
+# How many words are hashed at a time, when computing checksums
+_CHECKSUM_BATCH = 4096
+
+# Wordlists with at least as many words are hashed in parallel
+_PARALLEL_CHECKSUM_WORDS = 100_000
+
+# Batch methods use NumPy int64 arithmetic, unless the encoder's maximum value does not fit
+_INT64_LIMIT = 1 << 63
 
 # Specifies a default order for constructed sentences.
 DEFAULT_WORD_ORDER: List[str] = ["adverb", "verb", "adjective", "noun"]
 
+# Names of the reverse indexes that a Wordlist can build eagerly (used by decode, and decode_abbr, respectively)
+WORD_INDEX = "words"
+ABBR_INDEX = "abbrs"
+
+# The forms of a keyphrase that encode_into() can write
+_RECORD_FIELDS = ("keyphrase", "abbr", "id")
+
 
 class Wordlist:
     """Represents a wordlist used by a WordEncoder to generate key phrases.
@@ -29,10 +68,19 @@ class Wordlist:
         name (str): The name of the underlying dictionary.
         dictionary_words (List[List[str]]): Words defined in the specified dictionary.
         verify_checksum (bool): If true, will verify that the name and checksum of the provided wordlist matches its contents
+        compact (bool): If true, words are stored in a single buffer per list (CompactWords),
+                        and indexed by array-backed hash tables (HashIndex) instead of dictionaries
+        indexes (Iterable[str]): The reverse indexes (WORD_INDEX, ABBR_INDEX) to build eagerly;
+                                 the others are built on first use, so that encode-only services never build them
     """
 
     def __init__(
-        self, name: str, dictionary_words: List[List[str]], verify_checksum: bool = True
+        self,
+        name: str,
+        dictionary_words: List[List[str]],
+        verify_checksum: bool = True,
+        compact: bool = False,
+        indexes: Iterable[str] = (),
     ):
         """
         Constructs a new instance of Wordlist.
@@ -41,57 +89,266 @@ class Wordlist:
             name (str): The name of the underlying dictionary.
             dictionary_words (List[List[str]]): Words defined in the specified dictionary.
             verify_checksum (bool): If true, will verify that the name and checksum of the provided wordlist matches its contents.
+            compact (bool): If true, stores the words and their indexes in compact, array-backed structures,
+                            which use less memory, at the cost of slower lookups.
+            indexes (Iterable[str]): The reverse indexes to build eagerly: WORD_INDEX (used to decode keyphrases),
+                                     and/or ABBR_INDEX (used to decode abbreviations).
+                                     The others are built on first use.
         """
 
-        # Determine the dictionary's name and checksum
-        name_parts = name.split("_")
-        if len(name_parts) != 2:
-            raise ValueError(
-                f"Dictionary name is invalid ({name}), should match '[prefix]_[checksum]'"
-            )
-        if not len(name_parts[0]) or not all(["0" <= c < "9" for c in name_parts[0]]):
+        self._set_name(name)
+
+        eager = set(indexes)
+        if not eager <= {WORD_INDEX, ABBR_INDEX}:
             raise ValueError(
-                f"Dictionary name must contain the identifying positions for word abbreviations, got: '{name_parts[0]}'"
+                f"Unknown indexes {sorted(eager - {WORD_INDEX, ABBR_INDEX})}, expected '{WORD_INDEX}' or '{ABBR_INDEX}'"
             )
 
-        self._abbr_positions = name_parts[0]
-        self._abbr_char_positions = [int(c) for c in name_parts[0]]
-        self._checksum = name_parts[1]
-
         # Load and cache wordlists
-        self._words = [[word.strip() for word in lst] for lst in dictionary_words]
-        # Map words to dictionary position
-        self._word_positions = [
-            {word.strip(): i for i, word in enumerate(lst)} for lst in dictionary_words
-        ]
-        # Map of word abbreviations to dictionary positions
-        self._abbr_to_pos = [
-            {self.to_prefix(word.strip()): idx for idx, word in enumerate(lst)}
-            for lst in dictionary_words
-        ]
+        words = [[word.strip() for word in lst] for lst in dictionary_words]
+        self._compact = compact
+        self._words: List[Sequence[str]]
+        if compact:
+            self._words = [CompactWords.from_words(lst) for lst in words]
+        else:
+            self._words = list(words)
+
+        # Stores the attributes needed by WordEncoder to fulfill encode/decode requests
+        self._set_radices()
+
+        # Reverse indexes are built on first use, unless requested eagerly
+        self._word_index: Optional[List[Mapping[str, int]]] = None
+        self._abbr_index: Optional[List[Mapping[str, int]]] = None
+        if WORD_INDEX in eager:
+            self._word_index = self._build_word_index()
+        if ABBR_INDEX in eager:
+            self._abbr_index = self._build_abbr_index()
 
         # Check that the provided words match the provided dictionary name
         if verify_checksum:
-            checksum = Wordlist.compute_checksum(self._words, self._abbr_positions)
+            checksum = Wordlist.compute_checksum(words, self._abbr_positions)
             hash = checksum[:7]
             if self._checksum != hash:
                 raise ValueError(
                     f"Checksum validation has failed, expected '{self._checksum}', got '{hash}'"
                 )
 
-        # Stores the attributes needed by WordEncoder to fulfill encode/decode requests
-        self._radices = [len(lst) for lst in self._words]
-        self._max_words_in_phrase = len(self._words)
+    @property
+    def _word_positions(self) -> List[Mapping[str, int]]:
+        # Maps words to dictionary positions; built on first use
+        # (concurrent first calls may build it more than once, with the same result)
+        if self._word_index is None:
+            self._word_index = self._build_word_index()
+        return self._word_index
+
+    @property
+    def _abbr_to_pos(self) -> List[Mapping[str, int]]:
+        # Maps word abbreviations to dictionary positions; built on first use
+        if self._abbr_index is None:
+            self._abbr_index = self._build_abbr_index()
+        return self._abbr_index
 
     def to_prefix(self, word: str) -> str:
         """Abbreviates a word, based on the configured positions"""
         return "".join([word[i] for i in self._abbr_char_positions])
 
+    def compile(self, path: str) -> None:
+        """
+        Writes the wordlist as a compiled wordlist, which can be memory-mapped with `Wordlist.open_compiled()`.
+
+        Parameters:
+            path (str): The file to write.
+        """
+
+        words = [list(lst) for lst in self._words]
+        write_compiled(
+            path,
+            self._name,
+            Wordlist.compute_checksum(words, self._abbr_positions),
+            words,
+            [[self.to_prefix(word) for word in lst] for lst in words],
+        )
+
+    @staticmethod
+    def open_compiled(
+        from_path: str,
+        package_name: Optional[str] = None,
+        verify_checksum: bool = False,
+    ) -> "Wordlist":
+        """
+        Memory-maps a compiled wordlist, without parsing its contents; forked processes share the mapped pages.
+        Words are decoded with minimal perfect hash tables, stored in the file.
+
+        Parameters:
+            from_path (str): Specifies a compiled wordlist file (e.g., 'resources/012_8562fb9.jfwl').
+            package_name (Optional[str]): If specified, the path will be loaded from a package.
+            verify_checksum (bool): If true, will recompute the checksum of the words;
+                                    otherwise, only checks the checksum stored in the file against its name.
+
+        Returns:
+            Wordlist: An initialized Wordlist class
+        """
+
+        compiled = open_compiled(_resolve_path(from_path, package_name))
+
+        wordlist = Wordlist.__new__(Wordlist)
+        wordlist._set_name(compiled.name)
+
+        checksum = compiled.checksum
+        if verify_checksum:
+            checksum = Wordlist.compute_checksum(
+                [list(lst) for lst in compiled.words], wordlist._abbr_positions
+            )
+        if wordlist._checksum != checksum[:7]:
+            raise ValueError(
+                f"Checksum validation has failed, expected '{wordlist._checksum}', got '{checksum[:7]}'"
+            )
+
+        wordlist._compact = True
+        wordlist._words = list(compiled.words)
+        wordlist._word_index = list(compiled.word_indexes)
+        wordlist._abbr_index = list(compiled.abbr_indexes)
+        wordlist._set_radices()
+
+        # Compiled wordlists store each word's abbreviation
+        wordlist._abbrs = list(compiled.abbrs)
+        return wordlist
+
+    def _build_word_index(self) -> List[Mapping[str, int]]:
+        if self._compact:
+            return [HashIndex(lst) for lst in self._words]
+        return [{word: i for i, word in enumerate(lst)} for lst in self._words]
+
+    def _build_abbr_index(self) -> List[Mapping[str, int]]:
+        if self._compact:
+            return [HashIndex(lst) for lst in self._get_abbreviations()]
+        return [
+            {abbr: i for i, abbr in enumerate(lst)} for lst in self._get_abbreviations()
+        ]
+
+    def _set_radices(self) -> None:
+        # Precomputes the values shared by all WordEncoders that use this wordlist, regardless of their configuration
+        self._radices = [len(lst) for lst in self._words]
+        self._max_words_in_phrase = len(self._words)
+
+        # The maximum encodable values, with each number of words (the first element represents the last word)
+        self._max_values = [1] * (self._max_words_in_phrase + 1)
+        for i in range(1, self._max_words_in_phrase + 1):
+            # With each added word we can represent (W) x (W-1) integers
+            self._max_values[i] = (
+                self._max_values[i - 1] * self._radices[self._max_words_in_phrase - i]
+            )
+
+        # Abbreviations of each word list, computed on first use
+        self._abbrs: Optional[List[Sequence[str]]] = None
+
+        # Word and abbreviation arrays used by the batch methods, computed on first use
+        self._word_arrays: Optional[List[Any]] = None
+        self._abbr_arrays: Optional[List[Any]] = None
+
+        # Fuzzy indexes of each word list, by reverse index (WORD_INDEX, or ABBR_INDEX), computed on first use
+        self._fuzzy_indexes: Dict[str, List[FuzzyIndex]] = {}
+
+        # Prefix indexes of each word list, by reverse index (WORD_INDEX, or ABBR_INDEX), computed on first use
+        self._prefix_indexes: Dict[str, List[PrefixIndex]] = {}
+
+        # Reverse indexes keyed by UTF-8 encoded words, by reverse index (WORD_INDEX, or ABBR_INDEX), computed on first use
+        self._bytes_indexes: Dict[str, List[Dict[bytes, int]]] = {}
+
+        # UTF-8 encoded words, and abbreviations, used by WordEncoder.encode_into(), computed on first use
+        self._word_bytes: Optional[Tuple[List[List[bytes]], List[List[bytes]]]] = None
+
+    def _get_fuzzy_indexes(self, index: str, max_distance: int) -> List[FuzzyIndex]:
+        # Built for the largest distance requested so far, which also serves smaller distances
+        fuzzy_indexes = self._fuzzy_indexes.get(index)
+        if fuzzy_indexes is None or fuzzy_indexes[0].max_distance < max_distance:
+            positions = (
+                self._word_positions if index == WORD_INDEX else self._abbr_to_pos
+            )
+            fuzzy_indexes = [FuzzyIndex(lst, max_distance) for lst in positions]
+            self._fuzzy_indexes[index] = fuzzy_indexes
+        return fuzzy_indexes
+
+    def _get_prefix_indexes(self, index: str) -> List[PrefixIndex]:
+        prefix_indexes = self._prefix_indexes.get(index)
+        if prefix_indexes is None:
+            lists = self._words if index == WORD_INDEX else self._get_abbreviations()
+            prefix_indexes = [PrefixIndex(lst) for lst in lists]
+            self._prefix_indexes[index] = prefix_indexes
+        return prefix_indexes
+
+    def _get_bytes_indexes(self, index: str) -> List[Dict[bytes, int]]:
+        # Built from the words, so that services that only decode bytes never build the string indexes
+        bytes_indexes = self._bytes_indexes.get(index)
+        if bytes_indexes is None:
+            lists = self._words if index == WORD_INDEX else self._get_abbreviations()
+            bytes_indexes = [
+                {word.encode("utf-8"): i for i, word in enumerate(lst)} for lst in lists
+            ]
+            self._bytes_indexes[index] = bytes_indexes
+        return bytes_indexes
+
+    def _get_abbreviations(self) -> List[Sequence[str]]:
+        # Each word's abbreviation, at the same positions as the words
+        if self._abbrs is None:
+            abbrs = [[self.to_prefix(word) for word in lst] for lst in self._words]
+            self._abbrs = (
+                [CompactWords.from_words(lst) for lst in abbrs]
+                if self._compact
+                else list(abbrs)
+            )
+        return self._abbrs
+
+    def _get_word_bytes(self) -> Tuple[List[List[bytes]], List[List[bytes]]]:
+        if self._word_bytes is None:
+            self._word_bytes = (
+                [[word.encode("utf-8") for word in lst] for lst in self._words],
+                [
+                    [abbr.encode("utf-8") for abbr in lst]
+                    for lst in self._get_abbreviations()
+                ],
+            )
+        return self._word_bytes
+
+    def _get_word_arrays(self) -> Any:
+        # Concurrent first calls may build the arrays more than once, with the same result
+        if self._word_arrays is None or self._abbr_arrays is None:
+            numpy = require_numpy()
+            self._word_arrays = [
+                numpy.array(list(words), dtype=object) for words in self._words
+            ]
+            self._abbr_arrays = [
+                numpy.array(list(abbrs), dtype=object)
+                for abbrs in self._get_abbreviations()
+            ]
+        return self._word_arrays, self._abbr_arrays
+
+    def _set_name(self, name: str) -> None:
+        # Determine the dictionary's name and checksum
+        name_parts = name.split("_")
+        if len(name_parts) != 2:
+            raise ValueError(
+                f"Dictionary name is invalid ({name}), should match '[prefix]_[checksum]'"
+            )
+        if not len(name_parts[0]) or not all(["0" <= c < "9" for c in name_parts[0]]):
+            raise ValueError(
+                f"Dictionary name must contain the identifying positions for word abbreviations, got: '{name_parts[0]}'"
+            )
+
+        self._name = name
+        self._abbr_positions = name_parts[0]
+        self._abbr_char_positions = [int(c) for c in name_parts[0]]
+        self._checksum = name_parts[1]
+
     @staticmethod
     def load(
         from_path: str,
         package_name: Optional[str] = None,
         word_order: List[str] = DEFAULT_WORD_ORDER,
+        compact: bool = False,
+        indexes: Iterable[str] = (),
+        verify_checksum: bool = True,
+        verification_cache: Optional[VerificationCache] = None,
     ):
         """
         Given a path, load all words in the wordlist in the specified order.
@@ -101,38 +358,67 @@ class Wordlist:
             package_name (Optional[str]): If specified, the path will be loaded from a package.
             word_lists (List[str]): Specifies the order in which the words will be loaded.
                                     Defaults to DEFAULT_WORD_ORDER.
+            compact (bool): If true, stores the words and their indexes in compact, array-backed structures.
+            indexes (Iterable[str]): The reverse indexes to build eagerly (WORD_INDEX, and/or ABBR_INDEX).
+            verify_checksum (bool): If true, will verify that the name and checksum of the wordlist matches its contents.
+            verification_cache (Optional[VerificationCache]): If set, skips verifying files that were already verified
+                                                              (and not modified since), and records new verifications.
 
         Returns:
             Wordlist: An initialized Wordlist class
         """
 
         dictionary_name = Path(from_path).name
-        words = [
-            _read_words(f"{from_path}/{word}.txt", package_name) for word in word_order
+        paths = [
+            _resolve_path(f"{from_path}/{word}.txt", package_name)
+            for word in word_order
         ]
 
-        return Wordlist(name=dictionary_name, dictionary_words=words)
+        # Identify the files before reading them, so that concurrent modifications are verified again on the next load
+        files: List[FileIdentity] = []
+        if verify_checksum and verification_cache is not None:
+            files = [FileIdentity.of(path) for path in paths]
+            if verification_cache.is_verified(dictionary_name, files):
+                verify_checksum = False
+                files = []
+
+        wordlist = Wordlist(
+            name=dictionary_name,
+            dictionary_words=[_read_words(path) for path in paths],
+            verify_checksum=verify_checksum,
+            compact=compact,
+            indexes=indexes,
+        )
+        if files and verification_cache is not None:
+            verification_cache.record(dictionary_name, files)
+        return wordlist
 
     @staticmethod
-    def compute_checksum(wordlists: List[List[str]], position_in_word: str) -> str:
+    def compute_checksum(
+        wordlists: Sequence[Sequence[str]], position_in_word: str
+    ) -> str:
         """Computes a checksum for the specified wordlists and abbreviation position."""
 
-        checksums = [Wordlist.checksum(words) for words in wordlists]
+        # Large wordlists are hashed in parallel (hashlib releases the GIL while hashing large buffers)
+        if sum(len(words) for words in wordlists) >= _PARALLEL_CHECKSUM_WORDS:
+            with ThreadPoolExecutor(max_workers=len(wordlists)) as executor:
+                checksums = list(executor.map(Wordlist.checksum, wordlists))
+        else:
+            checksums = [Wordlist.checksum(words) for words in wordlists]
         checksums.sort()
         return aggregate_checksums([position_in_word] + checksums)
 
     @staticmethod
-    def checksum(words: List[str]) -> str:
-        """Calculates the SHA-1 checksum of a list of words."""
+    def checksum(words: Sequence[str]) -> str:
+        """Calculates the SHA-1 checksum of a list of words (separated by newlines)."""
 
+        # Hash the words in batches, without concatenating the whole list
         sha1 = hashlib.sha1()
-        bytes = "\n".join(words).encode("utf-8")
-        buffer = io.BytesIO(bytes)
-        try:
-            while chunk := buffer.read(8192):
-                sha1.update(chunk)
-        finally:
-            buffer.close()
+        for start in range(0, len(words), _CHECKSUM_BATCH):
+            if start:
+                sha1.update(b"\n")
+            batch = words[start : start + _CHECKSUM_BATCH]
+            sha1.update("\n".join(batch).encode("utf-8"))
 
         return sha1.hexdigest()
 
@@ -163,6 +449,9 @@ class WordEncoder:
                                If not provided, it will default to the wordlist size.
         separator (str): The separator character used to delimit keyphrase and abbreviation parts
                          (e.g., "niftier-engine", or "nif-eng")
+        permutation_key (Optional[Union[bytes, str]]): If provided, integers are shuffled with a keyed permutation
+                                                      (see FeistelPermutation) before being encoded, and after being
+                                                      decoded, so that sequential integers get unrelated keyphrases.
     """
 
     def __init__(
@@ -170,6 +459,7 @@ class WordEncoder:
         wordlist: Wordlist,
         min_phrase_size: Optional[int] = None,
         separator: str = "-",
+        permutation_key: Optional[Union[bytes, str]] = None,
     ):
         """
         Constructs a new instance of WordEncoder.
@@ -180,6 +470,8 @@ class WordEncoder:
                                     If not provided, it will default to the number
                                     word lists provided.
             separator (str): The separator character used to delimit sequence parts
+            permutation_key (Optional[Union[bytes, str]]): The secret that selects how integers are shuffled;
+                                                          keyphrases can only be decoded with the same key.
         """
         self._wordlist = wordlist
         self._max_phrase_size = self._wordlist._max_words_in_phrase
@@ -202,11 +494,19 @@ class WordEncoder:
             )
         self.separator = separator
 
-        # cache other needed values
+        # cache other needed values (precomputed by the wordlist, and shared by all of its encoders)
         self._radices = self._wordlist._radices
-        self._max_values = self._compute_max_values()
+        self._max_values = self._wordlist._max_values
         self._abs_max = self._max_values[-1]
 
+        # Permutes all integers that can be encoded, which spreads sequential integers over all keyphrases
+        self._permutation: Optional[FeistelPermutation] = None
+        if permutation_key is not None:
+            self._permutation = FeistelPermutation(permutation_key, self._abs_max)
+
+        # Whether keyphrases sort in the same order as their integers, computed on first use
+        self._ordered: Optional[bool] = None
+
     def encode(self, number: int) -> KeyPhrase:
         """
         Encodes an integer to a [word sequence].
@@ -218,41 +518,67 @@ class WordEncoder:
             KeyPhrase: The resulting keyphrase.
         """
 
-        # Validate the input
+        first, indexes = self._select_indexes(number)
+
+        # Calculate the resulting word sequence, and its short identifier (from the precomputed abbreviations)
+        selected = list(zip(self._wordlist._words[first:], indexes))
+        keyphrase = self.separator.join([lst[i] for lst, i in selected])
+        abbrs = self._wordlist._get_abbreviations()[first:]
+        abbr = self.separator.join([lst[i] for lst, i in zip(abbrs, indexes)])
+
+        return KeyPhrase(abbr=abbr, keyphrase=keyphrase, id=number)
+
+    def encode_keyphrase(self, number: int) -> str:
+        """
+        Encodes an integer to a keyphrase, without computing its abbreviation.
+
+        Parameters:
+            number (int): The integer to encode.
+
+        Returns:
+            str: The resulting keyphrase (the same as `encode(number).keyphrase`).
+        """
+
+        first, indexes = self._select_indexes(number)
+        words = self._wordlist._words[first:]
+        return self.separator.join([lst[i] for lst, i in zip(words, indexes)])
+
+    def encode_abbr(self, number: int) -> str:
+        """
+        Encodes an integer to an abbreviated keyphrase, without computing the keyphrase.
+
+        Parameters:
+            number (int): The integer to encode.
+
+        Returns:
+            str: The resulting abbreviation (the same as `encode(number).abbr`).
+        """
+
+        first, indexes = self._select_indexes(number)
+        abbrs = self._wordlist._get_abbreviations()[first:]
+        return self.separator.join([lst[i] for lst, i in zip(abbrs, indexes)])
+
+    def _select_indexes(self, number: int) -> Tuple[int, List[int]]:
+        # Returns the position of the first word list used to encode the integer, and the index of each word
         if number >= self._abs_max:
             raise EncoderException(
                 f"The number ({number}) is too large to be encoded with up to {self._max_phrase_size} words (max: {self._max_values[-1] - 1})"
             )
 
+        if self._permutation is not None:
+            number = self._permutation.permute(number)
+
         # Determine the number of words needed
         words_needed = self._determine_sequence_size(number)
-        original_val = number
-
-        # Initialize indexes with -1, to protect against bugs (zeroes would be valid values and could not be distinguished)
-        indexes = [-1] * self._max_phrase_size
-        boundary = self._max_phrase_size - 1
-
-        # Calculate the corresponding indexes for each word
-        for i in range(boundary, boundary - words_needed, -1):
-            # Populate the appropriate index, right-to-left
-            list_size = self._radices[i]
-            indexes[i] = number % list_size
-
-            # Calculate the remaining value to be encoded by the next radix
-            number //= list_size
-
-        # Calculate the resulting word sequence
-        input = list(
-            zip(self._wordlist._words[-words_needed:], indexes[-words_needed:])
-        )
-        selected_words = [lst[i] for lst, i in input]
+        first = self._max_phrase_size - words_needed
 
-        # Calculate the short identifier
-        short_sequence = [self._wordlist.to_prefix(word) for word in selected_words]
-        abbr = self.separator.join(short_sequence)
-        keyphrase = self.separator.join(selected_words)
+        # Calculate the corresponding indexes for each word, right-to-left
+        indexes = [0] * words_needed
+        for i in range(words_needed - 1, -1, -1):
+            # The remaining value is encoded by the previous radices
+            number, indexes[i] = divmod(number, self._radices[first + i])
 
-        return KeyPhrase(abbr=abbr, keyphrase=keyphrase, id=original_val)
+        return first, indexes
 
     def decode(self, keyphrase: str) -> int:
         """
@@ -283,7 +609,7 @@ class WordEncoder:
             list_size = relevant_radices[i]
             result = result * list_size + index
 
-        return result
+        return self._to_id(result)
 
     def decode_abbr(self, abbr: str) -> int:
         """
@@ -314,7 +640,395 @@ class WordEncoder:
             list_size = relevant_radices[i]
             result = result * list_size + index
 
-        return result
+        return self._to_id(result)
+
+    def encode_into(
+        self,
+        number: int,
+        buffer: Union[bytearray, memoryview, mmap.mmap],
+        offset: int = 0,
+        fields: Sequence[str] = ("keyphrase",),
+        delimiter: str = ",",
+    ) -> int:
+        """
+        Encodes an integer, and writes the requested forms of its keyphrase as UTF-8 into a preallocated buffer,
+        using words that are encoded once per wordlist, instead of creating a KeyPhrase and its strings.
+
+        Parameters:
+            number (int): The integer to encode.
+            buffer (Union[bytearray, memoryview, mmap.mmap]): A writable buffer; it is never resized.
+            offset (int): Where to start writing.
+            fields (Sequence[str]): The forms to write, in order: "keyphrase", "abbr", and/or "id" (the integer).
+            delimiter (str): Written between fields.
+
+        Returns:
+            int: The offset after the last written byte.
+
+        Raises:
+            EncoderException: If no fields, or an unknown field, are requested, or if the record does not fit.
+        """
+
+        _check_fields(fields)
+        first, indexes = self._select_indexes(number)
+
+        # Join the pre-encoded words of each field, and check that everything fits before writing anything
+        word_bytes, abbr_bytes = self._wordlist._get_word_bytes()
+        separator = self.separator.encode("utf-8")
+        parts = []
+        for field in fields:
+            if field == "keyphrase":
+                lists = word_bytes
+            elif field == "abbr":
+                lists = abbr_bytes
+            else:
+                parts.append(b"%d" % number)
+                continue
+            parts.append(
+                separator.join(
+                    [lists[first + i][index] for i, index in enumerate(indexes)]
+                )
+            )
+        record = delimiter.encode("utf-8").join(parts) if len(parts) > 1 else parts[0]
+
+        end = offset + len(record)
+        if end > len(buffer):
+            raise EncoderException(
+                f"The buffer is too small: {len(record)} bytes are needed at offset {offset}, got {len(buffer)} bytes"
+            )
+        buffer[offset:end] = record
+        return end
+
+    def max_record_size(
+        self, fields: Sequence[str] = ("keyphrase",), delimiter: str = ","
+    ) -> int:
+        """
+        Determines the largest number of bytes that `encode_into()` can write for a single integer.
+
+        Parameters:
+            fields (Sequence[str]): The forms to write, in order: "keyphrase", "abbr", and/or "id" (the integer).
+            delimiter (str): Written between fields.
+
+        Returns:
+            int: The size of the longest record, in bytes.
+
+        Raises:
+            EncoderException: If no fields, or an unknown field, are requested.
+        """
+
+        _check_fields(fields)
+        word_bytes, abbr_bytes = self._wordlist._get_word_bytes()
+        separator_size = len(self.separator.encode("utf-8"))
+        size = len(delimiter.encode("utf-8")) * (len(fields) - 1)
+        for field in fields:
+            if field == "keyphrase":
+                lists = word_bytes
+            elif field == "abbr":
+                lists = abbr_bytes
+            else:
+                size += len(str(self._abs_max - 1))
+                continue
+            # The longest keyphrases use every word list
+            size += separator_size * (self._max_phrase_size - 1)
+            size += sum(max(len(word) for word in lst) for lst in lists)
+        return size
+
+    def encode_many(self, numbers: Iterable[int]) -> List[KeyPhrase]:
+        """
+        Encodes multiple integers, returning the same keyphrases as calling `encode()` for each of them.
+        The words are selected with vectorized NumPy operations (one pass per word position),
+        which requires the optional `numpy` dependency.
+
+        Parameters:
+            numbers (Iterable[int]): The integers to encode; an int64/uint64 array, a list, or any other iterable.
+
+        Returns:
+            List[KeyPhrase]: The resulting keyphrases, in the same order.
+        """
+
+        numpy = require_numpy()
+        if self._abs_max > _INT64_LIMIT:
+            return [self.encode(int(number)) for number in numbers]
+
+        # Iterators (e.g., generators) would otherwise become a single object
+        if not isinstance(numbers, (numpy.ndarray, Sequence)):
+            numbers = list(numbers)
+        values = numpy.asarray(numbers).reshape(-1)
+        if not values.size:
+            return []
+
+        # Raise the same error as encode(), for the first value that is too large
+        too_large = numpy.flatnonzero(values >= self._abs_max)
+        if too_large.size:
+            self.encode(int(values[too_large[0]]))
+        values = values.astype(numpy.int64)
+
+        # The keyphrases encode the permuted integers, but still report the original ones
+        encoded = values
+        if self._permutation is not None:
+            encoded = numpy.array(
+                self._permutation.permute_many(values), dtype=numpy.int64
+            )
+
+        # The number of words needed is determined by the first maximum value that exceeds each number
+        words_needed = numpy.maximum(
+            numpy.searchsorted(
+                numpy.array(self._max_values, dtype=numpy.int64), encoded, side="right"
+            ),
+            self._min_phrase_size,
+        )
+
+        # Split all numbers into word indexes, right-to-left
+        indexes = numpy.empty((self._max_phrase_size, values.size), dtype=numpy.int64)
+        remaining = encoded.copy()
+        for i in range(self._max_phrase_size - 1, -1, -1):
+            indexes[i] = remaining % self._radices[i]
+            remaining //= self._radices[i]
+
+        word_arrays, abbr_arrays = self._wordlist._get_word_arrays()
+        keyphrases = numpy.empty(values.size, dtype=object)
+        abbrs = numpy.empty(values.size, dtype=object)
+        for size in numpy.unique(words_needed).tolist():
+            rows = numpy.flatnonzero(words_needed == size)
+            positions = range(self._max_phrase_size - size, self._max_phrase_size)
+
+            keyphrase = abbr = None
+            for i in positions:
+                words = word_arrays[i][indexes[i, rows]]
+                prefixes = abbr_arrays[i][indexes[i, rows]]
+                if keyphrase is None:
+                    keyphrase, abbr = words, prefixes
+                else:
+                    keyphrase = keyphrase + self.separator + words
+                    abbr = abbr + self.separator + prefixes
+            keyphrases[rows] = keyphrase
+            abbrs[rows] = abbr
+
+        return list(
+            map(KeyPhrase, values.tolist(), abbrs.tolist(), keyphrases.tolist())
+        )
+
+    def decode_many(self, keyphrases: Iterable[str]) -> List[int]:
+        """
+        Decodes multiple keyphrases, returning the same integers as calling `decode()` for each of them.
+        Requires the optional `numpy` dependency.
+
+        Parameters:
+            keyphrases (Iterable[str]): The keyphrases to decode.
+
+        Returns:
+            List[int]: The corresponding integers, in the same order.
+        """
+
+        return self._decode_many(
+            list(keyphrases), self._wordlist._word_positions, self.decode
+        )
+
+    def decode_abbr_many(self, abbrs: Iterable[str]) -> List[int]:
+        """
+        Decodes multiple abbreviations, returning the same integers as calling `decode_abbr()` for each of them.
+        Requires the optional `numpy` dependency.
+
+        Parameters:
+            abbrs (Iterable[str]): The keyphrase abbreviations to decode.
+
+        Returns:
+            List[int]: The corresponding integers, in the same order.
+        """
+
+        return self._decode_many(
+            list(abbrs), self._wordlist._abbr_to_pos, self.decode_abbr
+        )
+
+    def decode_fuzzy(
+        self, keyphrase: str, max_distance: int = 1, limit: int = 10
+    ) -> List[FuzzyMatch]:
+        """
+        Decodes a keyphrase that may contain typos, returning the closest valid keyphrases.
+        Unlike `decode()`, which raises a KeyError for any unknown word, each word is matched against
+        the words of its position that are within `max_distance` edits (see FuzzyIndex).
+
+        Parameters:
+            keyphrase (str): The keyphrase to decode.
+            max_distance (int): The maximum number of edits, across all words of the keyphrase.
+            limit (int): The maximum number of returned matches.
+
+        Returns:
+            List[FuzzyMatch]: The matches, ranked by distance, then by integer; empty if none are close enough.
+        """
+
+        return self._decode_fuzzy(keyphrase, WORD_INDEX, max_distance, limit)
+
+    def decode_abbr_fuzzy(
+        self, abbr: str, max_distance: int = 1, limit: int = 10
+    ) -> List[FuzzyMatch]:
+        """
+        Decodes an abbreviation that may contain typos, returning the closest valid abbreviations.
+
+        Parameters:
+            abbr (str): The keyphrase abbreviation to decode.
+            max_distance (int): The maximum number of edits, across all words of the abbreviation.
+            limit (int): The maximum number of returned matches.
+
+        Returns:
+            List[FuzzyMatch]: The matches, ranked by distance, then by integer; empty if none are close enough.
+        """
+
+        return self._decode_fuzzy(abbr, ABBR_INDEX, max_distance, limit)
+
+    def complete(
+        self,
+        partial: str,
+        phrase_size: Optional[int] = None,
+        offset: int = 0,
+        limit: int = 10,
+    ) -> List[Completion]:
+        """
+        Completes the last word of a partial keyphrase (e.g., "niftier-eng"), for type-ahead search.
+        Since word lists are sorted, and integers are encoded positionally, each completion covers
+        a contiguous range of integers: the ones whose keyphrases start with the completed phrase.
+
+        Parameters:
+            partial (str): The typed words, followed by the (possibly empty) start of the next word.
+            phrase_size (Optional[int]): The number of words of the completed keyphrases;
+                                         if not provided, completes keyphrases of all sizes that can be encoded.
+            offset (int): The number of completions to skip (for pagination).
+            limit (int): The maximum number of returned completions.
+
+        Returns:
+            List[Completion]: The completions, ordered by phrase size, then alphabetically.
+        """
+
+        return self._complete(partial, WORD_INDEX, phrase_size, offset, limit)
+
+    def complete_abbr(
+        self,
+        partial: str,
+        phrase_size: Optional[int] = None,
+        offset: int = 0,
+        limit: int = 10,
+    ) -> List[Completion]:
+        """
+        Completes the last word of a partial keyphrase abbreviation (e.g., "nif-en"). See `complete()`.
+
+        Parameters:
+            partial (str): The typed abbreviated words, followed by the (possibly empty) start of the next one.
+            phrase_size (Optional[int]): The number of words of the completed abbreviations;
+                                         if not provided, completes abbreviations of all sizes that can be encoded.
+            offset (int): The number of completions to skip (for pagination).
+            limit (int): The maximum number of returned completions.
+
+        Returns:
+            List[Completion]: The completions, ordered by phrase size, then alphabetically.
+        """
+
+        return self._complete(partial, ABBR_INDEX, phrase_size, offset, limit)
+
+    def prefix_ranges(
+        self, partial: str, phrase_size: Optional[int] = None
+    ) -> List[Tuple[int, int]]:
+        """
+        Returns the ranges of integers whose keyphrases start with a partial keyphrase,
+        so that they can be looked up with range scans, instead of matching encoded strings.
+
+        Parameters:
+            partial (str): The typed words, followed by the (possibly empty) start of the next word.
+            phrase_size (Optional[int]): Only considers keyphrases with this number of words;
+                                         if not provided, considers all sizes that can be encoded.
+
+        Returns:
+            List[Tuple[int, int]]: Disjoint [start, end) ranges, in ascending order
+                                   (a single range per phrase size, with the sorted packaged wordlists).
+        """
+
+        return self._prefix_ranges(partial, WORD_INDEX, phrase_size)
+
+    def abbr_prefix_ranges(
+        self, partial: str, phrase_size: Optional[int] = None
+    ) -> List[Tuple[int, int]]:
+        """
+        Returns the ranges of integers whose keyphrase abbreviations start with a partial abbreviation.
+        See `prefix_ranges()`.
+
+        Parameters:
+            partial (str): The typed abbreviated words, followed by the (possibly empty) start of the next one.
+            phrase_size (Optional[int]): Only considers abbreviations with this number of words;
+                                         if not provided, considers all sizes that can be encoded.
+
+        Returns:
+            List[Tuple[int, int]]: Disjoint [start, end) ranges, in ascending order.
+        """
+
+        return self._prefix_ranges(partial, ABBR_INDEX, phrase_size)
+
+    def decode_bytes(
+        self,
+        data: Union[bytes, bytearray, memoryview, mmap.mmap],
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> int:
+        """
+        Decodes a UTF-8 encoded keyphrase, or keyphrase abbreviation, held in a bytes-like object
+        (e.g., a slice of a socket buffer), without decoding it to a string.
+
+        Keyphrases and abbreviations are detected automatically: the input is decoded as a keyphrase,
+        unless one of its words is not in the word lists, in which case it is decoded as an abbreviation.
+
+        Parameters:
+            data (Union[bytes, bytearray, memoryview, mmap.mmap]): The buffer that holds the keyphrase, or abbreviation.
+            start (int): The offset of the keyphrase's first byte.
+            end (Optional[int]): The offset after the keyphrase's last byte; defaults to the end of the buffer.
+
+        Returns:
+            int: The corresponding integer.
+        """
+
+        view = memoryview(data)
+        if view.format != "B" or view.ndim != 1:
+            view = view.cast("B")
+
+        # Only the keyphrase's bytes are copied (not the buffer), since splitting them is faster than
+        # locating each separator in the buffer, and the words are looked up by a bytes-keyed index
+        words = view[start:end].tobytes().split(self.separator.encode("utf-8"))
+        if len(words) > self._max_phrase_size:
+            raise EncoderException(
+                f"The sequence contains more words that can be decoded with up to {self._max_phrase_size} words"
+            )
+
+        result, failed = self._decode_words(words, WORD_INDEX)
+        if failed == -1:
+            return self._to_id(result)
+
+        abbr_result, abbr_failed = self._decode_words(words, ABBR_INDEX)
+        if abbr_failed == -1:
+            return self._to_id(abbr_result)
+
+        # Report the unknown word of the interpretation that got further
+        raise KeyError(words[max(failed, abbr_failed)])
+
+    @property
+    def permuted(self) -> bool:
+        """Whether integers are permuted before being encoded, in which case keyphrases do not sort like integers."""
+        return self._permutation is not None
+
+    @property
+    def ordered(self) -> bool:
+        """
+        Whether keyphrases with the same number of words sort (by code point) in the same order as their integers:
+        integers must not be permuted, each word list must be sorted, and the separator must sort before all
+        characters used in words. Keyphrases with different numbers of words never sort like their integers.
+        """
+        if self._ordered is None:
+            words = self._wordlist._words
+            self._ordered = (
+                self._permutation is None
+                and all(
+                    lst[i] < lst[i + 1] for lst in words for i in range(len(lst) - 1)
+                )
+                and all(
+                    self.separator < min(word) for lst in words for word in lst if word
+                )
+            )
+        return self._ordered
 
     def get_max(self) -> int:
         """
@@ -325,14 +1039,239 @@ class WordEncoder:
         """
         return self._abs_max
 
-    def _compute_max_values(self) -> List[int]:
-        # Compute the maximum encodable values
-        # The resulting indices are reversed compared to the list of words (first element represents last word)
-        max_values = [1] * (self._max_phrase_size + 1)
-        for i in range(1, (self._max_phrase_size + 1)):
-            # With each added word we can represent (W) x (W-1) integers
-            max_values[i] = max_values[i - 1] * self._radices[self._max_phrase_size - i]
-        return max_values
+    def _decode_many(
+        self,
+        phrases: List[str],
+        lookups: List[Mapping[str, int]],
+        decode: Callable[[str], int],
+    ) -> List[int]:
+        numpy = require_numpy()
+        if self._abs_max > _INT64_LIMIT:
+            return [decode(phrase) for phrase in phrases]
+        if not phrases:
+            return []
+
+        # Split all phrases with a single call, and locate each phrase's first word
+        words = numpy.array(
+            self.separator.join(phrases).split(self.separator), dtype=object
+        )
+        sizes = (
+            numpy.fromiter(
+                map(str.count, phrases, repeat(self.separator)),
+                dtype=numpy.int64,
+                count=len(phrases),
+            )
+            + 1
+        )
+        starts = numpy.cumsum(sizes) - sizes
+
+        # Raise the same error as the scalar method, for the first phrase that has too many words
+        too_long = numpy.flatnonzero(sizes > self._max_phrase_size)
+        if too_long.size:
+            decode(phrases[too_long[0]])
+
+        results = numpy.empty(len(phrases), dtype=numpy.int64)
+        for size in numpy.unique(sizes).tolist():
+            rows = numpy.flatnonzero(sizes == size)
+
+            # Each word position is weighted by the product of the radices that follow it
+            result = numpy.zeros(rows.size, dtype=numpy.int64)
+            for i, lookup in enumerate(lookups[-size:]):
+                indexes = numpy.fromiter(
+                    map(lookup.__getitem__, words[starts[rows] + i]),
+                    dtype=numpy.int64,
+                    count=rows.size,
+                )
+                result += indexes * self._max_values[size - 1 - i]
+            results[rows] = result
+
+        if self._permutation is not None:
+            return self._permutation.invert_many(results)
+        return results.tolist()
+
+    def _decode_fuzzy(
+        self, phrase: str, index: str, max_distance: int, limit: int
+    ) -> List[FuzzyMatch]:
+        if not 0 <= max_distance <= MAX_FUZZY_DISTANCE:
+            raise EncoderException(
+                f"The maximum distance must be between 0 and {MAX_FUZZY_DISTANCE}, got: {max_distance}"
+            )
+        if limit < 1:
+            raise EncoderException(f"The limit must be positive, got: {limit}")
+
+        words = phrase.split(self.separator)
+        seq_length = len(words)
+        if seq_length > self._max_phrase_size:
+            raise EncoderException(
+                f"The sequence contains more words that can be decoded with up to {self._max_phrase_size} words"
+            )
+
+        fuzzy_indexes = self._wordlist._get_fuzzy_indexes(index, max_distance)
+        relevant_indexes = list(zip(fuzzy_indexes[-seq_length:], words))
+        relevant_radices = self._radices[-seq_length:]
+
+        # Combine the candidates of all words, one total distance at a time,
+        # since matches at larger distances would be ranked after the ones already found
+        matches: List[FuzzyMatch] = []
+        candidates: List[List[Tuple[int, int, str]]] = []
+
+        def combine(i: int, remaining: int, result: int, parts: List[str]) -> None:
+            if i == seq_length:
+                if not remaining:
+                    matches.append(
+                        FuzzyMatch(
+                            self._to_id(result), distance, self.separator.join(parts)
+                        )
+                    )
+                return
+            for word_distance, position, word in candidates[i]:
+                if word_distance > remaining:
+                    break
+                combine(
+                    i + 1,
+                    remaining - word_distance,
+                    result * relevant_radices[i] + position,
+                    parts + [word],
+                )
+
+        for distance in range(max_distance + 1):
+            # The candidates of each word (closest first); searching larger distances is slower
+            candidates = [
+                fuzzy_index.search(word, distance)
+                for fuzzy_index, word in relevant_indexes
+            ]
+            combine(0, distance, 0, [])
+            if len(matches) >= limit:
+                break
+
+        matches.sort(key=lambda match: (match.distance, match.id))
+        return matches[:limit]
+
+    def _complete(
+        self,
+        partial: str,
+        index: str,
+        phrase_size: Optional[int],
+        offset: int,
+        limit: int,
+    ) -> List[Completion]:
+        if offset < 0:
+            raise EncoderException(f"The offset must not be negative, got: {offset}")
+        if limit < 1:
+            raise EncoderException(f"The limit must be positive, got: {limit}")
+
+        words = partial.split(self.separator)
+        completions: List[Completion] = []
+        for prefix_index, base, tail, lower, upper in self._prefix_spans(
+            words, index, phrase_size
+        ):
+            for rank in prefix_index.find(words[-1]):
+                # Only keyphrases of this size that would be returned by encode() are completed
+                position = prefix_index.position(rank)
+                start = max((base + position) * tail, lower)
+                end = min((base + position + 1) * tail, upper)
+                if start >= end:
+                    continue
+                if offset:
+                    offset -= 1
+                    continue
+
+                phrase = self.separator.join(words[:-1] + [prefix_index.key(rank)])
+                completions.append(Completion(phrase, start, end))
+                if len(completions) == limit:
+                    return completions
+        return completions
+
+    def _prefix_ranges(
+        self, partial: str, index: str, phrase_size: Optional[int]
+    ) -> List[Tuple[int, int]]:
+        words = partial.split(self.separator)
+        ranges: List[Tuple[int, int]] = []
+        for prefix_index, base, tail, lower, upper in self._prefix_spans(
+            words, index, phrase_size
+        ):
+            for positions in prefix_index.ranges(words[-1]):
+                start = max((base + positions.start) * tail, lower)
+                end = min((base + positions.stop) * tail, upper)
+                if start >= end:
+                    continue
+                if ranges and ranges[-1][1] == start:
+                    ranges[-1] = (ranges[-1][0], end)
+                else:
+                    ranges.append((start, end))
+        return ranges
+
+    def _prefix_spans(
+        self, words: List[str], index: str, phrase_size: Optional[int]
+    ) -> Iterator[Tuple[PrefixIndex, int, int, int, int]]:
+        # For each phrase size that can complete the typed words, yields the prefix index of the last (partial) word,
+        # and the values needed to compute the range of integers covered by each of its completions:
+        # position p covers [(base + p) * tail, (base + p + 1) * tail), within [lower, upper)
+        if self.permuted:
+            raise EncoderException(
+                "Keyphrases that share a prefix do not cover contiguous ranges of permuted integers"
+            )
+
+        typed = len(words)
+        if typed > self._max_phrase_size:
+            raise EncoderException(
+                f"The sequence contains more words that can be decoded with up to {self._max_phrase_size} words"
+            )
+
+        if phrase_size is None:
+            sizes = range(max(self._min_phrase_size, typed), self._max_phrase_size + 1)
+        elif self._min_phrase_size <= phrase_size <= self._max_phrase_size:
+            sizes = range(max(phrase_size, typed), phrase_size + 1)
+        else:
+            raise EncoderException(
+                f"phrase_size must be between {self._min_phrase_size} and {self._max_phrase_size}"
+            )
+
+        lookups = (
+            self._wordlist._word_positions
+            if index == WORD_INDEX
+            else self._wordlist._abbr_to_pos
+        )
+        prefix_indexes = self._wordlist._get_prefix_indexes(index)
+        for size in sizes:
+            first = self._max_phrase_size - size
+            last = first + typed - 1
+
+            # The value of the complete words, shifted by the partial word's radix
+            value = 0
+            try:
+                for i, word in enumerate(words[:-1]):
+                    value = value * self._radices[first + i] + lookups[first + i][word]
+            except KeyError:
+                continue
+
+            # Keyphrases of this size encode the integers that do not fit in fewer words
+            lower = self._max_values[size - 1] if size > self._min_phrase_size else 0
+            yield (
+                prefix_indexes[last],
+                value * self._radices[last],
+                self._max_values[size - typed],
+                lower,
+                self._max_values[size],
+            )
+
+    def _decode_words(self, words: List[bytes], index: str) -> Tuple[int, int]:
+        # Returns the decoded integer and -1, or 0 and the index of the first unknown word
+        seq_length = len(words)
+        lookups = self._wordlist._get_bytes_indexes(index)[-seq_length:]
+        relevant_radices = self._radices[-seq_length:]
+
+        result = 0
+        for i, word in enumerate(words):
+            position = lookups[i].get(word)
+            if position is None:
+                return 0, i
+            result = result * relevant_radices[i] + position
+        return result, -1
+
+    def _to_id(self, value: int) -> int:
+        # Maps a decoded value back to the integer that was encoded, if integers are permuted
+        return value if self._permutation is None else self._permutation.invert(value)
 
     def _determine_sequence_size(self, number: int) -> int:
         # Determine the number of words needed to encode the result
@@ -345,16 +1284,31 @@ class WordEncoder:
         return words_needed
 
 
-def _read_words(from_path: str, package_name: Optional[str] = None) -> List[str]:
-    """Reads words from a file that is either on disk, or part of the specified package."""
+def _check_fields(fields: Sequence[str]) -> None:
+    if not fields:
+        raise EncoderException(
+            f"At least one field must be requested, out of: {', '.join(_RECORD_FIELDS)}"
+        )
+    for field in fields:
+        if field not in _RECORD_FIELDS:
+            raise EncoderException(
+                f"Unknown field '{field}', expected 'keyphrase', 'abbr', or 'id'"
+            )
+
+
+def _resolve_path(from_path: str, package_name: Optional[str] = None) -> str:
+    """Resolves the path of a file that is either on disk, or part of the specified package."""
 
-    # Determine input file
-    data_path = from_path
     if package_name is not None:
-        data_path = str(resources.files(package_name).joinpath(from_path))
+        return str(resources.files(package_name).joinpath(from_path))
+    return from_path
+
+
+def _read_words(from_path: str, package_name: Optional[str] = None) -> List[str]:
+    """Reads words from a file that is either on disk, or part of the specified package."""
 
     # Read all words from file
-    with open(data_path, "r") as file:
+    with open(_resolve_path(from_path, package_name), "r") as file:
         data = [ln.strip() for ln in file]
     return data
 
@@ -0,0 +1,180 @@
+"""
+Fuzzy
+=====
+
+Contains the FuzzyIndex class, which finds the words of a word list that are within a small edit distance
+of a (mistyped) word, used by `WordEncoder.decode_fuzzy()` and `WordEncoder.decode_abbr_fuzzy()`.
+
+Classes:
+    FuzzyIndex - Finds the strings within a bounded edit distance of a query, using a deletion index.
+    FuzzyMatch - Represents a candidate decoded from a mistyped keyphrase or abbreviation.
+
+Functions:
+    edit_distance - Computes the edit distance between two strings, up to a bound.
+"""
+
+from typing import Dict, Iterator, List, Mapping, NamedTuple, Set, Tuple
+
+# Deletion indexes grow combinatorially with the distance, which is only useful for a few typos per word
+MAX_FUZZY_DISTANCE = 3
+
+
+class FuzzyMatch(NamedTuple):
+    """
+    Represents a candidate decoded from a mistyped keyphrase or abbreviation.
+
+    Attributes:
+        id (int): The decoded integer.
+        distance (int): The total number of edits needed to turn the input into the phrase.
+        phrase (str): The valid keyphrase (or abbreviation) that the input was corrected to.
+    """
+
+    id: int
+    distance: int
+    phrase: str
+
+
+class FuzzyIndex:
+    """
+    Finds the strings within a bounded edit distance of a query, without comparing it to every indexed string.
+
+    Indexes every string obtained by deleting up to `max_distance` characters from each key (symmetric deletion):
+    two strings within that distance always share such a deletion, so a query only looks up its own deletions,
+    and computes the exact distance to the few keys that share one of them.
+
+    The distance is the optimal string alignment distance: the number of inserted, deleted, or substituted
+    characters, or transposed adjacent characters, needed to turn one string into the other.
+    """
+
+    def __init__(self, index: Mapping[str, int], max_distance: int):
+        """
+        Constructs a new instance of FuzzyIndex.
+
+        Parameters:
+            index (Mapping[str, int]): Maps the strings to index to their positions (e.g., `Wordlist._word_positions`).
+            max_distance (int): The maximum distance that can be searched.
+        """
+        if not 0 <= max_distance <= MAX_FUZZY_DISTANCE:
+            raise ValueError(
+                f"The maximum distance must be between 0 and {MAX_FUZZY_DISTANCE}, got: {max_distance}"
+            )
+
+        self.max_distance = max_distance
+        self._keys: List[str] = []
+        self._positions: List[int] = []
+        self._deletions: Dict[str, List[int]] = {}
+
+        for key, position in index.items():
+            key_id = len(self._keys)
+            self._keys.append(key)
+            self._positions.append(position)
+            for deletion in _deletions(key, max_distance):
+                self._deletions.setdefault(deletion, []).append(key_id)
+
+    def search(self, word: str, max_distance: int) -> List[Tuple[int, int, str]]:
+        """
+        Finds the indexed strings within the specified distance of a word.
+
+        Parameters:
+            word (str): The word to search for.
+            max_distance (int): The maximum distance; must not exceed the index's.
+
+        Returns:
+            List[Tuple[int, int, str]]: The distance, position, and string of each match, closest first.
+        """
+
+        if not 0 <= max_distance <= self.max_distance:
+            raise ValueError(
+                f"The distance must be between 0 and {self.max_distance}, got: {max_distance}"
+            )
+
+        candidates: Set[int] = set()
+        for deletion in _deletions(word, max_distance):
+            candidates.update(self._deletions.get(deletion, ()))
+
+        matches = []
+        for key_id in candidates:
+            key = self._keys[key_id]
+            distance = edit_distance(word, key, max_distance)
+            if distance <= max_distance:
+                matches.append((distance, self._positions[key_id], key))
+        matches.sort()
+        return matches
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Computes the optimal string alignment distance between two strings, up to a bound.
+
+    Parameters:
+        a (str): The first string.
+        b (str): The second string.
+        max_distance (int): Distances above this bound are not computed exactly.
+
+    Returns:
+        int: The distance, or `max_distance + 1` if it exceeds the bound.
+    """
+
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    if max_distance <= 1:
+        # Most searches only allow a single edit, which is checked without filling the table
+        return 1 if max_distance and _single_edit(a, b) else max_distance + 1
+
+    previous: List[int] = []
+    row = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        before, previous = previous, row
+        row = [i]
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            distance = min(previous[j] + 1, row[j - 1] + 1, previous[j - 1] + cost)
+            if (
+                cost
+                and i > 1
+                and j > 1
+                and a[i - 1] == b[j - 2]
+                and a[i - 2] == b[j - 1]
+            ):
+                # Adjacent characters were transposed
+                distance = min(distance, before[j - 2] + 1)
+            row.append(distance)
+
+        # Every alignment passes through this row: stop once all of them exceed the bound
+        if min(row) > max_distance:
+            return max_distance + 1
+
+    return min(row[-1], max_distance + 1)
+
+
+def _single_edit(a: str, b: str) -> bool:
+    # Whether two different strings are a single insertion, deletion, substitution, or transposition apart
+    if len(a) < len(b):
+        a, b = b, a
+    i = 0
+    while i < len(b) and a[i] == b[i]:
+        i += 1
+
+    if len(a) != len(b):
+        return a[i + 1 :] == b[i:]
+    return a[i + 1 :] == b[i + 1 :] or (
+        a[i + 2 :] == b[i + 2 :] and a[i : i + 2] == b[i + 1 : i + 2] + b[i : i + 1]
+    )
+
+
+def _deletions(word: str, max_distance: int) -> Set[str]:
+    # All strings obtained by deleting up to max_distance characters from the word (including the word itself)
+    result = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = set(_delete_one(frontier))
+        result |= frontier
+    return result
+
+
+def _delete_one(words: Set[str]) -> Iterator[str]:
+    for word in words:
+        for i in range(len(word)):
+            yield word[:i] + word[i + 1 :]
@@ -9,15 +9,27 @@ Classes:
     Generator - Generates unique integer identifiers with configurable properties. It is formed by three parts (time unit, machine id, sequence).
     GeneratorException - Raised when a Generator is misconfigured.
     Resolution - Used to specify the time unit of the generated identifiers.
+    SequenceExhaustedException - Raised when all sequences were exhausted and the configured wait strategy gave up.
+    ShardedGenerator - Thread safe generator that assigns each thread its own machine ID, avoiding a global lock.
     ThreadSafeGenerator - Wraps the Generator class, making it thread safe (wrapping `next_id()` with a lock).
 """
 
+from array import array
 from collections import defaultdict
+from contextlib import contextmanager
+import math
 import threading
 import time
-from typing import Callable, Dict, List
+import warnings
+import weakref
+from typing import Callable, Dict, Iterator, List, Optional
 from enum import Enum
 
+from .checkpoint import Checkpoint
+from .clock import Clock, FunctionClock, WallClock
+from .metrics import GeneratorMetrics, MetricsSnapshot
+from .wait import SpinWait, WaitStrategy
+
 
 class Resolution(Enum):
     """
@@ -48,6 +60,19 @@ class Generator:
         sequence_bits (int): How many bits are allocated for the local sequence;
                              only positive integers are valid.
                              If set to 0, only one identifier can be generated per machine in each time unit
+        wait_strategy (WaitStrategy): Determines how the generator waits for the next time unit,
+                                      once all sequences in the current one were exhausted.
+        clock (Clock): The clock source used to determine the current time.
+        current_time (Callable[[], float]): Deprecated, use `clock`; the current time in seconds since the UNIX epoch.
+        clock_regressions (int): How many times the clock was observed going backwards (once per regression,
+                                 no matter how many identifiers are issued before the clock catches up).
+        checkpoint (Optional[Checkpoint]): If set, persists the reserved time units, so that identifiers
+                                           are never reissued after a restart.
+        metrics (Optional[GeneratorMetrics]): If set, records the generator's counters and histograms.
+
+    If the clock goes backwards, identifiers keep being issued from the last time unit's remaining sequences,
+    without waiting. Once they are exhausted, the wait strategy waits for the clock to catch up:
+    the default SpinWait sleeps through the regression, and only busy-waits for the last time unit.
     """
 
     def __init__(
@@ -57,6 +82,10 @@ class Generator:
         machine_ids: List[int],
         machine_id_bits: int,
         sequence_bits: int,
+        wait_strategy: Optional[WaitStrategy] = None,
+        clock: Optional[Clock] = None,
+        checkpoint: Optional[Checkpoint] = None,
+        metrics: Optional[GeneratorMetrics] = None,
     ):
         """
         Constructs a new instance of Generator.
@@ -73,12 +102,26 @@ class Generator:
             sequence_bits (int): How many bits are allocated for the local sequence;
                                 only positive integers are valid.
                                 If set to 0, only one identifier can be generated per machine in each time unit
+            wait_strategy (Optional[WaitStrategy]): Determines how the generator waits for the next time unit,
+                                                    once all sequences in the current one were exhausted.
+                                                    Defaults to busy-waiting (SpinWait).
+            clock (Optional[Clock]): The clock source used to determine the current time.
+                                     Defaults to the system's wall clock (WallClock).
+            checkpoint (Optional[Checkpoint]): If set, restores the high-water marks of the owned machine IDs,
+                                               and persists the reserved time units ahead of generating identifiers.
+            metrics (Optional[GeneratorMetrics]): If set, records the generator's counters and histograms.
         """
 
         self.epoch_millis = int(epoch * 1000)
-        # Allows replacing the time in tests
-        self.current_time: Callable[[], float] = lambda: time.time()
         self.resolution = resolution
+        # Cached to avoid attribute lookups when reading the current time
+        self._resolution_millis: int = resolution.value
+
+        # Allows replacing the time in tests
+        self.clock = clock if clock is not None else WallClock()
+        self._clock_millis = self.clock.millis
+        self.clock_regressions = 0
+        self._clock_behind = False
 
         self.machine_id_bits = machine_id_bits
         max_machine_id = (1 << machine_id_bits) - 1 if machine_id_bits > 0 else 0
@@ -102,39 +145,75 @@ class Generator:
         self.last_times: Dict[int, int] = defaultdict(lambda: -1)
         self.current_machine_index = 0
 
+        self.wait_strategy = wait_strategy if wait_strategy is not None else SpinWait()
+        self.metrics = metrics
+
+        # Restore the high-water marks, so that time units reserved before a restart are never reused;
+        # they are kept apart from the last time units, so that waiting for them is not reported as a clock regression
+        self.checkpoint = checkpoint
+        self._reserved_until: float = math.inf
+        self._restored_until = -1
+        if checkpoint is not None:
+            self._reserve_units = max(
+                1, math.ceil(checkpoint.reserve_ahead * 1000 / self._resolution_millis)
+            )
+            marks = checkpoint.load()
+            self._restored_until = max(
+                [marks[mid] for mid in self.machine_ids if mid in marks], default=-1
+            )
+            self._reserved_until = self._restored_until
+
     def next_id(self) -> int:
         """
         Generates unique values according to the configured class settings.
         If the maximum sequences per time unit have already been generated,
-        the method will busy-wait until the next time unit has been reached.
+        the method will wait until the next time unit has been reached, using the configured wait strategy.
 
         Returns:
             int: A unique integer identifier, relative to the configured time unit, and machine ID.
+
+        Raises:
+            SequenceExhaustedException: If the wait strategy gave up waiting for the next time unit.
         """
 
-        machine_id = self._next_machine_id()
-        sequence = self.sequences[machine_id]
+        observed = current_time = self._current_time()
+        if self._restored_until >= 0:
+            observed = current_time = self._pass_restored_time(current_time)
 
-        current_time = self._current_time()
+        # Only advance to the next machine once an identifier was successfully generated
+        machine_id = self.machine_ids[self.current_machine_index]
+        sequence = self.sequences[machine_id]
         last_time = self.last_times[machine_id]
 
         if current_time < last_time:
-            # Delayed thread, allow it to catch-up
-            current_time = self._wait_for_next_time(current_time, last_time)
+            # The clock went backwards (or a delayed thread): keep using the last time unit, instead of waiting
+            if not self._clock_behind:
+                self._on_clock_regression()
+            current_time = last_time
+        elif self._clock_behind:
+            self._clock_behind = False
 
         if current_time == last_time:
             # TODO: might need to check self.sequence_bits > 0
             sequence += 1
             if sequence > self.max_sequence:
-                current_time = self._wait_for_next_time(current_time, last_time)
+                if self.metrics is not None:
+                    self.metrics.record_sequence_exhausted()
+                current_time = self._wait_for_next_time(observed, last_time)
                 sequence = 0
                 last_time = current_time
         else:
             sequence = 0
             last_time = current_time
 
+        if last_time > self._reserved_until:
+            self._reserve(last_time)
+
         self.last_times[machine_id] = last_time
         self.sequences[machine_id] = sequence
+        self._next_machine_id()
+        if self.metrics is not None:
+            self.metrics.record_issued(machine_id, 1)
 
         id = current_time << (self.machine_id_bits + self.sequence_bits)
         if self.machine_id_bits > 0:
@@ -144,15 +223,251 @@ class Generator:
 
         return id
 
+    def try_next_id(self) -> Optional[int]:
+        """
+        Same as `next_id()`, but returns None instead of raising, if the wait strategy gave up.
+
+        Returns:
+            Optional[int]: A unique integer identifier, or None if the sequences were exhausted.
+        """
+
+        try:
+            return self.next_id()
+        except SequenceExhaustedException:
+            return None
+
+    def next_ids(self, count: int) -> List[int]:
+        """
+        Generates a batch of unique values, in the same order as `count` consecutive calls to `next_id()` would.
+        The current time is read once per time unit, and the remaining sequences of all the owned machine IDs
+        are reserved in one step. If the batch exhausts them, the method waits until the next time unit,
+        using the configured wait strategy. If the wait strategy gives up, fewer identifiers are returned.
+
+        Parameters:
+            count (int): How many identifiers to generate.
+
+        Returns:
+            List[int]: Unique integer identifiers, relative to the configured time unit, and machine IDs.
+        """
+
+        if count < 0:
+            raise GeneratorException(
+                f"The number of requested IDs cannot be negative, got: {count}"
+            )
+
+        ids: List[int] = []
+        machine_count = len(self.machine_ids)
+        time_shift = self.machine_id_bits + self.sequence_bits
+        slots = self.max_sequence + 1
+
+        current_time = self._current_time()
+        if self._restored_until >= 0:
+            try:
+                current_time = self._pass_restored_time(current_time)
+            except SequenceExhaustedException:
+                return ids
+
+        while len(ids) < count:
+            observed = current_time
+            last_time = max(self.last_times[mid] for mid in self.machine_ids)
+            if current_time < last_time:
+                # The clock went backwards (or a delayed thread): keep using the last time unit, instead of waiting
+                if not self._clock_behind:
+                    self._on_clock_regression()
+                current_time = last_time
+            elif self._clock_behind:
+                self._clock_behind = False
+
+            if current_time > self._reserved_until:
+                self._reserve(current_time)
+
+            # Machines in the order they would be selected by _next_machine_id()
+            order = [
+                self.machine_ids[(self.current_machine_index + i) % machine_count]
+                for i in range(machine_count)
+            ]
+            starts = [
+                self.sequences[mid] + 1 if self.last_times[mid] == current_time else 0
+                for mid in order
+            ]
+            available = [slots - start for start in starts]
+
+            # The round-robin stops at the first machine that runs out of sequences
+            rounds = min(available)
+            issued = rounds * machine_count + available.index(rounds)
+            issued = min(issued, count - len(ids))
+
+            base = current_time << time_shift
+            prefixes = [
+                base | mid << self.sequence_bits | starts[i]
+                for i, mid in enumerate(order)
+            ]
+            if machine_count == 1:
+                ids.extend(range(prefixes[0], prefixes[0] + issued))
+            else:
+                ids.extend(
+                    prefixes[i % machine_count] + i // machine_count
+                    for i in range(issued)
+                )
+
+            # Record the last sequence issued for each machine
+            for i, mid in enumerate(order):
+                used = issued // machine_count + (
+                    1 if i < issued % machine_count else 0
+                )
+                if used:
+                    self.last_times[mid] = current_time
+                    self.sequences[mid] = starts[i] + used - 1
+                    if self.metrics is not None:
+                        self.metrics.record_issued(mid, used)
+            self.current_machine_index = (
+                self.current_machine_index + issued
+            ) % machine_count
+
+            if len(ids) < count:
+                # The next machine has exhausted its sequences
+                if self.metrics is not None:
+                    self.metrics.record_sequence_exhausted()
+                try:
+                    current_time = self._wait_for_next_time(observed, current_time)
+                except SequenceExhaustedException:
+                    break
+
+        return ids
+
+    def reserve_block(self, count: int) -> array:
+        """
+        Same as `next_ids()`, but returns the identifiers as a compact array of unsigned 64-bit integers.
+
+        Parameters:
+            count (int): How many identifiers to generate.
+
+        Returns:
+            array: Unique integer identifiers, relative to the configured time unit, and machine IDs.
+        """
+
+        return array("Q", self.next_ids(count))
+
+    def seconds_until_overflow(self, max_value: int) -> float:
+        """
+        Calculates how long until the generated identifiers exceed the specified maximum value,
+        e.g., an encoder's `get_max()`.
+
+        Parameters:
+            max_value (int): The (exclusive) upper bound of the identifiers.
+
+        Returns:
+            float: The number of seconds until the first time unit whose identifiers do not fit under `max_value`;
+                   negative if that time unit has already passed.
+        """
+
+        return self._seconds_until(
+            max_value >> (self.machine_id_bits + self.sequence_bits)
+        )
+
+    @property
+    def current_time(self) -> Callable[[], float]:
+        """
+        Deprecated: use `clock` instead.
+        A function that returns the generator's current time, in seconds since the UNIX epoch;
+        assigning a function replaces the generator's clock with a FunctionClock.
+        """
+
+        warnings.warn(
+            "Generator.current_time is deprecated; use Generator.clock instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        clock_millis = self._clock_millis
+        return lambda: clock_millis() / 1000
+
+    @current_time.setter
+    def current_time(self, current_time: Callable[[], float]) -> None:
+        warnings.warn(
+            "Generator.current_time is deprecated; pass a Clock to the generator instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        self.clock = FunctionClock(current_time)
+        self._clock_millis = self.clock.millis
+
+    def seconds_until_next_time(self) -> float:
+        """
+        Calculates how long until the next time unit begins, according to the generator's clock,
+        e.g., to retry after the wait strategy gave up.
+
+        Returns:
+            float: The number of seconds until the next time unit; never negative.
+        """
+
+        return max(self._seconds_until(self._current_time() + 1), 0.0)
+
+    def metrics_snapshot(self) -> MetricsSnapshot:
+        """
+        Returns a point-in-time copy of the generator's metrics.
+
+        Returns:
+            MetricsSnapshot: The generator's counters and histograms.
+
+        Raises:
+            GeneratorException: If the generator was not configured with metrics.
+        """
+
+        if self.metrics is None:
+            raise GeneratorException("Metrics were not enabled for this generator")
+        overflow = None
+        if self.metrics.max_value is not None:
+            overflow = self.seconds_until_overflow(self.metrics.max_value)
+        return self.metrics.snapshot(overflow)
+
+    def _on_clock_regression(self) -> None:
+        # Counted once, until the clock catches up with the last time unit
+        self._clock_behind = True
+        self.clock_regressions += 1
+        if self.metrics is not None:
+            self.metrics.record_clock_regression()
+
+    def _reserve(self, time_unit: int) -> None:
+        # Persist a reservation ahead of the current time unit, amortizing durable writes over multiple time units
+        if self.checkpoint is None:
+            return
+        reserved_until = time_unit + self._reserve_units
+        self.checkpoint.save({mid: reserved_until for mid in self.machine_ids})
+        self._reserved_until = reserved_until
+
     def _current_time(self) -> int:
+        return (self._clock_millis() - self.epoch_millis) // self._resolution_millis
+
+    def _seconds_until(self, time_unit: int) -> float:
+        # Number of seconds until the specified time unit begins, according to the generator's clock
         return (
-            int(self.current_time() * 1000) - self.epoch_millis
-        ) // self.resolution.value
+            time_unit * self._resolution_millis
+            + self.epoch_millis
+            - self._clock_millis()
+        ) / 1000
 
     def _wait_for_next_time(self, current_time: int, last_time: int) -> int:
-        # busy wait until the required time-unit passes
-        while current_time <= last_time:
-            current_time = self._current_time()
+        # wait until the required time-unit passes
+        result = self.wait_strategy.wait(self, current_time, last_time)
+        if self.metrics is not None:
+            self.metrics.record_wait(result.waited)
+        if result.time is None:
+            raise SequenceExhaustedException(
+                f"All sequences were exhausted for time unit {last_time}, and the wait strategy gave up"
+            )
+        return result.time
+
+    def _pass_restored_time(self, current_time: int) -> int:
+        # The time units reserved before a restart may have been used: wait until the last one has passed,
+        # then mark them as used by all owned machine IDs (which is not a clock regression anymore)
+        restored_until = self._restored_until
+        if current_time <= restored_until:
+            current_time = self._wait_for_next_time(current_time, restored_until)
+        for mid in self.machine_ids:
+            if self.last_times[mid] < restored_until:
+                self.last_times[mid] = restored_until
+                self.sequences[mid] = self.max_sequence
+        self._restored_until = -1
         return current_time
 
     def _next_machine_id(self) -> int:
@@ -179,6 +494,13 @@ class ThreadSafeGenerator(Generator):
        sequence_bits (int): How many bits are allocated for the local sequence;
                             only positive integers are valid.
                             If set to 0, only one identifier can be generated per machine in each time unit
+       wait_strategy (WaitStrategy): Determines how the generator waits for the next time unit,
+                                     once all sequences in the current one were exhausted.
+       clock (Clock): The clock source used to determine the current time.
+       checkpoint (Optional[Checkpoint]): If set, persists the reserved time units, so that identifiers
+                                          are never reissued after a restart.
+       metrics (Optional[GeneratorMetrics]): If set, records the generator's counters and histograms,
+                                             including the time spent waiting for the lock.
     """
 
     def __init__(
@@ -188,6 +510,10 @@ class ThreadSafeGenerator(Generator):
         machine_ids: List[int],
         machine_id_bits: int,
         sequence_bits: int,
+        wait_strategy: Optional[WaitStrategy] = None,
+        clock: Optional[Clock] = None,
+        checkpoint: Optional[Checkpoint] = None,
+        metrics: Optional[GeneratorMetrics] = None,
     ):
         """
         Constructs a ThreadSafeGenerator.
@@ -204,8 +530,26 @@ class ThreadSafeGenerator(Generator):
             sequence_bits (int): How many bits are allocated for the local sequence;
                                 only positive integers are valid.
                                 If set to 0, only one identifier can be generated per machine in each time unit
+            wait_strategy (Optional[WaitStrategy]): Determines how the generator waits for the next time unit,
+                                                    once all sequences in the current one were exhausted.
+                                                    Defaults to busy-waiting (SpinWait).
+            clock (Optional[Clock]): The clock source used to determine the current time.
+                                     Defaults to the system's wall clock (WallClock).
+            checkpoint (Optional[Checkpoint]): If set, restores the high-water marks of the owned machine IDs,
+                                               and persists the reserved time units ahead of generating identifiers.
+            metrics (Optional[GeneratorMetrics]): If set, records the generator's counters and histograms.
         """
-        super().__init__(epoch, resolution, machine_ids, machine_id_bits, sequence_bits)
+        super().__init__(
+            epoch,
+            resolution,
+            machine_ids,
+            machine_id_bits,
+            sequence_bits,
+            wait_strategy,
+            clock,
+            checkpoint,
+            metrics,
+        )
         self.lock = threading.Lock()
 
     def next_id(self) -> int:
@@ -216,9 +560,209 @@ class ThreadSafeGenerator(Generator):
             int: A unique integer identifier, relative to the configured time unit, and machine ID.
         """
 
-        with self.lock:
+        if self.metrics is None:
+            with self.lock:
+                return super().next_id()
+        with _timed(self.lock, self.metrics):
             return super().next_id()
 
+    def next_ids(self, count: int) -> List[int]:
+        """
+        Generates a batch of unique values in a thread safe manner, acquiring the lock once for the whole batch.
+
+        Parameters:
+            count (int): How many identifiers to generate.
+
+        Returns:
+            List[int]: Unique integer identifiers, relative to the configured time unit, and machine IDs.
+        """
+
+        if self.metrics is None:
+            with self.lock:
+                return super().next_ids(count)
+        with _timed(self.lock, self.metrics):
+            return super().next_ids(count)
+
+
+class ShardedGenerator(Generator):
+    """
+    Thread safe generator that splits the owned machine IDs into shards (one Generator per machine ID),
+    and assigns each thread to a single shard, on its first call.
+    As long as there are at least as many machine IDs as threads, each thread has its own shard,
+    and the lock guarding it is never contended. Otherwise, threads are spread evenly over the available shards.
+    Shards are released when their threads exit, and can be reassigned to new threads.
+
+    Identifiers are increasing for each thread, but not across threads.
+
+    Attributes:
+       epoch (float): The epoch that the time component will be relative to; set to 0.0 for UNIX time.
+       resolution (Resolution): The time unit resolution, to which the other parameters will be relative to.
+       machine_ids (List[int]): A list of machine identifiers owned by the current instance;
+                                at least one value must be provided; duplicates will be ignored.
+                                Each machine ID is assigned to a separate shard.
+       machine_id_bits (int): How many bits are allocated for the machine ID;
+                              only positive integers are valid.
+       sequence_bits (int): How many bits are allocated for the local sequence;
+                            only positive integers are valid.
+                            If set to 0, only one identifier can be generated per machine in each time unit
+       wait_strategy (WaitStrategy): Determines how the generator waits for the next time unit,
+                                     once all sequences in the current one were exhausted.
+       clock (Clock): The clock source used to determine the current time.
+       metrics (Optional[GeneratorMetrics]): If set, records the generator's counters and histograms
+                                             (all shards record into it).
+       clock_regressions (int): How many times the clock was observed going backwards, across all shards.
+    """
+
+    def __init__(
+        self,
+        epoch: float,
+        resolution: Resolution,
+        machine_ids: List[int],
+        machine_id_bits: int,
+        sequence_bits: int,
+        wait_strategy: Optional[WaitStrategy] = None,
+        clock: Optional[Clock] = None,
+        metrics: Optional[GeneratorMetrics] = None,
+    ):
+        """
+        Constructs a ShardedGenerator.
+
+        Parameters:
+            epoch (float): The epoch that the time component will be relative to; set to 0.0 for UNIX time.
+            resolution (Resolution): The time unit resolution, to which the other parameters will be relative to.
+            machine_ids (List[int]): A list of machine identifiers owned by the current instance;
+                                    at least one value must be provided; duplicates will be ignored.
+                                    Each machine ID is assigned to a separate shard.
+            machine_id_bits (int): How many bits are allocated for the machine ID;
+                                only positive integers are valid.
+            sequence_bits (int): How many bits are allocated for the local sequence;
+                                only positive integers are valid.
+                                If set to 0, only one identifier can be generated per machine in each time unit
+            wait_strategy (Optional[WaitStrategy]): Determines how the generator waits for the next time unit,
+                                                    once all sequences in the current one were exhausted.
+                                                    Defaults to busy-waiting (SpinWait).
+            clock (Optional[Clock]): The clock source used to determine the current time.
+                                     Defaults to the system's wall clock (WallClock).
+            metrics (Optional[GeneratorMetrics]): If set, records the generator's counters and histograms.
+        """
+        super().__init__(
+            epoch,
+            resolution,
+            machine_ids,
+            machine_id_bits,
+            sequence_bits,
+            wait_strategy,
+            clock,
+            metrics=metrics,
+        )
+        self.shards = [
+            _Shard(
+                Generator(
+                    epoch,
+                    resolution,
+                    [mid],
+                    machine_id_bits,
+                    sequence_bits,
+                    self.wait_strategy,
+                    self.clock,
+                    metrics=metrics,
+                )
+            )
+            for mid in self.machine_ids
+        ]
+        self._local = threading.local()
+        self._assignment_lock = threading.Lock()
+
+    def next_id(self) -> int:
+        """
+        Generates unique values in a thread safe manner, using the shard assigned to the current thread.
+
+        Returns:
+            int: A unique integer identifier, relative to the configured time unit, and machine ID.
+        """
+
+        shard = self._current_shard()
+        if shard.generator.metrics is None:
+            with shard.lock:
+                return shard.generator.next_id()
+        with _timed(shard.lock, shard.generator.metrics):
+            return shard.generator.next_id()
+
+    def next_ids(self, count: int) -> List[int]:
+        """
+        Generates a batch of unique values in a thread safe manner, using the shard assigned to the current thread.
+
+        Parameters:
+            count (int): How many identifiers to generate.
+
+        Returns:
+            List[int]: Unique integer identifiers, relative to the configured time unit, and machine ID.
+        """
+
+        shard = self._current_shard()
+        if shard.generator.metrics is None:
+            with shard.lock:
+                return shard.generator.next_ids(count)
+        with _timed(shard.lock, shard.generator.metrics):
+            return shard.generator.next_ids(count)
+
+    @property
+    def clock_regressions(self) -> int:
+        return sum(shard.generator.clock_regressions for shard in self.shards)
+
+    @clock_regressions.setter
+    def clock_regressions(self, value: int) -> None:
+        # Initialized by Generator.__init__(), but only the shards observe the clock
+        pass
+
+    def _current_shard(self) -> "_Shard":
+        try:
+            return self._local.lease.shard
+        except AttributeError:
+            return self._assign_shard()
+
+    def _assign_shard(self) -> "_Shard":
+        # Only executed once per thread: pick the shard with the fewest threads
+        with self._assignment_lock:
+            shard = min(self.shards, key=lambda s: s.threads)
+            shard.threads += 1
+
+        lease = _ShardLease(shard)
+        # Thread-local values are discarded when their thread exits
+        weakref.finalize(lease, self._release_shard, shard)
+        self._local.lease = lease
+        return shard
+
+    def _release_shard(self, shard: "_Shard") -> None:
+        with self._assignment_lock:
+            shard.threads -= 1
+
+
+@contextmanager
+def _timed(lock: threading.Lock, metrics: GeneratorMetrics) -> Iterator[None]:
+    """Acquires the lock, recording how long it took."""
+
+    started = time.perf_counter()
+    with lock:
+        metrics.record_lock_wait(time.perf_counter() - started)
+        yield
+
+
+class _Shard:
+    """A generator owning a single machine ID, along with the lock guarding it and the number of threads using it."""
+
+    def __init__(self, generator: Generator):
+        self.generator = generator
+        self.lock = threading.Lock()
+        self.threads = 0
+
+
+class _ShardLease:
+    """Stored in thread-local storage, to track the lifetime of the thread that was assigned a shard."""
+
+    def __init__(self, shard: _Shard):
+        self.shard = shard
+
 
 class GeneratorException(Exception):
     """
@@ -226,3 +770,11 @@ class GeneratorException(Exception):
     """
 
     pass
+
+
+class SequenceExhaustedException(GeneratorException):
+    """
+    Raised when all sequences of the current time unit were exhausted and the configured wait strategy gave up.
+    """
+
+    pass
@@ -0,0 +1,206 @@
+"""
+Layout
+======
+
+Contains functions that decompose identifiers generated by a Generator into their parts (time, machine ID, sequence),
+and that translate time windows into identifier (and keyphrase) ranges, e.g., to query databases with range scans.
+
+The `*_many` and `id_ranges` functions are vectorized over NumPy arrays, and require the optional `numpy` dependency.
+
+Classes:
+    IdParts - Represents the parts of a decomposed identifier.
+    IdPartsArray - Represents the parts of multiple decomposed identifiers, as NumPy arrays.
+
+Functions:
+    decompose - Decomposes an identifier into its parts.
+    decompose_many - Decomposes multiple identifiers into their parts (vectorized).
+    id_range - Translates a time window into the range of identifiers generated during it.
+    id_ranges - Translates multiple time windows into identifier ranges (vectorized).
+    keyphrase_range - Translates a time window into the range of keyphrases generated during it.
+"""
+
+from typing import Any, NamedTuple, Tuple
+
+from ._compat import require_numpy
+from .encoder import EncoderException, KeyPhrase, WordEncoder
+from .generator import Generator, GeneratorException
+
+
+class IdParts(NamedTuple):
+    """Represents the parts of a decomposed identifier; the timestamp marks the start of its time unit (UNIX millis)."""
+
+    timestamp: int
+    machine_id: int
+    sequence: int
+
+
+class IdPartsArray(NamedTuple):
+    """Represents the parts of multiple decomposed identifiers, as NumPy int64 arrays."""
+
+    timestamps: Any
+    machine_ids: Any
+    sequences: Any
+
+
+def decompose(generator: Generator, id: int) -> IdParts:
+    """
+    Decomposes an identifier into its parts, using the generator's epoch, resolution, and bit layout.
+
+    Parameters:
+        generator (Generator): The generator (or an identically configured one) that generated the identifier.
+        id (int): The identifier to decompose.
+
+    Returns:
+        IdParts: The start of the identifier's time unit (in UNIX milliseconds), its machine ID, and its sequence.
+    """
+
+    time_unit = id >> (generator.machine_id_bits + generator.sequence_bits)
+    return IdParts(
+        timestamp=time_unit * generator.resolution.value + generator.epoch_millis,
+        machine_id=(id >> generator.sequence_bits) & _mask(generator.machine_id_bits),
+        sequence=id & _mask(generator.sequence_bits),
+    )
+
+
+def decompose_many(generator: Generator, ids: Any) -> IdPartsArray:
+    """
+    Decomposes multiple identifiers into their parts, using vectorized NumPy operations.
+
+    Parameters:
+        generator (Generator): The generator (or an identically configured one) that generated the identifiers.
+        ids (Any): A NumPy array (or any sequence) of identifiers, which must fit in unsigned 64-bit integers.
+
+    Returns:
+        IdPartsArray: The parts of each identifier, as int64 arrays of the same shape as the input.
+    """
+
+    numpy = require_numpy()
+    values = numpy.asarray(ids, dtype=numpy.uint64)
+
+    time_units = values >> numpy.uint64(
+        generator.machine_id_bits + generator.sequence_bits
+    )
+    machine_ids = (values >> numpy.uint64(generator.sequence_bits)) & numpy.uint64(
+        _mask(generator.machine_id_bits)
+    )
+    sequences = values & numpy.uint64(_mask(generator.sequence_bits))
+
+    timestamps = (
+        time_units.astype(numpy.int64) * generator.resolution.value
+        + generator.epoch_millis
+    )
+    return IdPartsArray(
+        timestamps=timestamps,
+        machine_ids=machine_ids.astype(numpy.int64),
+        sequences=sequences.astype(numpy.int64),
+    )
+
+
+def id_range(generator: Generator, start: float, end: float) -> Tuple[int, int]:
+    """
+    Translates a time window into the range of identifiers that the generator could have generated during it.
+
+    Parameters:
+        generator (Generator): The generator (or an identically configured one) that generated the identifiers.
+        start (float): The start of the time window (inclusive), in UNIX seconds.
+        end (float): The end of the time window (exclusive), in UNIX seconds.
+
+    Returns:
+        Tuple[int, int]: The smallest and largest (inclusive) identifiers generated during the time window.
+    """
+
+    first_unit, last_unit = _time_units(generator, int(start * 1000), int(end * 1000))
+    if first_unit > last_unit:
+        raise GeneratorException(f"The time window [{start}, {end}) is empty")
+
+    shift = generator.machine_id_bits + generator.sequence_bits
+    return first_unit << shift, ((last_unit + 1) << shift) - 1
+
+
+def id_ranges(generator: Generator, starts: Any, ends: Any) -> Tuple[Any, Any]:
+    """
+    Translates multiple time windows into identifier ranges, using vectorized NumPy operations.
+    Empty time windows result in ranges whose minimum is larger than their maximum.
+
+    Parameters:
+        generator (Generator): The generator (or an identically configured one) that generated the identifiers.
+        starts (Any): The start of each time window (inclusive), in UNIX seconds.
+        ends (Any): The end of each time window (exclusive), in UNIX seconds.
+
+    Returns:
+        Tuple[Any, Any]: The smallest and largest (inclusive) identifiers of each time window, as int64 arrays.
+    """
+
+    numpy = require_numpy()
+    start_millis = (numpy.asarray(starts, dtype=numpy.float64) * 1000).astype(
+        numpy.int64
+    )
+    end_millis = (numpy.asarray(ends, dtype=numpy.float64) * 1000).astype(numpy.int64)
+    first_units, last_units = _time_units(generator, start_millis, end_millis)
+
+    shift = generator.machine_id_bits + generator.sequence_bits
+    return first_units << shift, ((last_units + 1) << shift) - 1
+
+
+def keyphrase_range(
+    generator: Generator, encoder: WordEncoder, start: float, end: float
+) -> Tuple[KeyPhrase, KeyPhrase]:
+    """
+    Translates a time window into the first and last keyphrases that could have been generated during it.
+    Keyphrases only sort in the same order as their identifiers if they have the same number of words,
+    and if the encoder is ordered (see `WordEncoder.ordered`); both preconditions are checked.
+
+    Parameters:
+        generator (Generator): The generator (or an identically configured one) that generated the identifiers.
+        encoder (WordEncoder): The encoder used to encode the identifiers.
+        start (float): The start of the time window (inclusive), in UNIX seconds.
+        end (float): The end of the time window (exclusive), in UNIX seconds.
+
+    Returns:
+        Tuple[KeyPhrase, KeyPhrase]: The keyphrases of the smallest and largest identifiers in the time window.
+
+    Raises:
+        EncoderException: If the encoder permutes identifiers (see `WordEncoder.permuted`), its word lists are
+                          not sorted, or its separator does not sort before all word characters,
+                          or if the time window spans keyphrases with different numbers of words;
+                          in these cases, query the identifiers with `id_range()` instead.
+    """
+
+    if encoder.permuted:
+        raise EncoderException(
+            "The keyphrases of permuted identifiers do not sort in the same order as the identifiers"
+        )
+    if not encoder.ordered:
+        raise EncoderException(
+            f"The keyphrases do not sort in the same order as the identifiers: the word lists must be sorted, "
+            f"and the separator ('{encoder.separator}') must sort before all word characters"
+        )
+
+    min_id, max_id = id_range(generator, start, end)
+    if min_id >= encoder.get_max():
+        raise EncoderException(
+            f"The time window [{start}, {end}) starts after the encoder's maximum value"
+        )
+
+    first = encoder.encode(min_id)
+    last = encoder.encode(min(max_id, encoder.get_max() - 1))
+    if first.keyphrase.count(encoder.separator) != last.keyphrase.count(
+        encoder.separator
+    ):
+        raise EncoderException(
+            f"The time window [{start}, {end}) spans keyphrases with different numbers of words, "
+            "which do not sort in the same order as the identifiers"
+        )
+    return first, last
+
+
+def _time_units(generator: Generator, start_millis: Any, end_millis: Any) -> Any:
+    # The time units that contain the window's first and last milliseconds
+    resolution = generator.resolution.value
+    first = (start_millis - generator.epoch_millis) // resolution
+    last = (end_millis - 1 - generator.epoch_millis) // resolution
+    return first, last
+
+
+def _mask(bits: int) -> int:
+    return (1 << bits) - 1
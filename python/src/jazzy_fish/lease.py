@@ -0,0 +1,391 @@
+"""
+Lease
+=====
+
+Contains the classes that allow generators to dynamically claim machine IDs, instead of hand-assigning them.
+Machine IDs are leased for a limited time (TTL) and must be renewed periodically, or they can be claimed by others.
+
+Classes:
+    Lease - Represents a machine ID leased by an owner, until a certain time.
+    LeaseBackend - Base class for the storage backends that keep track of leases.
+    LeaseException - Raised when machine IDs cannot be claimed, or when a lease was lost.
+    LeaseManager - Claims, renews, and releases the machine IDs used by a single Generator.
+    SQLiteLeaseBackend - Stores leases in a SQLite database; suitable for generators running on the same host.
+"""
+
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+import sqlite3
+import threading
+import time
+from typing import Callable, Iterator, List, NamedTuple, Optional
+import uuid
+
+
+class Lease(NamedTuple):
+    """Represents a machine ID leased by an owner, until a certain (UNIX) time."""
+
+    machine_id: int
+    owner: str
+    expires_at: float
+
+
+class LeaseException(Exception):
+    """
+    Raised when machine IDs cannot be claimed, or when a lease was lost.
+    """
+
+    pass
+
+
+class LeaseBackend(ABC):
+    """
+    Base class for the storage backends that keep track of leases.
+    Implementations must guarantee that an active (unexpired) lease is never granted to more than one owner.
+    """
+
+    @abstractmethod
+    def claim(
+        self, owner: str, count: int, machine_id_bits: int, ttl: float
+    ) -> List[Lease]:
+        """
+        Atomically claims the lowest available machine IDs.
+
+        Parameters:
+            owner (str): Uniquely identifies the claimant.
+            count (int): How many machine IDs to claim.
+            machine_id_bits (int): How many bits are allocated for the machine ID; bounds the available machine IDs.
+            ttl (float): For how many seconds the leases are valid, unless renewed.
+
+        Returns:
+            List[Lease]: The claimed leases.
+
+        Raises:
+            LeaseException: If fewer than `count` machine IDs are available.
+        """
+        pass
+
+    @abstractmethod
+    def renew(
+        self, leases: List[Lease], ttl: float, timeout: Optional[float] = None
+    ) -> List[Lease]:
+        """
+        Extends the specified leases.
+
+        Parameters:
+            leases (List[Lease]): The leases to renew.
+            ttl (float): For how many seconds the leases are valid, unless renewed again.
+            timeout (Optional[float]): The longest time to wait for the backend (e.g., for a lock held by others),
+                                       in seconds; defaults to the backend's own limit.
+
+        Returns:
+            List[Lease]: The renewed leases.
+
+        Raises:
+            LeaseException: If any of the leases were claimed by another owner, or released.
+        """
+        pass
+
+    @abstractmethod
+    def release(self, leases: List[Lease]) -> None:
+        """
+        Releases the specified leases, making their machine IDs available to other owners.
+
+        Parameters:
+            leases (List[Lease]): The leases to release.
+        """
+        pass
+
+
+class SQLiteLeaseBackend(LeaseBackend):
+    """
+    Stores leases in a SQLite database. Claims are serialized by SQLite's database lock,
+    making this backend suitable for generators running on the same host (or sharing a local filesystem).
+
+    Attributes:
+        path (str): Path to the SQLite database file; it will be created if missing.
+        namespace (str): Leases are only exclusive within a namespace, allowing multiple fleets
+                         (with separate machine ID ranges) to share the same database.
+    """
+
+    def __init__(self, path: str, namespace: str = "default", timeout: float = 30.0):
+        """
+        Constructs a new instance of SQLiteLeaseBackend.
+
+        Parameters:
+            path (str): Path to the SQLite database file; it will be created if missing.
+            namespace (str): Leases are only exclusive within a namespace.
+            timeout (float): How many seconds to wait for the database lock held by other processes.
+        """
+        self.path = path
+        self.namespace = namespace
+        self.timeout = timeout
+
+        with self._transaction() as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS leases (
+                    namespace TEXT NOT NULL,
+                    machine_id INTEGER NOT NULL,
+                    owner TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, machine_id)
+                )"""
+            )
+
+    def claim(
+        self, owner: str, count: int, machine_id_bits: int, ttl: float
+    ) -> List[Lease]:
+        now = time.time()
+        max_machine_id = (1 << machine_id_bits) - 1 if machine_id_bits > 0 else 0
+
+        with self._transaction() as conn:
+            active = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT machine_id FROM leases WHERE namespace = ? AND expires_at >= ?",
+                    (self.namespace, now),
+                )
+            }
+            available = [
+                mid for mid in range(0, max_machine_id + 1) if mid not in active
+            ]
+            if len(available) < count:
+                raise LeaseException(
+                    f"Cannot claim {count} machine IDs, only {len(available)} of {max_machine_id + 1} are available"
+                )
+
+            leases = [Lease(mid, owner, now + ttl) for mid in available[:count]]
+            conn.executemany(
+                "INSERT OR REPLACE INTO leases (namespace, machine_id, owner, expires_at) VALUES (?, ?, ?, ?)",
+                [(self.namespace, *lease) for lease in leases],
+            )
+            return leases
+
+    def renew(
+        self, leases: List[Lease], ttl: float, timeout: Optional[float] = None
+    ) -> List[Lease]:
+        expires_at = time.time() + ttl
+
+        with self._transaction(timeout) as conn:
+            for lease in leases:
+                # A lease can only be renewed by its owner; expired leases are still owned until claimed by others
+                cursor = conn.execute(
+                    "UPDATE leases SET expires_at = ? WHERE namespace = ? AND machine_id = ? AND owner = ?",
+                    (expires_at, self.namespace, lease.machine_id, lease.owner),
+                )
+                if cursor.rowcount != 1:
+                    raise LeaseException(
+                        f"The lease for machine ID {lease.machine_id} was lost by {lease.owner}"
+                    )
+            return [lease._replace(expires_at=expires_at) for lease in leases]
+
+    def release(self, leases: List[Lease]) -> None:
+        with self._transaction() as conn:
+            conn.executemany(
+                "DELETE FROM leases WHERE namespace = ? AND machine_id = ? AND owner = ?",
+                [(self.namespace, lease.machine_id, lease.owner) for lease in leases],
+            )
+
+    @contextmanager
+    def _transaction(
+        self, timeout: Optional[float] = None
+    ) -> Iterator[sqlite3.Connection]:
+        # Acquire the write lock before reading, so that concurrent operations are serialized
+        if timeout is None or timeout > self.timeout:
+            timeout = self.timeout
+        conn = sqlite3.connect(self.path, timeout=timeout, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            yield conn
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+
+class LeaseManager:
+    """
+    Claims, renews, and releases the machine IDs used by a single Generator.
+
+    Leases must be renewed before they expire; otherwise, their machine IDs may be claimed by other generators,
+    resulting in duplicate identifiers. `start_renewal()` renews them in a background thread, which retries failed
+    renewals (e.g., a locked database) until the leases expire, and calls `on_lost` if a lease was claimed by others,
+    or could not be renewed before expiring, at which point the generator must stop being used.
+
+    Attributes:
+        backend (LeaseBackend): Stores the leases.
+        machine_id_bits (int): How many bits are allocated for the machine ID (must match the Generator's setting).
+        count (int): How many machine IDs to claim.
+        ttl (float): For how many seconds the leases are valid, unless renewed.
+        owner (str): Uniquely identifies this manager; randomly generated, unless specified.
+        leases (List[Lease]): The currently held leases.
+    """
+
+    def __init__(
+        self,
+        backend: LeaseBackend,
+        machine_id_bits: int,
+        count: int = 1,
+        ttl: float = 60.0,
+        owner: Optional[str] = None,
+        on_lost: Optional[Callable[[LeaseException], None]] = None,
+    ):
+        """
+        Constructs a new instance of LeaseManager.
+
+        Parameters:
+            backend (LeaseBackend): Stores the leases.
+            machine_id_bits (int): How many bits are allocated for the machine ID (must match the Generator's setting).
+            count (int): How many machine IDs to claim.
+            ttl (float): For how many seconds the leases are valid, unless renewed.
+            owner (Optional[str]): Uniquely identifies this manager; randomly generated, unless specified.
+            on_lost (Optional[Callable[[LeaseException], None]]): Called from the background renewal thread,
+                                                                  if the leases were lost, or expired.
+        """
+        if count < 1:
+            raise LeaseException(
+                f"At least one machine ID must be claimed, got: {count}"
+            )
+        if ttl <= 0:
+            raise LeaseException(f"The lease TTL must be positive, got: {ttl}")
+
+        self.backend = backend
+        self.machine_id_bits = machine_id_bits
+        self.count = count
+        self.ttl = ttl
+        self.owner = owner if owner is not None else uuid.uuid4().hex
+        self.on_lost = on_lost
+        self.leases: List[Lease] = []
+
+        self._stop = threading.Event()
+        self._renewal: Optional[threading.Thread] = None
+
+    @property
+    def machine_ids(self) -> List[int]:
+        """The machine IDs currently held, which can be passed to a Generator."""
+        return [lease.machine_id for lease in self.leases]
+
+    def acquire(self) -> List[int]:
+        """
+        Claims the configured number of machine IDs.
+
+        Returns:
+            List[int]: The claimed machine IDs.
+
+        Raises:
+            LeaseException: If not enough machine IDs are available.
+        """
+        if self.leases:
+            raise LeaseException(
+                f"Machine IDs were already claimed: {self.machine_ids}"
+            )
+
+        self.leases = self.backend.claim(
+            self.owner, self.count, self.machine_id_bits, self.ttl
+        )
+        return self.machine_ids
+
+    def renew(self, timeout: Optional[float] = None) -> None:
+        """
+        Extends the held leases by the configured TTL.
+
+        Parameters:
+            timeout (Optional[float]): The longest time to wait for the backend, in seconds.
+
+        Raises:
+            LeaseException: If any of the leases were lost.
+        """
+        self.leases = self.backend.renew(self.leases, self.ttl, timeout)
+
+    def release(self) -> None:
+        """Stops the background renewal (if started), and releases all held leases."""
+
+        self.stop_renewal()
+        if self.leases:
+            self.backend.release(self.leases)
+            self.leases = []
+
+    def start_renewal(self, interval: Optional[float] = None) -> None:
+        """
+        Starts renewing the held leases in a background (daemon) thread.
+
+        Parameters:
+            interval (Optional[float]): How often to renew, in seconds; defaults to a third of the TTL.
+                                        Failed renewals are retried sooner (at least 10 times per TTL).
+
+        Raises:
+            LeaseException: If no leases are held (i.e., before `acquire()`, or after `release()`).
+        """
+        if self._renewal is not None:
+            return
+        if not self.leases:
+            raise LeaseException("No leases are held; call acquire() first")
+
+        self._stop.clear()
+        period = interval if interval is not None else self.ttl / 3
+        self._renewal = threading.Thread(
+            target=self._renew_periodically,
+            args=(period,),
+            name=f"jazzy-fish-lease-{self.owner}",
+            daemon=True,
+        )
+        self._renewal.start()
+
+    def stop_renewal(self) -> None:
+        """Stops renewing the held leases in the background."""
+
+        if self._renewal is None:
+            return
+        self._stop.set()
+        self._renewal.join()
+        self._renewal = None
+
+    def __enter__(self) -> "LeaseManager":
+        self.acquire()
+        self.start_renewal()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
+
+    def _renew_periodically(self, interval: float) -> None:
+        wait = interval
+        error: Optional[Exception] = None
+        while not self._stop.wait(wait):
+            if not self.leases:
+                # Released without stopping the renewal first: there is nothing left to renew
+                return
+
+            # Backend operations must not outlast the leases, which could be claimed by others in the meantime
+            remaining = self._expires_at() - time.time()
+            if remaining <= 0:
+                lost = LeaseException(
+                    f"The leases for machine IDs {self.machine_ids} expired before they could be renewed: {error}"
+                )
+                lost.__cause__ = error
+                self._lost(lost)
+                return
+
+            try:
+                self.renew(timeout=remaining)
+                wait = interval
+                error = None
+            except LeaseException as e:
+                self._lost(e)
+                return
+            except Exception as e:
+                # Any other error (e.g., sqlite3.OperationalError: database is locked) may be transient
+                error = e
+                wait = min(
+                    interval, self.ttl / 10, max(self._expires_at() - time.time(), 0)
+                )
+
+    def _expires_at(self) -> float:
+        return min(lease.expires_at for lease in self.leases)
+
+    def _lost(self, e: LeaseException) -> None:
+        if self.on_lost is not None:
+            self.on_lost(e)
@@ -0,0 +1,215 @@
+"""
+Metrics
+=======
+
+Contains the classes that record how a Generator behaves under load.
+Metrics are disabled unless a GeneratorMetrics instance is passed to a Generator, in which case
+each recorded event costs a counter update, plus a call to each of the configured hooks.
+
+Classes:
+    GeneratorMetrics - Records a Generator's counters and histograms, and forwards events to optional hooks.
+    Histogram - Counts observed values in fixed buckets.
+    HistogramSnapshot - A point-in-time copy of a Histogram.
+    MetricsSnapshot - A point-in-time copy of a Generator's metrics.
+"""
+
+from bisect import bisect_left
+from collections import defaultdict
+import threading
+from types import MappingProxyType
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+# Default histogram bucket upper bounds, in seconds
+DEFAULT_BUCKETS: Sequence[float] = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    60.0,
+)
+
+# Names of the events passed to hooks
+IDS_ISSUED = "ids_issued"
+SEQUENCE_EXHAUSTED = "sequence_exhausted"
+WAIT = "wait"
+CLOCK_REGRESSION = "clock_regression"
+LOCK_WAIT = "lock_wait"
+
+# Receives the event name, and its value (a count, or a duration in seconds)
+Hook = Callable[[str, float], None]
+
+
+class HistogramSnapshot(NamedTuple):
+    """A point-in-time (immutable) copy of a Histogram; the last bucket counts values larger than all bounds."""
+
+    bounds: Sequence[float]
+    counts: Sequence[int]
+    observations: int
+    total: float
+
+
+class Histogram:
+    """
+    Counts observed values in fixed buckets. Updates are not synchronized.
+
+    Attributes:
+        bounds (Sequence[float]): The (inclusive) upper bounds of each bucket, in increasing order.
+    """
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Constructs a new instance of Histogram.
+
+        Parameters:
+            bounds (Sequence[float]): The (inclusive) upper bounds of each bucket, in increasing order.
+        """
+        self.bounds = tuple(bounds)
+        self._counts = [0] * (len(self.bounds) + 1)
+        self._count = 0
+        self._total = 0.0
+
+    def observe(self, value: float) -> None:
+        """Records the specified value."""
+
+        self._counts[bisect_left(self.bounds, value)] += 1
+        self._count += 1
+        self._total += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        """Returns a point-in-time copy of the histogram."""
+
+        return HistogramSnapshot(
+            self.bounds, tuple(self._counts), self._count, self._total
+        )
+
+
+class MetricsSnapshot(NamedTuple):
+    """
+    A point-in-time (immutable) copy of a Generator's metrics.
+
+    Attributes:
+        ids_issued (Mapping[int, int]): How many identifiers were generated, for each machine ID (read-only).
+        sequence_exhaustions (int): How many times all sequences of a time unit were exhausted.
+        wait_time (HistogramSnapshot): Time spent waiting for the next time unit, in seconds.
+        clock_regressions (int): How many times the clock was observed going backwards.
+        lock_wait_time (HistogramSnapshot): Time spent waiting for the generator's lock, in seconds.
+        seconds_until_overflow (Optional[float]): How long until the generated identifiers exceed the configured
+                                                  maximum value (e.g., an encoder's `get_max()`); None if not configured.
+    """
+
+    ids_issued: Mapping[int, int]
+    sequence_exhaustions: int
+    wait_time: HistogramSnapshot
+    clock_regressions: int
+    lock_wait_time: HistogramSnapshot
+    seconds_until_overflow: Optional[float]
+
+
+class GeneratorMetrics:
+    """
+    Records a Generator's counters and histograms, and forwards each event to the configured hooks.
+    Updates and snapshots are guarded by a lock, so that snapshots can be taken while other threads
+    generate identifiers; hooks are called outside of it. Call `Generator.metrics_snapshot()` to read the metrics.
+
+    Attributes:
+        max_value (Optional[int]): If set (e.g., to an encoder's `get_max()`), snapshots include
+                                   how long until the generated identifiers exceed it.
+        hooks (List[Hook]): Called with each event's name and value.
+    """
+
+    def __init__(
+        self,
+        max_value: Optional[int] = None,
+        hooks: Optional[Iterable[Hook]] = None,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """
+        Constructs a new instance of GeneratorMetrics.
+
+        Parameters:
+            max_value (Optional[int]): If set (e.g., to an encoder's `get_max()`), snapshots include
+                                       how long until the generated identifiers exceed it.
+            hooks (Optional[Iterable[Hook]]): Called with each event's name and value.
+            buckets (Sequence[float]): The upper bounds of the histogram buckets, in seconds.
+        """
+        self.max_value = max_value
+        self.hooks: List[Hook] = list(hooks) if hooks is not None else []
+        self.buckets = buckets
+
+        self.ids_issued: Dict[int, int] = defaultdict(int)
+        self.sequence_exhaustions = 0
+        self.wait_time = Histogram(buckets)
+        self.clock_regressions = 0
+        self.lock_wait_time = Histogram(buckets)
+        self._lock = threading.Lock()
+
+    def record_issued(self, machine_id: int, count: int) -> None:
+        """Records identifiers generated for the specified machine ID."""
+
+        with self._lock:
+            self.ids_issued[machine_id] += count
+        for hook in self.hooks:
+            hook(IDS_ISSUED, count)
+
+    def record_sequence_exhausted(self) -> None:
+        """Records that all sequences of a time unit were exhausted."""
+
+        with self._lock:
+            self.sequence_exhaustions += 1
+        for hook in self.hooks:
+            hook(SEQUENCE_EXHAUSTED, 1)
+
+    def record_wait(self, seconds: float) -> None:
+        """Records time spent waiting for the next time unit."""
+
+        with self._lock:
+            self.wait_time.observe(seconds)
+        for hook in self.hooks:
+            hook(WAIT, seconds)
+
+    def record_clock_regression(self) -> None:
+        """Records that the clock was observed going backwards."""
+
+        with self._lock:
+            self.clock_regressions += 1
+        for hook in self.hooks:
+            hook(CLOCK_REGRESSION, 1)
+
+    def record_lock_wait(self, seconds: float) -> None:
+        """Records time spent waiting for the generator's lock."""
+
+        with self._lock:
+            self.lock_wait_time.observe(seconds)
+        for hook in self.hooks:
+            hook(LOCK_WAIT, seconds)
+
+    def snapshot(
+        self, seconds_until_overflow: Optional[float] = None
+    ) -> MetricsSnapshot:
+        """Returns a point-in-time copy of the metrics."""
+
+        with self._lock:
+            return MetricsSnapshot(
+                ids_issued=MappingProxyType(dict(self.ids_issued)),
+                sequence_exhaustions=self.sequence_exhaustions,
+                wait_time=self.wait_time.snapshot(),
+                clock_regressions=self.clock_regressions,
+                lock_wait_time=self.lock_wait_time.snapshot(),
+                seconds_until_overflow=seconds_until_overflow,
+            )
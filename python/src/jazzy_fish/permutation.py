@@ -0,0 +1,232 @@
+"""
+Permutation
+===========
+
+Contains the FeistelPermutation class, which shuffles integers within a range with a keyed, reversible permutation,
+used by a WordEncoder (configured with a `permutation_key`) to encode sequential identifiers to unrelated keyphrases.
+
+Classes:
+    FeistelPermutation - A keyed bijection over [0, domain), built from a Feistel network and cycle walking.
+"""
+
+import hashlib
+from typing import Any, Iterable, List, Sequence, Union
+
+from ._compat import require_numpy
+
+# Four rounds suffice with a random round function; the others make up for the (non-cryptographic) mixing function
+DEFAULT_ROUNDS = 6
+
+# Halves are mixed as 64-bit integers
+_MASK64 = (1 << 64) - 1
+_MAX_DOMAIN_BITS = 128
+
+# Multipliers of the 64-bit mixing function (from SplitMix64's finalizer)
+_MIX1 = 0xBF58476D1CE4E5B9
+_MIX2 = 0x94D049BB133111EB
+_MIX_SHIFT = 29
+
+
+class FeistelPermutation:
+    """
+    A keyed bijection over [0, domain): every integer in the range is mapped to a distinct integer in the range,
+    and can be mapped back, without storing any state other than the key.
+
+    Integers are split into two halves (of the smallest number of bits that holds the domain), which are mixed
+    by a Feistel network, whose round function hashes one half with a round key derived from the key.
+    Since the network permutes a power-of-two range, results outside of the domain are encrypted again
+    (cycle walking) until they fall inside, which takes fewer than two passes on average (for domains above 2).
+
+    The permutation hides the order in which identifiers were created, but it is not a cipher: do not rely on it
+    to protect identifiers from an attacker that can observe many of them.
+
+    Attributes:
+        domain (int): The size of the permuted range.
+        rounds (int): The number of Feistel rounds.
+    """
+
+    def __init__(
+        self, key: Union[bytes, str], domain: int, rounds: int = DEFAULT_ROUNDS
+    ):
+        """
+        Constructs a new instance of FeistelPermutation.
+
+        Parameters:
+            key (Union[bytes, str]): The secret that selects the permutation (1 to 64 bytes, or a string).
+            domain (int): The size of the permuted range.
+            rounds (int): The number of Feistel rounds; must be even and at least 4.
+        """
+        if isinstance(key, str):
+            key = key.encode("utf-8")
+        if not 1 <= len(key) <= hashlib.blake2b.MAX_KEY_SIZE:
+            raise ValueError(
+                f"The key must contain between 1 and {hashlib.blake2b.MAX_KEY_SIZE} bytes, got: {len(key)}"
+            )
+        if domain < 1:
+            raise ValueError(f"The domain must be positive, got: {domain}")
+        if rounds < 4 or rounds % 2:
+            raise ValueError(f"The rounds must be even, and at least 4, got: {rounds}")
+
+        # Halves of at least one bit each, which fit a 64-bit round function
+        bits = max((domain - 1).bit_length(), 2)
+        if bits > _MAX_DOMAIN_BITS:
+            raise ValueError(
+                f"The domain must not exceed 2^{_MAX_DOMAIN_BITS}, got: {domain}"
+            )
+
+        self.domain = domain
+        self.rounds = rounds
+        self._high_bits = bits // 2
+        self._low_bits = bits - self._high_bits
+
+        # Derive independent round keys, which also depend on the domain, so that ranges of different sizes
+        # (e.g., wordlists) are not permuted alike
+        self._round_keys = [
+            int.from_bytes(
+                hashlib.blake2b(
+                    f"{domain}:{i}".encode(), key=key, digest_size=8
+                ).digest(),
+                "big",
+            )
+            for i in range(rounds)
+        ]
+
+        # Each round combines a half with the top bits of the other (mixed) half, alternating between the two halves
+        self._round_shifts = [
+            64 - (self._high_bits if i % 2 == 0 else self._low_bits)
+            for i in range(rounds)
+        ]
+
+    def permute(self, value: int) -> int:
+        """
+        Maps an integer to its position in the permutation.
+
+        Parameters:
+            value (int): An integer in [0, domain).
+
+        Returns:
+            int: The permuted integer, in [0, domain).
+        """
+        self._check(value)
+        value = self._encrypt(value)
+        while value >= self.domain:
+            value = self._encrypt(value)
+        return value
+
+    def invert(self, value: int) -> int:
+        """
+        Maps a permuted integer back to the integer that produced it.
+
+        Parameters:
+            value (int): A permuted integer in [0, domain).
+
+        Returns:
+            int: The original integer, such that `permute(result) == value`.
+        """
+        self._check(value)
+        value = self._decrypt(value)
+        while value >= self.domain:
+            value = self._decrypt(value)
+        return value
+
+    def permute_many(self, values: Iterable[int]) -> List[int]:
+        """
+        Permutes multiple integers with vectorized NumPy operations (one pass per round, for all values),
+        returning the same integers as calling `permute()` for each of them. Requires the optional `numpy` dependency.
+
+        Parameters:
+            values (Iterable[int]): The integers to permute; an integer array, a list, or any other iterable.
+
+        Returns:
+            List[int]: The permuted integers, in the same order.
+        """
+        return self._walk_many(values, self._encrypt_array, self.permute).tolist()
+
+    def invert_many(self, values: Iterable[int]) -> List[int]:
+        """
+        Inverts multiple permuted integers, returning the same integers as calling `invert()` for each of them.
+        Requires the optional `numpy` dependency.
+
+        Parameters:
+            values (Iterable[int]): The permuted integers; an integer array, a list, or any other iterable.
+
+        Returns:
+            List[int]: The original integers, in the same order.
+        """
+        return self._walk_many(values, self._decrypt_array, self.invert).tolist()
+
+    def _check(self, value: int) -> None:
+        if not 0 <= value < self.domain:
+            raise ValueError(
+                f"The value ({value}) must be between 0 and {self.domain - 1}"
+            )
+
+    def _encrypt(self, value: int) -> int:
+        # Each round replaces the high half with the low half, and the low half with the high half,
+        # combined with the mixed low half (the mixing function is inlined, since it dominates the cost)
+        high, low = value >> self._low_bits, value & ((1 << self._low_bits) - 1)
+        for round_key, shift in zip(self._round_keys, self._round_shifts):
+            mixed = ((low ^ round_key) * _MIX1) & _MASK64
+            mixed = ((mixed ^ (mixed >> _MIX_SHIFT)) * _MIX2) & _MASK64
+            high, low = low, high ^ (mixed >> shift)
+        return (high << self._low_bits) | low
+
+    def _decrypt(self, value: int) -> int:
+        # Undoes the rounds of _encrypt(), in reverse order
+        high, low = value >> self._low_bits, value & ((1 << self._low_bits) - 1)
+        for round_key, shift in zip(
+            reversed(self._round_keys), reversed(self._round_shifts)
+        ):
+            mixed = ((high ^ round_key) * _MIX1) & _MASK64
+            mixed = ((mixed ^ (mixed >> _MIX_SHIFT)) * _MIX2) & _MASK64
+            high, low = low ^ (mixed >> shift), high
+        return (high << self._low_bits) | low
+
+    def _walk_many(self, values: Iterable[int], crypt: Any, scalar: Any) -> Any:
+        # Applies the (vectorized) network to all values, then again to the ones that fell outside of the domain
+        numpy = require_numpy()
+        # Iterators (e.g., generators) would otherwise become a single object
+        if not isinstance(values, (numpy.ndarray, Sequence)):
+            values = list(values)
+        if self.domain > 1 << 63:
+            return numpy.array([scalar(int(value)) for value in values], dtype=object)
+
+        array = numpy.asarray(values).reshape(-1)
+        if array.size and (array.min() < 0 or array.max() >= self.domain):
+            # Raise the same error as the scalar method, for the first invalid value
+            invalid = numpy.flatnonzero((array < 0) | (array >= self.domain))
+            self._check(int(array[invalid[0]]))
+
+        result = crypt(array.astype(numpy.uint64))
+        outside = numpy.flatnonzero(result >= self.domain)
+        while outside.size:
+            walked = crypt(result[outside])
+            result[outside] = walked
+            outside = outside[walked >= self.domain]
+        return result.astype(numpy.int64)
+
+    def _encrypt_array(self, values: Any) -> Any:
+        numpy = require_numpy()
+        low_bits = numpy.uint64(self._low_bits)
+        high, low = values >> low_bits, values & numpy.uint64((1 << self._low_bits) - 1)
+        for round_key, shift in zip(self._round_keys, self._round_shifts):
+            mixed = _mix_array(numpy, low ^ numpy.uint64(round_key))
+            high, low = low, high ^ (mixed >> numpy.uint64(shift))
+        return (high << low_bits) | low
+
+    def _decrypt_array(self, values: Any) -> Any:
+        numpy = require_numpy()
+        low_bits = numpy.uint64(self._low_bits)
+        high, low = values >> low_bits, values & numpy.uint64((1 << self._low_bits) - 1)
+        for round_key, shift in zip(
+            reversed(self._round_keys), reversed(self._round_shifts)
+        ):
+            mixed = _mix_array(numpy, high ^ numpy.uint64(round_key))
+            high, low = low ^ (mixed >> numpy.uint64(shift)), high
+        return (high << low_bits) | low
+
+
+def _mix_array(numpy: Any, values: Any) -> Any:
+    # The mixing function of _encrypt(), for an uint64 array (whose multiplications wrap around)
+    values = values * numpy.uint64(_MIX1)
+    return (values ^ (values >> numpy.uint64(_MIX_SHIFT))) * numpy.uint64(_MIX2)
@@ -0,0 +1,251 @@
+"""
+Pool
+====
+
+Contains the IdPool class, which pre-generates identifiers (and optionally their keyphrases) in a background thread,
+so that consumers never wait for the next time unit, once the generator's sequences are exhausted.
+
+Classes:
+    IdPool - Keeps a bounded queue of ready identifiers, refilled by a background thread.
+    PoolStats - A point-in-time copy of an IdPool's counters.
+"""
+
+from collections import deque
+import threading
+from typing import Deque, List, NamedTuple, Optional, Union
+
+from .encoder import EncoderException, KeyPhrase, WordEncoder
+from .generator import Generator, GeneratorException
+
+
+class PoolStats(NamedTuple):
+    """
+    A point-in-time copy of an IdPool's counters.
+
+    Attributes:
+        hits (int): How many identifiers were served from the pool.
+        misses (int): How many identifiers were generated on demand, because the pool was empty.
+        size (int): How many identifiers are ready to be served.
+    """
+
+    hits: int
+    misses: int
+    size: int
+
+
+class IdPool:
+    """
+    Keeps a bounded queue of ready identifiers, refilled by a background (daemon) thread.
+
+    Whenever fewer than `low_watermark` identifiers are ready, the thread refills the queue up to `high_watermark`,
+    in chunks of at most one time unit's worth of identifiers, which are served as soon as each chunk is ready.
+    Consumers pop identifiers in O(1); if the pool is empty (a miss), the identifier is generated on demand,
+    which may wait for the next time unit, and for the chunk being generated (but not for the rest of the refill).
+    Identifiers are unique, but since the pool is filled ahead of time, they are not ordered by the time they were served.
+
+    The pool serializes all calls to the generator, which must not be used directly while the pool is running.
+    If a refill fails, the error is raised by the next call to `next_id()` or `next_keyphrase()`,
+    after which the refill is retried.
+
+    Attributes:
+        generator (Generator): Generates the identifiers.
+        encoder (Optional[WordEncoder]): If set, the keyphrases are also encoded ahead of time.
+        high_watermark (int): The maximum number of ready identifiers.
+        low_watermark (int): Refills are triggered when fewer identifiers are ready.
+        hits (int): How many identifiers were served from the pool.
+        misses (int): How many identifiers were generated on demand, because the pool was empty.
+    """
+
+    def __init__(
+        self,
+        generator: Generator,
+        encoder: Optional[WordEncoder] = None,
+        high_watermark: int = 1024,
+        low_watermark: Optional[int] = None,
+    ):
+        """
+        Constructs a new instance of IdPool; call `start()` (or use it as a context manager) to start refilling it.
+
+        Parameters:
+            generator (Generator): Generates the identifiers.
+            encoder (Optional[WordEncoder]): If set, the keyphrases are also encoded ahead of time.
+            high_watermark (int): The maximum number of ready identifiers.
+            low_watermark (Optional[int]): Refills are triggered when fewer identifiers are ready;
+                                           defaults to a quarter of the high watermark.
+        """
+        if high_watermark < 1:
+            raise GeneratorException(
+                f"The high watermark must be positive, got: {high_watermark}"
+            )
+        if low_watermark is None:
+            low_watermark = max(high_watermark // 4, 1)
+        if not 0 < low_watermark <= high_watermark:
+            raise GeneratorException(
+                f"The low watermark must be between 1 and {high_watermark}, got: {low_watermark}"
+            )
+
+        self.generator = generator
+        self.encoder = encoder
+        self.high_watermark = high_watermark
+        self.low_watermark = low_watermark
+        self.hits = 0
+        self.misses = 0
+
+        self._items: Deque[Union[int, KeyPhrase]] = deque()
+        self._refill = threading.Condition()
+        self._generator_lock = threading.Lock()
+        self._stopped = False
+        self._producer: Optional[threading.Thread] = None
+        self._error: Optional[Exception] = None
+        # Consumers that are generating identifiers on demand, which the producer lets through between chunks
+        self._misses_pending = 0
+        # The identifiers of one time unit, for all owned machine IDs
+        self._chunk_size = (generator.max_sequence + 1) * len(generator.machine_ids)
+
+    @property
+    def size(self) -> int:
+        """How many identifiers are ready to be served."""
+        return len(self._items)
+
+    def next_id(self) -> int:
+        """
+        Returns a ready identifier, or generates one on demand if the pool is empty.
+
+        Returns:
+            int: A unique integer identifier.
+        """
+
+        item = self._take()
+        return item if isinstance(item, int) else item.id
+
+    def next_keyphrase(self) -> KeyPhrase:
+        """
+        Returns a ready keyphrase, or generates and encodes one on demand if the pool is empty.
+
+        Returns:
+            KeyPhrase: The keyphrase of a unique integer identifier.
+
+        Raises:
+            EncoderException: If the pool was not configured with an encoder.
+        """
+
+        if self.encoder is None:
+            raise EncoderException("The pool was not configured with an encoder")
+
+        item = self._take()
+        assert isinstance(item, KeyPhrase)
+        return item
+
+    def stats(self) -> PoolStats:
+        """Returns a point-in-time copy of the pool's counters."""
+
+        with self._refill:
+            return PoolStats(self.hits, self.misses, len(self._items))
+
+    def start(self) -> None:
+        """Starts refilling the pool in a background (daemon) thread."""
+
+        if self._producer is not None:
+            return
+
+        self._stopped = False
+        self._producer = threading.Thread(
+            target=self._produce, name="jazzy-fish-pool", daemon=True
+        )
+        self._producer.start()
+
+    def close(self) -> None:
+        """Stops refilling the pool; ready identifiers can still be served."""
+
+        if self._producer is None:
+            return
+
+        with self._refill:
+            self._stopped = True
+            self._refill.notify()
+        self._producer.join()
+        self._producer = None
+
+    def __enter__(self) -> "IdPool":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _take(self) -> Union[int, KeyPhrase]:
+        with self._refill:
+            if self._error is not None:
+                # The last refill failed: report it, and let the producer retry
+                error, self._error = self._error, None
+                self._refill.notify()
+                raise error
+
+            if self._items:
+                item = self._items.popleft()
+                self.hits += 1
+                if len(self._items) < self.low_watermark:
+                    self._refill.notify()
+                return item
+
+            self.misses += 1
+            self._misses_pending += 1
+
+        try:
+            with self._generator_lock:
+                id = self.generator.next_id()
+        finally:
+            with self._refill:
+                self._misses_pending -= 1
+                self._refill.notify()
+        return id if self.encoder is None else self.encoder.encode(id)
+
+    def _produce(self) -> None:
+        while True:
+            # Start a refill below the low watermark, and let on-demand consumers go first, between chunks
+            with self._refill:
+                self._refill.wait_for(
+                    lambda: self._stopped
+                    or (
+                        len(self._items) < self.low_watermark
+                        and not self._misses_pending
+                    )
+                )
+                if self._stopped:
+                    return
+
+            while True:
+                with self._refill:
+                    self._refill.wait_for(
+                        lambda: self._stopped or not self._misses_pending
+                    )
+                    missing = self.high_watermark - len(self._items)
+                    if self._stopped or missing <= 0:
+                        break
+                requested = min(missing, self._chunk_size)
+
+                try:
+                    # At most one time unit is generated (and waited for) while holding the lock
+                    with self._generator_lock:
+                        ids = self.generator.next_ids(requested)
+                    items: List[Union[int, KeyPhrase]] = (
+                        list(ids)
+                        if self.encoder is None
+                        else [self.encoder.encode(id) for id in ids]
+                    )
+                except Exception as error:
+                    # Raised by the next consumer, which also wakes up the producer to retry
+                    with self._refill:
+                        self._error = error
+                        self._refill.wait_for(
+                            lambda: self._stopped or self._error is None
+                        )
+                    break
+
+                with self._refill:
+                    self._items.extend(items)
+
+                if len(ids) < requested:
+                    # The wait strategy gave up; retry once the next time unit starts
+                    with self._refill:
+                        self._refill.wait(self.generator.seconds_until_next_time())
@@ -0,0 +1,115 @@
+"""
+Prefix
+======
+
+Contains the PrefixIndex class, which finds the words of a word list that start with a prefix,
+used by `WordEncoder.complete()` and `WordEncoder.prefix_ranges()` to autocomplete partial keyphrases
+and abbreviations, and to translate them into the identifier ranges that they cover.
+
+Classes:
+    Completion - Represents a completed partial keyphrase (or abbreviation), and the identifiers it covers.
+    PrefixIndex - Finds the positions of the strings that start with a prefix, in sorted order.
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import List, NamedTuple, Sequence, Tuple
+
+
+class Completion(NamedTuple):
+    """
+    Represents a completed partial keyphrase (or abbreviation), and the identifiers it covers.
+
+    Attributes:
+        phrase (str): The partial keyphrase, with its last (partial) word completed.
+        start (int): The first identifier whose keyphrase starts with the completed phrase.
+        end (int): The identifier after the last one whose keyphrase starts with the completed phrase.
+    """
+
+    phrase: str
+    start: int
+    end: int
+
+
+class PrefixIndex:
+    """
+    Finds the positions of the strings that start with a prefix, using a binary search over the sorted strings.
+
+    Word lists are sorted, so that the strings that share a prefix occupy a contiguous range of positions,
+    which is searched directly. Otherwise (e.g., abbreviations that do not start with the first character),
+    the positions are sorted by string, once.
+    """
+
+    def __init__(self, keys: Sequence[str]):
+        """
+        Constructs a new instance of PrefixIndex.
+
+        Parameters:
+            keys (Sequence[str]): The strings to index, by position; they are not copied, if already sorted.
+        """
+        self._sorted = all(keys[i] <= keys[i + 1] for i in range(len(keys) - 1))
+        if self._sorted:
+            self._keys = keys
+            self._positions = array("I")
+        else:
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            self._keys = [keys[i] for i in order]
+            self._positions = array("I", order)
+
+    def find(self, prefix: str) -> range:
+        """
+        Finds the strings that start with a prefix.
+
+        Parameters:
+            prefix (str): The prefix to search for; an empty prefix matches all strings.
+
+        Returns:
+            range: The ranks (in sorted order) of the matching strings, which `key()` and `position()` resolve.
+        """
+
+        return range(*self._bounds(prefix))
+
+    def key(self, rank: int) -> str:
+        """Returns the string with the specified rank, in sorted order."""
+        return self._keys[rank]
+
+    def position(self, rank: int) -> int:
+        """Returns the position of the string with the specified rank, in sorted order."""
+        return rank if self._sorted else self._positions[rank]
+
+    def ranges(self, prefix: str) -> List[range]:
+        """
+        Finds the positions of the strings that start with a prefix, as contiguous ranges.
+
+        Parameters:
+            prefix (str): The prefix to search for.
+
+        Returns:
+            List[range]: The ranges of matching positions, in ascending order; a single range if the strings are sorted.
+        """
+
+        lo, hi = self._bounds(prefix)
+        if lo == hi:
+            return []
+        if self._sorted:
+            return [range(lo, hi)]
+
+        ranges: List[range] = []
+        start = end = -1
+        for position in sorted(self._positions[lo:hi]):
+            if position != end:
+                if end != -1:
+                    ranges.append(range(start, end))
+                start = position
+            end = position + 1
+        ranges.append(range(start, end))
+        return ranges
+
+    def _bounds(self, prefix: str) -> Tuple[int, int]:
+        # The range of sorted strings that start with the prefix
+        if not prefix:
+            return 0, len(self._keys)
+
+        lo = bisect_left(self._keys, prefix)
+        successor = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        return lo, bisect_left(self._keys, successor, lo)
@@ -0,0 +1,188 @@
+"""
+Registry
+========
+
+Contains the WordlistRegistry class, which loads each wordlist once per process and shares it (along with
+its indexes and precomputed values) between all of the WordEncoders that use it, regardless of their configuration.
+
+Classes:
+    WordlistRegistry - Loads and caches wordlists, and the WordEncoders configured with them.
+
+Functions:
+    get_encoder - Returns the shared WordEncoder for the specified wordlist and configuration.
+    get_wordlist - Returns the shared instance of the specified wordlist.
+"""
+
+from pathlib import Path
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .encoder import DEFAULT_WORD_ORDER, WordEncoder, Wordlist
+from .verification import VerificationCache
+
+# Identifies a loaded wordlist: its name, package, and word order
+_WordlistKey = Tuple[str, Optional[str], Tuple[str, ...]]
+
+# Identifies an encoder's configuration: its wordlist, minimum phrase size, and separator
+_EncoderKey = Tuple[_WordlistKey, int, str]
+
+
+class WordlistRegistry:
+    """
+    Loads each wordlist once, keyed by its name, package, and word order, and returns the same instance
+    on subsequent calls. Also caches one WordEncoder per configuration, which share their wordlist's indexes
+    and precomputed values (e.g., maximum encodable values). Instances can be shared across threads.
+
+    Returned wordlists and encoders are shared, and must not be modified.
+
+    Attributes:
+        compact (bool): If true, wordlists store their words and indexes in compact, array-backed structures.
+        indexes (Iterable[str]): The reverse indexes to build eagerly, when loading wordlists.
+        verify_checksum (bool): If true, verifies that the name and checksum of each wordlist matches its contents.
+        verification_cache (Optional[VerificationCache]): If set, skips verifying files that were already verified.
+    """
+
+    def __init__(
+        self,
+        compact: bool = False,
+        indexes: Iterable[str] = (),
+        verify_checksum: bool = True,
+        verification_cache: Optional[VerificationCache] = None,
+    ):
+        """
+        Constructs a new instance of WordlistRegistry.
+
+        Parameters:
+            compact (bool): If true, stores the words and their indexes in compact, array-backed structures.
+            indexes (Iterable[str]): The reverse indexes to build eagerly (WORD_INDEX, and/or ABBR_INDEX).
+            verify_checksum (bool): If true, will verify that the name and checksum of each wordlist matches its contents.
+            verification_cache (Optional[VerificationCache]): If set, skips verifying files that were already verified
+                                                              (and not modified since), and records new verifications.
+        """
+        self.compact = compact
+        self.indexes = tuple(indexes)
+        self.verify_checksum = verify_checksum
+        self.verification_cache = verification_cache
+
+        self._lock = threading.Lock()
+        self._wordlists: Dict[_WordlistKey, Wordlist] = {}
+        self._encoders: Dict[_EncoderKey, WordEncoder] = {}
+
+    def get_wordlist(
+        self,
+        from_path: str,
+        package_name: Optional[str] = None,
+        word_order: List[str] = DEFAULT_WORD_ORDER,
+    ) -> Wordlist:
+        """
+        Returns the shared instance of the specified wordlist, loading it on first use.
+        Wordlists are identified by their name (which includes their checksum), not by their full path.
+
+        Parameters:
+            from_path (str): Specifies a directory that contains a wordlist.
+            package_name (Optional[str]): If specified, the path will be loaded from a package.
+            word_order (List[str]): Specifies the order in which the words will be loaded.
+
+        Returns:
+            Wordlist: The shared Wordlist instance.
+        """
+
+        key = (Path(from_path).name, package_name, tuple(word_order))
+        with self._lock:
+            return self._get_wordlist(key, from_path)
+
+    def get_encoder(
+        self,
+        from_path: str,
+        package_name: Optional[str] = None,
+        word_order: List[str] = DEFAULT_WORD_ORDER,
+        min_phrase_size: Optional[int] = None,
+        separator: str = "-",
+    ) -> WordEncoder:
+        """
+        Returns the shared WordEncoder for the specified wordlist and configuration, creating it on first use.
+
+        Parameters:
+            from_path (str): Specifies a directory that contains a wordlist.
+            package_name (Optional[str]): If specified, the path will be loaded from a package.
+            word_order (List[str]): Specifies the order in which the words will be loaded.
+            min_phrase_size (Optional[int]): What is the minimum sequence that should be returned.
+                                             If not provided, it will default to the number of word lists.
+            separator (str): The separator character used to delimit sequence parts.
+
+        Returns:
+            WordEncoder: The shared WordEncoder instance.
+        """
+
+        wordlist_key = (Path(from_path).name, package_name, tuple(word_order))
+        with self._lock:
+            wordlist = self._get_wordlist(wordlist_key, from_path)
+
+            # Equivalent configurations share the same encoder
+            if min_phrase_size is None:
+                min_phrase_size = wordlist._max_words_in_phrase
+            key = (wordlist_key, min_phrase_size, separator)
+
+            encoder = self._encoders.get(key)
+            if encoder is None:
+                encoder = WordEncoder(wordlist, min_phrase_size, separator)
+                self._encoders[key] = encoder
+            return encoder
+
+    def clear(self) -> None:
+        """Forgets all loaded wordlists and encoders; instances that were already returned remain usable."""
+
+        with self._lock:
+            self._wordlists.clear()
+            self._encoders.clear()
+
+    def _get_wordlist(self, key: _WordlistKey, from_path: str) -> Wordlist:
+        # Called while holding the lock, so that each wordlist is only loaded once
+        wordlist = self._wordlists.get(key)
+        if wordlist is None:
+            _, package_name, word_order = key
+            wordlist = Wordlist.load(
+                from_path,
+                package_name,
+                word_order=list(word_order),
+                compact=self.compact,
+                indexes=self.indexes,
+                verify_checksum=self.verify_checksum,
+                verification_cache=self.verification_cache,
+            )
+            self._wordlists[key] = wordlist
+        return wordlist
+
+
+# The process-wide registry used by get_wordlist() and get_encoder()
+_registry = WordlistRegistry()
+
+
+def get_wordlist(
+    from_path: str,
+    package_name: Optional[str] = None,
+    word_order: List[str] = DEFAULT_WORD_ORDER,
+) -> Wordlist:
+    """
+    Returns the process-wide shared instance of the specified wordlist, loading it on first use.
+    See `WordlistRegistry.get_wordlist()`.
+    """
+
+    return _registry.get_wordlist(from_path, package_name, word_order)
+
+
+def get_encoder(
+    from_path: str,
+    package_name: Optional[str] = None,
+    word_order: List[str] = DEFAULT_WORD_ORDER,
+    min_phrase_size: Optional[int] = None,
+    separator: str = "-",
+) -> WordEncoder:
+    """
+    Returns the process-wide shared WordEncoder for the specified wordlist and configuration, creating it on first use.
+    See `WordlistRegistry.get_encoder()`.
+    """
+
+    return _registry.get_encoder(
+        from_path, package_name, word_order, min_phrase_size, separator
+    )
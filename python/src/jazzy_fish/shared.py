@@ -0,0 +1,270 @@
+"""
+Shared
+======
+
+Contains the ProcessSafeGenerator class, which keeps its state in a memory-mapped file,
+allowing multiple processes (e.g., the forked workers of a pre-fork server) to share the same machine IDs.
+
+Classes:
+    ProcessSafeGenerator - Generator whose per-machine state is shared by all processes that open the same state file.
+"""
+
+import mmap
+import os
+import struct
+import threading
+from types import ModuleType
+from typing import List, Optional
+import weakref
+
+from .clock import Clock
+from .generator import Generator, GeneratorException, Resolution
+from .metrics import GeneratorMetrics
+from .wait import WaitStrategy
+
+# magic, version, reserved, epoch millis, resolution, machine_id_bits, sequence_bits, machine count, machine index
+_HEADER = struct.Struct("<4sHHqqiiii")
+# machine id, last time, sequence
+_ENTRY = struct.Struct("<qqq")
+_MAGIC = b"JFGS"
+_VERSION = 1
+
+# Live generators, whose state files are re-opened by forked children
+_instances: "weakref.WeakSet[ProcessSafeGenerator]" = weakref.WeakSet()
+
+
+class ProcessSafeGenerator(Generator):
+    """
+    Generator whose per-machine state (last time unit and sequence), and round-robin position, are stored in a
+    memory-mapped state file, instead of process-local dicts.
+    All processes that open the same state file share the configured machine IDs, without generating duplicates.
+    Updates are serialized with an exclusive file lock (and a thread lock, for threads of the same process).
+
+    Instances can be created before forking: each child process re-opens the state file after the fork.
+    Only POSIX platforms are supported.
+
+    Attributes:
+        state_path (str): Path to the state file shared by all processes; it will be created if missing.
+        epoch (float): The epoch that the time component will be relative to; set to 0.0 for UNIX time.
+        resolution (Resolution): The time unit resolution, to which the other parameters will be relative to.
+        machine_ids (List[int]): A list of machine identifiers shared by all the processes;
+                                 at least one value must be provided; duplicates will be ignored.
+        machine_id_bits (int): How many bits are allocated for the machine ID;
+                               only positive integers are valid.
+        sequence_bits (int): How many bits are allocated for the local sequence;
+                             only positive integers are valid.
+                             If set to 0, only one identifier can be generated per machine in each time unit
+        wait_strategy (WaitStrategy): Determines how the generator waits for the next time unit,
+                                      once all sequences in the current one were exhausted.
+        clock (Clock): The clock source used to determine the current time.
+        metrics (Optional[GeneratorMetrics]): If set, records the generator's counters and histograms.
+    """
+
+    def __init__(
+        self,
+        state_path: str,
+        epoch: float,
+        resolution: Resolution,
+        machine_ids: List[int],
+        machine_id_bits: int,
+        sequence_bits: int,
+        wait_strategy: Optional[WaitStrategy] = None,
+        clock: Optional[Clock] = None,
+        metrics: Optional[GeneratorMetrics] = None,
+    ):
+        """
+        Constructs a ProcessSafeGenerator, creating or validating the state file.
+
+        Parameters:
+            state_path (str): Path to the state file shared by all processes; it will be created if missing.
+                              All processes must use the same configuration as the one stored in the file.
+            epoch (float): The epoch that the time component will be relative to; set to 0.0 for UNIX time.
+            resolution (Resolution): The time unit resolution, to which the other parameters will be relative to.
+            machine_ids (List[int]): A list of machine identifiers shared by all the processes;
+                                    at least one value must be provided; duplicates will be ignored.
+            machine_id_bits (int): How many bits are allocated for the machine ID;
+                                only positive integers are valid.
+            sequence_bits (int): How many bits are allocated for the local sequence;
+                                only positive integers are valid.
+                                If set to 0, only one identifier can be generated per machine in each time unit
+            wait_strategy (Optional[WaitStrategy]): Determines how the generator waits for the next time unit,
+                                                    once all sequences in the current one were exhausted.
+                                                    Defaults to busy-waiting (SpinWait).
+            clock (Optional[Clock]): The clock source used to determine the current time.
+                                     Defaults to the system's wall clock (WallClock).
+            metrics (Optional[GeneratorMetrics]): If set, records the generator's counters and histograms.
+        """
+        super().__init__(
+            epoch,
+            resolution,
+            machine_ids,
+            machine_id_bits,
+            sequence_bits,
+            wait_strategy,
+            clock,
+            metrics=metrics,
+        )
+        # Keep a stable order, so that all processes agree on the state file's layout
+        self.machine_ids.sort()
+
+        try:
+            import fcntl
+        except ImportError as e:
+            raise GeneratorException(
+                "ProcessSafeGenerator requires file locking support (fcntl), which is not available on this platform"
+            ) from e
+        self._fcntl: ModuleType = fcntl
+
+        self.state_path = state_path
+        self._closed = False
+        self._state = struct.Struct(f"<{3 * len(self.machine_ids)}q")
+        self._size = _HEADER.size + _ENTRY.size * len(self.machine_ids)
+        self._open()
+
+        # The state file (and its lock) must not be shared with the parent process after a fork
+        _instances.add(self)
+
+    def next_id(self) -> int:
+        """
+        Generates unique values, across all processes that share the state file.
+
+        Returns:
+            int: A unique integer identifier, relative to the configured time unit, and machine ID.
+
+        Raises:
+            SequenceExhaustedException: If the wait strategy gave up waiting for the next time unit.
+        """
+
+        with self._thread_lock:
+            self._lock_file()
+            try:
+                self._load_state()
+                id = super().next_id()
+                self._store_state()
+                return id
+            finally:
+                self._unlock_file()
+
+    def next_ids(self, count: int) -> List[int]:
+        """
+        Generates a batch of unique values, across all processes that share the state file,
+        holding the file lock once for the whole batch.
+
+        Parameters:
+            count (int): How many identifiers to generate.
+
+        Returns:
+            List[int]: Unique integer identifiers, relative to the configured time unit, and machine IDs.
+        """
+
+        with self._thread_lock:
+            self._lock_file()
+            try:
+                self._load_state()
+                ids = super().next_ids(count)
+                self._store_state()
+                return ids
+            finally:
+                self._unlock_file()
+
+    def close(self) -> None:
+        """Releases the memory-mapped state file; the generator cannot be used afterwards."""
+
+        self._closed = True
+        _instances.discard(self)
+        self._mmap.close()
+        os.close(self._fd)
+
+    def _open(self) -> None:
+        self._thread_lock = threading.Lock()
+        self._fd = os.open(self.state_path, os.O_RDWR | os.O_CREAT, 0o644)
+        self._lock_file()
+        try:
+            size = os.fstat(self._fd).st_size
+            if size == 0:
+                os.ftruncate(self._fd, self._size)
+            elif size != self._size:
+                raise GeneratorException(
+                    f"State file {self.state_path} does not match the configured machine IDs: {self.machine_ids}"
+                )
+
+            self._mmap = mmap.mmap(self._fd, self._size)
+            if size == 0:
+                self._initialize_state()
+            else:
+                self._validate_state()
+        except BaseException:
+            if hasattr(self, "_mmap") and not self._mmap.closed:
+                self._mmap.close()
+            # Closing the file also releases its lock
+            os.close(self._fd)
+            raise
+        self._unlock_file()
+
+    def _reopen_after_fork(self) -> None:
+        if self._closed:
+            return
+        self._mmap.close()
+        os.close(self._fd)
+        self._open()
+
+    def _header(self) -> tuple:
+        return (
+            _MAGIC,
+            _VERSION,
+            0,
+            self.epoch_millis,
+            self.resolution.value,
+            self.machine_id_bits,
+            self.sequence_bits,
+            len(self.machine_ids),
+        )
+
+    def _initialize_state(self) -> None:
+        _HEADER.pack_into(self._mmap, 0, *self._header(), 0)
+        for i, mid in enumerate(self.machine_ids):
+            _ENTRY.pack_into(self._mmap, _HEADER.size + i * _ENTRY.size, mid, -1, 0)
+        self._mmap.flush()
+
+    def _validate_state(self) -> None:
+        header = _HEADER.unpack_from(self._mmap, 0)
+        stored_ids = [
+            _ENTRY.unpack_from(self._mmap, _HEADER.size + i * _ENTRY.size)[0]
+            for i in range(len(self.machine_ids))
+        ]
+        if header[:-1] != self._header() or stored_ids != self.machine_ids:
+            raise GeneratorException(
+                f"State file {self.state_path} was created with a different configuration"
+            )
+
+    def _load_state(self) -> None:
+        self.current_machine_index = _HEADER.unpack_from(self._mmap, 0)[-1]
+        state = self._state.unpack_from(self._mmap, _HEADER.size)
+        for i in range(0, len(state), 3):
+            self.last_times[state[i]] = state[i + 1]
+            self.sequences[state[i]] = state[i + 2]
+
+    def _store_state(self) -> None:
+        struct.pack_into("<i", self._mmap, _HEADER.size - 4, self.current_machine_index)
+        state: List[int] = []
+        for mid in self.machine_ids:
+            state += (mid, self.last_times[mid], self.sequences[mid])
+        self._state.pack_into(self._mmap, _HEADER.size, *state)
+
+    def _lock_file(self) -> None:
+        self._fcntl.flock(self._fd, self._fcntl.LOCK_EX)
+
+    def _unlock_file(self) -> None:
+        self._fcntl.flock(self._fd, self._fcntl.LOCK_UN)
+
+
+def _reopen_after_fork() -> None:
+    """Re-opens the state files of all live generators, in a forked child process."""
+
+    for generator in list(_instances):
+        generator._reopen_after_fork()
+
+
+# A single hook for all instances (hooks cannot be unregistered); only available on POSIX platforms
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reopen_after_fork)
@@ -0,0 +1,135 @@
+"""
+Verification
+============
+
+Contains the VerificationCache class, which records wordlists whose checksums were successfully verified,
+keyed by the identity of their files, so that subsequent loads of unchanged files can skip hashing them.
+
+Classes:
+    FileIdentity - Identifies a file's contents, without reading it.
+    VerificationCache - Records successfully verified wordlists, in memory and in a JSON file.
+"""
+
+import json
+import os
+import threading
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+
+class FileIdentity(NamedTuple):
+    """Identifies a file's contents, without reading it; any modification results in a different identity."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    inode: int
+
+    @staticmethod
+    def of(path: str) -> "FileIdentity":
+        """Returns the identity of the specified file."""
+
+        stat = os.stat(path)
+        return FileIdentity(
+            os.path.abspath(path), stat.st_size, stat.st_mtime_ns, stat.st_ino
+        )
+
+
+class VerificationCache:
+    """
+    Records wordlists whose checksums were successfully verified, along with the identity of their files.
+    Entries are kept in memory, and persisted to a JSON file (unless disabled), so that they survive restarts.
+    Failures to persist entries (e.g., on a read-only filesystem) are ignored, only resulting in repeated verifications.
+
+    Attributes:
+        path (Optional[str]): The JSON file that persists the entries; None if they are only kept in memory.
+    """
+
+    def __init__(self, path: Optional[str] = None, persist: bool = True):
+        """
+        Constructs a new instance of VerificationCache.
+
+        Parameters:
+            path (Optional[str]): The JSON file that persists the entries; defaults to `verified.json`
+                                  in `$JAZZY_FISH_CACHE_DIR`, or `$XDG_CACHE_HOME/jazzy-fish` (`~/.cache/jazzy-fish`).
+            persist (bool): If false, entries are only kept in memory.
+        """
+        if not persist:
+            path = None
+        elif path is None:
+            path = os.path.join(_default_cache_dir(), "verified.json")
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, List[List]]] = None
+
+    def is_verified(self, name: str, files: Sequence[FileIdentity]) -> bool:
+        """
+        Checks whether the specified wordlist was verified, with the exact same files.
+
+        Parameters:
+            name (str): The wordlist's name, including its checksum (e.g., '012_8562fb9').
+            files (Sequence[FileIdentity]): The identities of the wordlist's files.
+
+        Returns:
+            bool: True if the wordlist was verified, and none of its files changed since.
+        """
+
+        with self._lock:
+            return self._load().get(name) == [list(file) for file in files]
+
+    def record(self, name: str, files: Sequence[FileIdentity]) -> None:
+        """
+        Records that the specified wordlist was successfully verified.
+
+        Parameters:
+            name (str): The wordlist's name, including its checksum (e.g., '012_8562fb9').
+            files (Sequence[FileIdentity]): The identities of the wordlist's files.
+        """
+
+        with self._lock:
+            entries = self._load()
+            entries[name] = [list(file) for file in files]
+            if self.path is None:
+                return
+
+            # Merge the entries recorded by other processes, since the file was loaded
+            persisted = _read_entries(self.path)
+            persisted.update(entries)
+            try:
+                self._save(self.path, persisted)
+            except OSError:
+                pass
+
+    def _load(self) -> Dict[str, List[List]]:
+        if self._entries is None:
+            self._entries = _read_entries(self.path) if self.path is not None else {}
+        return self._entries
+
+    @staticmethod
+    def _save(path: str, entries: Dict[str, List[List]]) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as file:
+            json.dump(entries, file)
+        os.replace(tmp_path, path)
+
+
+def _read_entries(path: str) -> Dict[str, List[List]]:
+    try:
+        with open(path, "r") as file:
+            entries = json.load(file)
+    except (OSError, ValueError):
+        # Missing, or corrupted: wordlists will be verified again
+        return {}
+    return entries if isinstance(entries, dict) else {}
+
+
+def _default_cache_dir() -> str:
+    cache_dir = os.environ.get("JAZZY_FISH_CACHE_DIR")
+    if cache_dir:
+        return cache_dir
+
+    xdg_cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(xdg_cache, "jazzy-fish")
@@ -0,0 +1,138 @@
+"""
+Wait
+====
+
+Contains the strategies used by a Generator to wait for the next time unit, once it has exhausted all
+the sequences available in the current one.
+
+Classes:
+    HybridWait - Sleeps until shortly before the next time unit, then busy-waits until it is reached.
+    NoWait - Does not wait, signaling the Generator to shed load instead.
+    SleepWait - Sleeps until the computed start of the next time unit.
+    SpinWait - Busy-waits until the next time unit (the default behavior), sleeping through clock regressions.
+    WaitResult - Represents the outcome of a wait: the time unit that was reached and how long it took.
+    WaitStrategy - Base class for all wait strategies.
+"""
+
+from abc import ABC, abstractmethod
+import time
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    from .generator import Generator
+
+
+class WaitResult(NamedTuple):
+    """Represents the outcome of a wait: the time unit that was reached (None, if the strategy gave up), and the number of seconds spent waiting."""
+
+    time: Optional[int]
+    waited: float
+
+
+class WaitStrategy(ABC):
+    """
+    Base class for all wait strategies.
+    """
+
+    @abstractmethod
+    def wait(
+        self, generator: "Generator", current_time: int, last_time: int
+    ) -> WaitResult:
+        """
+        Waits until the generator's clock has moved past the specified time unit.
+
+        Parameters:
+            generator (Generator): The generator that is waiting.
+            current_time (int): The current time unit, as last read by the generator.
+            last_time (int): The time unit that must be exceeded.
+
+        Returns:
+            WaitResult: The time unit that was reached (or None, if the strategy gave up), and how long the wait took.
+        """
+        pass
+
+
+class SpinWait(WaitStrategy):
+    """
+    Busy-waits until the next time unit; this is the lowest latency option, at the expense of a fully utilized CPU core.
+    If the clock went backwards (i.e., it is behind the last time unit), sleeps until the last time unit starts,
+    and only busy-waits until the next one.
+    """
+
+    def wait(
+        self, generator: "Generator", current_time: int, last_time: int
+    ) -> WaitResult:
+        started = time.perf_counter()
+        if current_time < last_time:
+            remaining = generator._seconds_until(last_time)
+            if remaining > 0:
+                time.sleep(remaining)
+            current_time = generator._current_time()
+        while current_time <= last_time:
+            current_time = generator._current_time()
+        return WaitResult(current_time, time.perf_counter() - started)
+
+
+class SleepWait(WaitStrategy):
+    """
+    Sleeps until the computed start of the next time unit, releasing the CPU (and the GIL) to other threads.
+    The wake-up may be delayed by the operating system's scheduler, by up to a few milliseconds.
+    """
+
+    def wait(
+        self, generator: "Generator", current_time: int, last_time: int
+    ) -> WaitResult:
+        started = time.perf_counter()
+        while current_time <= last_time:
+            remaining = generator._seconds_until(last_time + 1)
+            if remaining > 0:
+                time.sleep(remaining)
+            current_time = generator._current_time()
+        return WaitResult(current_time, time.perf_counter() - started)
+
+
+class HybridWait(WaitStrategy):
+    """
+    Sleeps until shortly before the start of the next time unit, then busy-waits until it is reached;
+    this avoids pinning a CPU core for long waits, without incurring the scheduler's wake-up delay.
+
+    Attributes:
+        spin_threshold (float): How many seconds before the next time unit to stop sleeping and start busy-waiting.
+    """
+
+    def __init__(self, spin_threshold: float = 0.002):
+        """
+        Constructs a new instance of HybridWait.
+
+        Parameters:
+            spin_threshold (float): How many seconds before the next time unit to stop sleeping and start busy-waiting.
+        """
+        if spin_threshold < 0:
+            raise ValueError(
+                f"The spin threshold cannot be negative, got: {spin_threshold}"
+            )
+        self.spin_threshold = spin_threshold
+
+    def wait(
+        self, generator: "Generator", current_time: int, last_time: int
+    ) -> WaitResult:
+        started = time.perf_counter()
+        remaining = generator._seconds_until(last_time + 1) - self.spin_threshold
+        if remaining > 0:
+            time.sleep(remaining)
+        while current_time <= last_time:
+            current_time = generator._current_time()
+        return WaitResult(current_time, time.perf_counter() - started)
+
+
+class NoWait(WaitStrategy):
+    """
+    Does not wait; signals the generator to give up instead, for callers that would rather shed load.
+    `Generator.next_id()` raises a SequenceExhaustedException, `Generator.try_next_id()` returns None,
+    and `Generator.next_ids()` returns the identifiers it could generate before the sequences were exhausted.
+    """
+
+    def wait(
+        self, generator: "Generator", current_time: int, last_time: int
+    ) -> WaitResult:
+        return WaitResult(None, 0.0)
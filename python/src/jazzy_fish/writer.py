@@ -0,0 +1,148 @@
+"""
+Writer
+======
+
+Contains the KeyPhraseWriter class, which streams encoded keyphrases to a binary file, one record per line,
+through a reusable buffer that `WordEncoder.encode_into()` writes UTF-8 bytes into directly.
+
+Classes:
+    KeyPhraseWriter - Encodes integers, and writes the requested forms of their keyphrases to a binary file.
+"""
+
+from types import TracebackType
+from typing import BinaryIO, Iterable, Optional, Sequence, Type
+
+from .encoder import EncoderException, WordEncoder
+
+DEFAULT_BUFFER_SIZE = 1 << 16
+
+
+class KeyPhraseWriter:
+    """
+    Encodes integers, and writes the requested forms of their keyphrases (separated by a delimiter,
+    and terminated by a newline) to a binary file. Records are accumulated in a fixed-size buffer,
+    which is written to the file whenever the next record may not fit, and when the writer is flushed or closed.
+
+    Instances are not thread-safe.
+
+    Attributes:
+        file (BinaryIO): The file that records are written to; it is not closed by the writer.
+        encoder (WordEncoder): The encoder used to encode the integers.
+        fields (Sequence[str]): The forms written for each integer, in order: "keyphrase", "abbr", and/or "id".
+        delimiter (str): Written between the fields of a record.
+    """
+
+    def __init__(
+        self,
+        file: BinaryIO,
+        encoder: WordEncoder,
+        fields: Sequence[str] = ("keyphrase",),
+        delimiter: str = ",",
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ):
+        """
+        Constructs a new instance of KeyPhraseWriter.
+
+        Parameters:
+            file (BinaryIO): The file that records are written to.
+            encoder (WordEncoder): The encoder used to encode the integers.
+            fields (Sequence[str]): The forms written for each integer, in order.
+            delimiter (str): Written between the fields of a record.
+            buffer_size (int): The size of the buffer, in bytes; must fit the longest possible record.
+        """
+        self.file = file
+        self.encoder = encoder
+        self.fields = tuple(fields)
+        self.delimiter = delimiter
+
+        # The longest record: every field (and word) is as long as possible
+        self._max_record_size = encoder.max_record_size(self.fields, delimiter) + 1
+        if buffer_size < self._max_record_size:
+            raise EncoderException(
+                f"The buffer size ({buffer_size}) must fit the longest record ({self._max_record_size} bytes)"
+            )
+
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+        self._limit = buffer_size - self._max_record_size
+        self._position = 0
+        self._closed = False
+
+    def write(self, number: int) -> None:
+        """
+        Encodes an integer, and writes its record.
+
+        Parameters:
+            number (int): The integer to encode.
+        """
+        if self._closed:
+            raise ValueError("The writer is closed")
+        if self._position > self._limit:
+            self.flush()
+
+        end = self.encoder.encode_into(
+            number, self._buffer, self._position, self.fields, self.delimiter
+        )
+        self._buffer[end] = 0x0A  # newline
+        self._position = end + 1
+
+    def write_many(self, numbers: Iterable[int]) -> int:
+        """
+        Encodes multiple integers, and writes their records, in order.
+
+        Parameters:
+            numbers (Iterable[int]): The integers to encode.
+
+        Returns:
+            int: The number of written records.
+        """
+        if self._closed:
+            raise ValueError("The writer is closed")
+
+        # Avoid the attribute lookups of write(), for each record
+        encode_into = self.encoder.encode_into
+        buffer = self._buffer
+        fields = self.fields
+        delimiter = self.delimiter
+        limit = self._limit
+        position = self._position
+        count = 0
+        try:
+            for number in numbers:
+                if position > limit:
+                    self._position = position
+                    self.flush()
+                    position = 0
+                end = encode_into(number, buffer, position, fields, delimiter)
+                buffer[end] = 0x0A  # newline
+                position = end + 1
+                count += 1
+        finally:
+            # Keep the records that were written before an error
+            self._position = position
+        return count
+
+    def flush(self) -> None:
+        """Writes the buffered records to the file."""
+        if self._position:
+            self.file.write(self._view[: self._position])
+            self._position = 0
+        self.file.flush()
+
+    def close(self) -> None:
+        """Flushes the buffered records; the file remains open."""
+        if not self._closed:
+            self.flush()
+            self._view.release()
+            self._closed = True
+
+    def __enter__(self) -> "KeyPhraseWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -0,0 +1,39 @@
+"""
+Compile Wordlists
+=================
+
+Given one or more wordlist directories, writes a compiled wordlist next to each of them (e.g., `012_8562fb9.jfwl`),
+which can be memory-mapped with `Wordlist.open_compiled()`.
+
+"""
+
+import argparse
+from pathlib import Path
+from typing import List
+
+from jazzy_fish.encoder import Wordlist
+
+
+def compile_wordlists(wordlist_dirs: List[str]) -> None:
+    """Compiles each of the specified wordlists, after verifying their checksums"""
+
+    for wordlist_dir in wordlist_dirs:
+        directory = Path(wordlist_dir)
+        output = directory.with_suffix(".jfwl")
+
+        Wordlist.load(str(directory)).compile(str(output))
+        print(f"Compiled wordlist: {output}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compile wordlists into memory-mappable files"
+    )
+    parser.add_argument("dirs", nargs="+", help="Path to the wordlist dirs.")
+    args = parser.parse_args()
+
+    compile_wordlists(args.dirs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import argparse
+import timeit
+from typing import Callable, List, Tuple
+
+from jazzy_fish import WordEncoder, Wordlist
+
+
+def main() -> None:
+    """Compares the cost of encoding integers to each of their representations"""
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--wordlist", default="resources/012_8562fb9")
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    wordlist = Wordlist.load(args.wordlist, "jazzy_fish")
+    encoder = WordEncoder(wordlist)
+
+    # Spread the integers over the whole solution space
+    step = encoder.get_max() // args.count
+    numbers = range(0, step * args.count, step)
+
+    cases: List[Tuple[str, Callable[[int], object]]] = [
+        ("encode", encoder.encode),
+        ("encode().keyphrase", lambda number: encoder.encode(number).keyphrase),
+        ("encode_keyphrase", encoder.encode_keyphrase),
+        ("encode().abbr", lambda number: encoder.encode(number).abbr),
+        ("encode_abbr", encoder.encode_abbr),
+    ]
+
+    # Build the lazily computed abbreviations before measuring
+    encoder.encode(0)
+
+    for name, encode in cases:
+        best = min(
+            timeit.repeat(
+                lambda: [encode(number) for number in numbers],
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        print(f"{name:20} {best / args.count * 1e6:8.3f} us/op")
+
+
+if __name__ == "__main__":
+    main()
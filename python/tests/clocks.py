@@ -0,0 +1,26 @@
+"""
+Clocks
+======
+
+Clocks shared by the tests, which control the time observed by generators.
+
+Classes:
+    ManualClock - A clock that only moves when a test sets its time.
+"""
+
+from jazzy_fish.clock import Clock
+
+
+class ManualClock(Clock):
+    """
+    A clock that returns a fixed time, until a test changes it.
+
+    Attributes:
+        now (int): The current time, in milliseconds since the UNIX epoch.
+    """
+
+    def __init__(self, millis: int):
+        self.now = millis
+
+    def millis(self) -> int:
+        return self.now
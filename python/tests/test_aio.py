@@ -0,0 +1,101 @@
+import asyncio
+import time
+from typing import List
+import unittest
+
+from jazzy_fish.aio import AsyncGenerator
+from jazzy_fish.generator import Generator, Resolution
+
+from .clocks import ManualClock
+
+
+class TestAsyncGenerator(unittest.TestCase):
+    def test_concurrent_coroutines_do_not_overlap(self):
+        generator = AsyncGenerator(
+            epoch=time.time(),
+            machine_ids=[0, 1],
+            machine_id_bits=1,
+            sequence_bits=1,
+            resolution=Resolution.MILLISECOND,
+        )
+
+        async def generate() -> List[int]:
+            ids = await generator.anext_ids(100)
+            ids += [await generator.anext_id() for _ in range(100)]
+            return ids
+
+        async def run() -> List[List[int]]:
+            return await asyncio.gather(*[generate() for _ in range(10)])
+
+        result = [id for ids in asyncio.run(run()) for id in ids]
+
+        self.assertEqual(len(result), 2000)
+        self.assertEqual(len(set(result)), len(result))
+
+    def test_ids_are_increasing(self):
+        generator = AsyncGenerator(
+            epoch=time.time(),
+            machine_ids=[0],
+            machine_id_bits=0,
+            sequence_bits=0,
+            resolution=Resolution.MILLISECOND,
+        )
+
+        result = asyncio.run(generator.anext_ids(50))
+
+        for i in range(1, len(result)):
+            self.assertGreater(result[i], result[i - 1])
+
+    def test_does_not_block_the_event_loop(self):
+        generator = AsyncGenerator(
+            epoch=time.time(),
+            machine_ids=[0],
+            machine_id_bits=0,
+            sequence_bits=0,
+            resolution=Resolution.SECOND,
+        )
+        ticks: List[float] = []
+
+        async def tick() -> None:
+            while True:
+                ticks.append(time.time())
+                await asyncio.sleep(0.01)
+
+        async def run() -> List[int]:
+            ticker = asyncio.create_task(tick())
+            ids = await generator.anext_ids(2)
+            ticker.cancel()
+            return ids
+
+        ids = asyncio.run(run())
+
+        # The second ID required waiting for the next second
+        self.assertEqual(ids[1], ids[0] + 1)
+        self.assertGreater(len(ticks), 1)
+
+    def test_same_layout_as_generator(self):
+        generator = Generator(
+            epoch=0,
+            machine_ids=[3],
+            machine_id_bits=2,
+            sequence_bits=3,
+            resolution=Resolution.SECOND,
+            clock=ManualClock(1_000_000),
+        )
+        async_generator = AsyncGenerator(
+            epoch=0,
+            machine_ids=[3],
+            machine_id_bits=2,
+            sequence_bits=3,
+            resolution=Resolution.SECOND,
+            clock=ManualClock(1_000_000),
+        )
+
+        expected = generator.next_ids(8)
+        got = asyncio.run(async_generator.anext_ids(8))
+
+        self.assertEqual(got, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import threading
+import unittest
+
+from jazzy_fish.cache import ARCCache, CacheStats, CachingWordEncoder, LRUCache
+from jazzy_fish.encoder import EncoderException, WordEncoder, Wordlist
+
+
+class TestCache(unittest.TestCase):
+    def test_lru_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+
+        cache.put("c", 3)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.stats(), CacheStats(3, 1, 1, 2))
+
+    def test_arc_resists_scans(self):
+        cache = ARCCache(4)
+        for key in ["hot1", "hot2"]:
+            cache.put(key, key)
+            cache.get(key)
+
+        # A scan over cold keys, each requested once, does not evict frequently used entries
+        for i in range(100):
+            cache.put(i, i)
+            self.assertLessEqual(len(cache), 4)
+
+        self.assertEqual(cache.get("hot1"), "hot1")
+        self.assertEqual(cache.get("hot2"), "hot2")
+
+    def test_arc_adapts_to_evicted_keys(self):
+        cache = ARCCache(2)
+        for key in ["a", "b", "c", "a", "b", "c", "d", "a"]:
+            if cache.get(key) is None:
+                cache.put(key, key.upper())
+            self.assertLessEqual(len(cache), 2)
+
+        self.assertEqual(cache.get("a"), "A")
+        self.assertGreater(cache.stats().evictions, 0)
+
+    def test_rejects_invalid_size(self):
+        with self.assertRaises(ValueError):
+            LRUCache(0)
+
+
+class TestCachingWordEncoder(unittest.TestCase):
+    def setUp(self):
+        # Define word lists
+        adverbs = ["absurdly", "busily", "capably"]
+        verbs = ["abandoned", "bearded", "checked"]
+        adjectives = ["able", "blond", "chubby"]
+        nouns = ["apple", "bird", "cat", "dog"]
+        words = [adverbs, verbs, adjectives, nouns]
+        self.wordlist = Wordlist("0_NOVERIFY", words, verify_checksum=False)
+
+    def test_returns_same_results_as_encoder(self):
+        encoder = WordEncoder(self.wordlist, min_phrase_size=1)
+
+        for policy in [LRUCache, ARCCache]:
+            cached = CachingWordEncoder(
+                self.wordlist, min_phrase_size=1, maxsize=16, policy=policy
+            )
+            for _ in range(2):
+                for i in range(encoder.get_max()):
+                    encoded = encoder.encode(i)
+                    self.assertEqual(cached.encode(i), encoded)
+                    self.assertEqual(cached.decode(encoded.keyphrase), i)
+                    self.assertEqual(cached.decode_abbr(encoded.abbr), i)
+
+            stats = cached.stats()
+            self.assertLessEqual(stats.size, 48)
+            self.assertGreater(stats.evictions, 0)
+
+    def test_counts_hits_and_misses(self):
+        cached = CachingWordEncoder(self.wordlist, min_phrase_size=1)
+
+        cached.decode("blond-apple")
+        cached.decode("blond-apple")
+        cached.decode_abbr("b-a")
+
+        self.assertEqual(cached.decode_cache.stats(), CacheStats(1, 1, 0, 1))
+        self.assertEqual(cached.stats(), CacheStats(1, 2, 0, 2))
+
+    def test_does_not_cache_errors(self):
+        cached = CachingWordEncoder(self.wordlist, min_phrase_size=1)
+
+        for _ in range(2):
+            with self.assertRaises(EncoderException):
+                cached.encode(cached.get_max())
+        self.assertEqual(cached.encode_cache.stats().size, 0)
+
+    def test_shared_across_threads(self):
+        cached = CachingWordEncoder(self.wordlist, maxsize=8, policy=ARCCache)
+        errors = []
+
+        def work():
+            for i in range(2000):
+                value = i % cached.get_max()
+                if cached.decode(cached.encode(value).keyphrase) != value:
+                    errors.append(value)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
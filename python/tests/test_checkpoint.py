@@ -0,0 +1,121 @@
+import os
+import tempfile
+import unittest
+
+from jazzy_fish.checkpoint import Checkpoint, FileCheckpoint
+from jazzy_fish.clock import Clock
+from jazzy_fish.generator import Generator, Resolution, SequenceExhaustedException
+from jazzy_fish.wait import NoWait
+
+from .clocks import ManualClock
+
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "generator.checkpoint")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def create(self, clock: Clock, checkpoint: Checkpoint) -> Generator:
+        return Generator(
+            epoch=0,
+            machine_ids=[0, 1],
+            machine_id_bits=1,
+            sequence_bits=4,
+            resolution=Resolution.MILLISECOND,
+            wait_strategy=NoWait(),
+            clock=clock,
+            checkpoint=checkpoint,
+        )
+
+    def test_writes_are_amortized(self):
+        clock = ManualClock(1_000_000)
+        checkpoint = FileCheckpoint(self.path, reserve_ahead=0.1)
+        generator = self.create(clock, checkpoint)
+
+        # 100 time units, with a reservation of 100 units (0.1s) per save
+        for _ in range(100):
+            generator.next_ids(20)
+            clock.now += 1
+
+        self.assertEqual(checkpoint.saves, 1)
+        self.assertEqual(checkpoint.load(), {0: 1_000_100, 1: 1_000_100})
+
+        clock.now += 1
+        generator.next_id()
+        self.assertEqual(checkpoint.saves, 2)
+
+    def test_restart_does_not_reissue(self):
+        clock = ManualClock(1_000_000)
+        generator = self.create(clock, FileCheckpoint(self.path, reserve_ahead=0.1))
+        issued = generator.next_ids(100)
+
+        # Restart, with the clock going backwards
+        clock.now = 999_000
+        restarted = self.create(clock, FileCheckpoint(self.path, reserve_ahead=0.1))
+        with self.assertRaises(SequenceExhaustedException):
+            restarted.next_id()
+
+        # Identifiers can only be generated after the reservation
+        clock.now = 1_000_101
+        reissued = restarted.next_ids(100)
+        self.assertGreater(min(reissued), max(issued))
+        self.assertEqual(restarted.clock_regressions, 0)
+
+    def test_restart_waits_for_the_reservation(self):
+        clock = ManualClock(1_000_000)
+        generator = self.create(clock, FileCheckpoint(self.path, reserve_ahead=0.1))
+        issued = generator.next_id()
+
+        restarted = self.create(clock, FileCheckpoint(self.path, reserve_ahead=0.1))
+        self.assertIsNone(restarted.try_next_id())
+        self.assertEqual(restarted.next_ids(1), [])
+
+        clock.now = 1_000_101
+        reissued = restarted.next_ids(2)
+        self.assertGreater(min(reissued), issued)
+        clock.now = 999_000
+        regressed = restarted.next_id()
+        self.assertGreater(regressed, issued)
+        self.assertNotIn(regressed, reissued)
+
+        # Waiting for the reservation is not a clock regression, but the clock going backwards afterwards is
+        self.assertEqual(restarted.clock_regressions, 1)
+
+    def test_generators_can_share_a_file(self):
+        first = FileCheckpoint(self.path)
+        second = FileCheckpoint(self.path)
+
+        first.save({0: 100, 1: 100})
+        second.save({2: 50})
+        self.assertEqual(first.load(), {0: 100, 1: 100, 2: 50})
+
+        # Marks never decrease
+        second.save({1: 80, 2: 120})
+        self.assertEqual(first.load(), {0: 100, 1: 100, 2: 120})
+
+    def test_restart_with_a_shared_file(self):
+        clock = ManualClock(1_000_000)
+        generator = self.create(clock, FileCheckpoint(self.path, reserve_ahead=0.1))
+        generator.next_id()
+        other = Generator(
+            epoch=0,
+            machine_ids=[2],
+            machine_id_bits=2,
+            sequence_bits=3,
+            resolution=Resolution.MILLISECOND,
+            wait_strategy=NoWait(),
+            clock=clock,
+            checkpoint=FileCheckpoint(self.path, reserve_ahead=0.1),
+        )
+        other.next_id()
+
+        # The other generator's save did not erase the reservation of machine IDs 0 and 1
+        restarted = self.create(clock, FileCheckpoint(self.path, reserve_ahead=0.1))
+        self.assertIsNone(restarted.try_next_id())
+
+
+if __name__ == "__main__":
+    unittest.main()
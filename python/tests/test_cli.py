@@ -0,0 +1,146 @@
+import csv
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from typing import Any, Iterable, List, Tuple
+
+from jazzy_fish.cli import (
+    DECODE,
+    DECODE_ABBR,
+    ENCODE,
+    ConversionConfig,
+    ConversionStats,
+    convert,
+    main,
+)
+from jazzy_fish.encoder import EncoderException, KeyPhrase, WordEncoder, Wordlist
+
+
+class TestCli(unittest.TestCase):
+    encoder: WordEncoder
+    ids: List[int]
+    keyphrases: List[KeyPhrase]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        wordlist = Wordlist.load("resources/012_8562fb9", "jazzy_fish")
+        cls.encoder = WordEncoder(wordlist)
+        cls.ids = list(range(0, 5_000_000, 997))
+        cls.keyphrases = [cls.encoder.encode(i) for i in cls.ids]
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def convert(
+        self, config: ConversionConfig, values: Iterable[Any], **kwargs: Any
+    ) -> Tuple[str, ConversionStats]:
+        output = io.StringIO()
+        stats = convert(config, [f"{value}\n" for value in values], output, **kwargs)
+        return output.getvalue(), stats
+
+    def test_encode_in_process(self):
+        output, stats = self.convert(
+            ConversionConfig(ENCODE), self.ids, workers=0, chunk_size=100
+        )
+        self.assertEqual(output.splitlines(), [k.keyphrase for k in self.keyphrases])
+        self.assertEqual(stats.rows, len(self.ids))
+        self.assertEqual(stats.errors, 0)
+
+    def test_workers_preserve_order(self):
+        output, _ = self.convert(
+            ConversionConfig(DECODE, output_format="jsonl"),
+            [k.keyphrase for k in self.keyphrases],
+            workers=3,
+            chunk_size=64,
+        )
+        rows = [json.loads(line) for line in output.splitlines()]
+        self.assertEqual([row["id"] for row in rows], self.ids)
+        self.assertEqual(
+            [row["keyphrase"] for row in rows], [k.keyphrase for k in self.keyphrases]
+        )
+
+    def test_csv(self):
+        output, _ = self.convert(
+            ConversionConfig(DECODE_ABBR, output_format="csv"),
+            [k.abbr for k in self.keyphrases],
+            workers=0,
+        )
+        rows = list(csv.reader(io.StringIO(output)))
+        self.assertEqual(rows[0], ["abbr", "id"])
+        self.assertEqual([int(row[1]) for row in rows[1:]], self.ids)
+
+    def test_blank_lines_are_ignored(self):
+        output, stats = self.convert(
+            ConversionConfig(ENCODE), ["", "1", "  ", "2"], workers=0
+        )
+        self.assertEqual(stats.rows, 2)
+        self.assertEqual(len(output.splitlines()), 2)
+
+    def test_errors(self):
+        values = ["1", "not-a-number", "2", str(self.encoder.get_max())]
+
+        with self.assertRaises(EncoderException):
+            self.convert(ConversionConfig(ENCODE), values, workers=0)
+
+        errors = io.StringIO()
+        output, stats = self.convert(
+            ConversionConfig(ENCODE, skip_errors=True),
+            values,
+            workers=0,
+            errors=errors,
+        )
+        self.assertEqual(
+            output.splitlines(),
+            [self.encoder.encode(1).keyphrase, self.encoder.encode(2).keyphrase],
+        )
+        self.assertEqual(stats.errors, 2)
+        self.assertEqual(len(errors.getvalue().splitlines()), 2)
+
+    def test_compiled_wordlist(self):
+        compiled = os.path.join(self.tmp, "012_8562fb9.jfwl")
+        self.encoder._wordlist.compile(compiled)
+
+        output, _ = self.convert(
+            ConversionConfig(
+                ENCODE, wordlist=compiled, package_name=None, separator="."
+            ),
+            self.ids[:10],
+            workers=0,
+        )
+        self.assertEqual(
+            output.splitlines(),
+            [k.keyphrase.replace("-", ".") for k in self.keyphrases[:10]],
+        )
+
+    def test_main(self):
+        ids_path = os.path.join(self.tmp, "ids.txt")
+        out_path = os.path.join(self.tmp, "out.csv")
+        with open(ids_path, "w") as file:
+            file.writelines(f"{i}\n" for i in self.ids)
+
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            status = main(["encode", ids_path, "-o", out_path, "-f", "csv", "-j", "2"])
+        self.assertEqual(status, 0)
+        self.assertIn("rows/s", stderr.getvalue())
+
+        with open(out_path, newline="") as file:
+            rows = list(csv.DictReader(file))
+        self.assertEqual([int(row["id"]) for row in rows], self.ids)
+        self.assertEqual(
+            [row["abbr"] for row in rows], [k.abbr for k in self.keyphrases]
+        )
+
+        with redirect_stderr(io.StringIO()):
+            self.assertEqual(main(["decode", os.path.join(self.tmp, "missing")]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
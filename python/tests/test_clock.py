@@ -0,0 +1,121 @@
+import time
+import unittest
+
+from jazzy_fish.clock import CoarseClock, FunctionClock, MonotonicClock, WallClock
+from jazzy_fish.generator import Generator, Resolution, SequenceExhaustedException
+from jazzy_fish.wait import NoWait
+
+from .clocks import ManualClock
+
+
+class OffsetClock(WallClock):
+    def __init__(self) -> None:
+        self.offset = 0
+
+    def millis(self) -> int:
+        return super().millis() - self.offset
+
+
+class TestClock(unittest.TestCase):
+    def test_clocks_are_anchored_to_wall_time(self):
+        for clock in [WallClock(), MonotonicClock(), CoarseClock()]:
+            self.assertAlmostEqual(clock.millis(), time.time() * 1000, delta=50)
+
+    def test_monotonic_clocks_do_not_go_backwards(self):
+        for clock in [MonotonicClock(), CoarseClock()]:
+            readings = [clock.millis() for _ in range(10000)]
+            self.assertEqual(readings, sorted(readings))
+
+    def test_generator_with_monotonic_clock(self):
+        generator = Generator(
+            epoch=time.time(),
+            machine_ids=[0],
+            machine_id_bits=0,
+            sequence_bits=0,
+            resolution=Resolution.MILLISECOND,
+            clock=MonotonicClock(),
+        )
+
+        results = [generator.next_id() for _ in range(100)]
+
+        for i in range(1, len(results)):
+            self.assertGreater(results[i], results[i - 1])
+
+    def test_clock_regressions_do_not_wait(self):
+        clock = ManualClock(5_000)
+        generator = Generator(
+            epoch=0,
+            machine_ids=[0],
+            machine_id_bits=0,
+            sequence_bits=2,
+            resolution=Resolution.SECOND,
+            wait_strategy=NoWait(),
+            clock=clock,
+        )
+        first = generator.next_id()
+
+        # The clock steps backwards; the last time unit's remaining sequences are used
+        clock.now = 3_000
+        results = [generator.next_id() for _ in range(3)]
+        self.assertEqual(results, [first + 1, first + 2, first + 3])
+        self.assertEqual(generator.clock_regressions, 1)
+
+        # Once exhausted, the wait strategy decides what happens
+        with self.assertRaises(SequenceExhaustedException):
+            generator.next_id()
+        self.assertEqual(generator.next_ids(2), [])
+
+        self.assertEqual(generator.clock_regressions, 1)
+
+        clock.now = 6_000
+        self.assertEqual(generator.next_id(), first + 4)
+
+        # Each regression is counted once
+        clock.now = 4_000
+        generator.next_ids(3)
+        self.assertEqual(generator.clock_regressions, 2)
+
+    def test_clock_regressions_do_not_spin(self):
+        clock = OffsetClock()
+        generator = Generator(
+            epoch=0,
+            machine_ids=[0],
+            machine_id_bits=0,
+            sequence_bits=2,
+            resolution=Resolution.MILLISECOND,
+            clock=clock,
+        )
+        generator.next_id()
+
+        # The clock steps back by 300ms, then follows the wall clock again
+        clock.offset = 300
+
+        started, cpu_started = time.perf_counter(), time.process_time()
+        generator.next_ids(4)
+        elapsed = time.perf_counter() - started
+        self.assertGreater(elapsed, 0.25)
+        self.assertLess(time.process_time() - cpu_started, elapsed / 2)
+        self.assertEqual(generator.clock_regressions, 1)
+
+    def test_deprecated_current_time(self):
+        generator = Generator(
+            epoch=0,
+            machine_ids=[0],
+            machine_id_bits=0,
+            sequence_bits=0,
+            resolution=Resolution.SECOND,
+            clock=ManualClock(1_700_000_000_000),
+        )
+
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual(generator.current_time(), 1_700_000_000.0)
+
+        # Assigning a function replaces the clock
+        with self.assertWarns(DeprecationWarning):
+            generator.current_time = lambda: 1_800_000_000.5
+        self.assertIsInstance(generator.clock, FunctionClock)
+        self.assertEqual(generator.next_id(), 1_800_000_000)
+
+
+if __name__ == "__main__":
+    unittest.main()
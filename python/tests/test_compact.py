@@ -0,0 +1,54 @@
+import unittest
+
+from jazzy_fish.compact import CompactWords, HashIndex
+from jazzy_fish.encoder import WordEncoder, Wordlist
+
+
+class TestCompact(unittest.TestCase):
+    def test_compact_words(self):
+        words = CompactWords.from_words(["able", "", "naïve", "dog"])
+
+        self.assertEqual(len(words), 4)
+        self.assertEqual(list(words), ["able", "", "naïve", "dog"])
+        self.assertEqual(words[2], "naïve")
+        self.assertEqual(words[-1], "dog")
+        self.assertEqual(words[1:3], ["", "naïve"])
+        with self.assertRaises(IndexError):
+            words[4]
+
+    def test_hash_index_behaves_like_dict(self):
+        keys = ["cat", "dog", "ant", "dog", "eel"]
+        expected = {key: i for i, key in enumerate(keys)}
+
+        index = HashIndex(CompactWords.from_words(keys))
+
+        self.assertEqual(dict(index), expected)
+        self.assertEqual(len(index), len(expected))
+        self.assertIn("ant", index)
+        self.assertNotIn("fish", index)
+        self.assertIsNone(index.get("fish"))
+        with self.assertRaises(KeyError):
+            index["fish"]
+
+    def test_empty_hash_index(self):
+        index = HashIndex(CompactWords.from_words([]))
+
+        self.assertEqual(len(index), 0)
+        self.assertNotIn("cat", index)
+
+    def test_compact_wordlist_matches_default(self):
+        default = WordEncoder(Wordlist.load("resources/024_84f184f", "jazzy_fish"))
+        compact = WordEncoder(
+            Wordlist.load("resources/024_84f184f", "jazzy_fish", compact=True)
+        )
+
+        step = default.get_max() // 997
+        for value in range(0, default.get_max(), step):
+            encoded = compact.encode(value)
+            self.assertEqual(encoded, default.encode(value))
+            self.assertEqual(compact.decode(encoded.keyphrase), value)
+            self.assertEqual(compact.decode_abbr(encoded.abbr), value)
+
+
+if __name__ == "__main__":
+    unittest.main()
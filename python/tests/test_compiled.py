@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+
+from jazzy_fish.compact import CompactWords
+from jazzy_fish.compiled import PerfectHashIndex
+from jazzy_fish.encoder import WordEncoder, Wordlist
+
+WORDLISTS = ["012_8562fb9", "024_84f184f", "01234_f233650"]
+
+
+class TestCompiled(unittest.TestCase):
+    def test_perfect_hash_index_behaves_like_dict(self):
+        keys = CompactWords.from_words(["cat", "dog", "ant", "dog", "eel", "émeu"])
+        expected = {key: i for i, key in enumerate(keys)}
+
+        index = PerfectHashIndex(keys, *PerfectHashIndex.build(keys))
+
+        self.assertEqual(dict(index), expected)
+        self.assertEqual(len(index), len(expected))
+        self.assertNotIn("fish", index)
+        with self.assertRaises(KeyError):
+            index["fish"]
+
+    def test_empty_perfect_hash_index(self):
+        index = PerfectHashIndex([], *PerfectHashIndex.build([]))
+
+        self.assertEqual(len(index), 0)
+        self.assertNotIn("cat", index)
+
+    def test_shipped_wordlists_match_sources(self):
+        for name in WORDLISTS:
+            loaded = Wordlist.load(f"resources/{name}", "jazzy_fish")
+            compiled = Wordlist.open_compiled(
+                f"resources/{name}.jfwl", "jazzy_fish", verify_checksum=True
+            )
+
+            self.assertEqual(
+                [list(lst) for lst in compiled._words], loaded._words, msg=name
+            )
+            for lst, positions in enumerate(loaded._word_positions):
+                self.assertEqual(dict(compiled._word_positions[lst]), positions)
+            for lst, positions in enumerate(loaded._abbr_to_pos):
+                self.assertEqual(dict(compiled._abbr_to_pos[lst]), positions)
+
+    def test_compile_and_encode(self):
+        adverbs = ["absurdly", "busily", "capably"]
+        verbs = ["abandoned", "bearded", "checked"]
+        adjectives = ["able", "blond", "chubby"]
+        nouns = ["apple", "bird", "cat", "dog"]
+        words = [adverbs, verbs, adjectives, nouns]
+        wordlist = Wordlist("0_NOVERIFY", words, verify_checksum=False)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "wordlist.jfwl")
+            wordlist.compile(path)
+
+            # The name's checksum does not match the words
+            with self.assertRaises(ValueError):
+                Wordlist.open_compiled(path, verify_checksum=True)
+
+            # The stored checksum is only compared against the name, which is not valid
+            with self.assertRaises(ValueError):
+                Wordlist.open_compiled(path)
+
+            valid = Wordlist(f"0_{Wordlist.compute_checksum(words, '0')[:7]}", words)
+            valid.compile(path)
+            encoder = WordEncoder(valid, min_phrase_size=1)
+            compiled = WordEncoder(Wordlist.open_compiled(path), min_phrase_size=1)
+
+            for value in range(encoder.get_max()):
+                encoded = compiled.encode(value)
+                self.assertEqual(encoded, encoder.encode(value))
+                self.assertEqual(compiled.decode(encoded.keyphrase), value)
+                self.assertEqual(compiled.decode_abbr(encoded.abbr), value)
+                self.assertEqual(compiled.encode_abbr(value), encoded.abbr)
+
+    def test_rejects_other_files(self):
+        with tempfile.NamedTemporaryFile(suffix=".jfwl") as file:
+            file.write(b"\0" * 256)
+            file.flush()
+
+            with self.assertRaises(ValueError):
+                Wordlist.open_compiled(file.name)
+
+
+if __name__ == "__main__":
+    unittest.main()
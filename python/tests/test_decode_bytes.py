@@ -0,0 +1,75 @@
+import mmap
+import tempfile
+import unittest
+
+from jazzy_fish.encoder import EncoderException, WordEncoder, Wordlist
+
+
+class TestDecodeBytes(unittest.TestCase):
+    wordlist: Wordlist
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.wordlist = Wordlist.load("resources/012_8562fb9", "jazzy_fish")
+
+    def setUp(self):
+        self.encoder = WordEncoder(self.wordlist, min_phrase_size=1)
+
+    def test_keyphrases_and_abbreviations(self):
+        for number in [0, 1, 1701, 123456789, self.encoder.get_max() - 1]:
+            encoded = self.encoder.encode(number)
+            self.assertEqual(
+                self.encoder.decode_bytes(encoded.keyphrase.encode()), number
+            )
+            self.assertEqual(self.encoder.decode_bytes(encoded.abbr.encode()), number)
+
+    def test_bytes_like_inputs(self):
+        encoded = self.encoder.encode(987654321)
+        keyphrase = encoded.keyphrase.encode()
+        for data in [keyphrase, bytearray(keyphrase), memoryview(keyphrase)]:
+            self.assertEqual(self.encoder.decode_bytes(data), 987654321)
+
+        with tempfile.TemporaryFile() as file:
+            file.write(keyphrase)
+            file.flush()
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                self.assertEqual(self.encoder.decode_bytes(mapped), 987654321)
+
+    def test_offsets(self):
+        first = self.encoder.encode(42)
+        second = self.encoder.encode(4242)
+        buffer = bytearray(f"{first.keyphrase}\n{second.abbr}\n".encode())
+
+        end = buffer.index(b"\n")
+        self.assertEqual(self.encoder.decode_bytes(buffer, 0, end), 42)
+        self.assertEqual(
+            self.encoder.decode_bytes(memoryview(buffer), end + 1, len(buffer) - 1),
+            4242,
+        )
+
+    def test_separator(self):
+        encoder = WordEncoder(self.wordlist, separator=".")
+        encoded = encoder.encode(31337)
+        self.assertEqual(encoder.decode_bytes(encoded.keyphrase.encode()), 31337)
+        self.assertEqual(encoder.decode_bytes(encoded.abbr.encode()), 31337)
+
+    def test_unknown_words(self):
+        # A four-word keyphrase
+        encoded = self.encoder.encode(self.encoder.get_max() - 12345)
+        words = encoded.keyphrase.split("-")
+
+        with self.assertRaises(KeyError) as error:
+            self.encoder.decode_bytes("-".join(words[:3] + ["xyzzy"]).encode())
+        self.assertEqual(error.exception.args[0], b"xyzzy")
+
+        abbrs = encoded.abbr.split("-")
+        with self.assertRaises(KeyError) as error:
+            self.encoder.decode_bytes("-".join(abbrs[:2] + ["zzz", abbrs[3]]).encode())
+        self.assertEqual(error.exception.args[0], b"zzz")
+
+        with self.assertRaises(EncoderException):
+            self.encoder.decode_bytes(b"a-b-c-d-e")
+
+
+if __name__ == "__main__":
+    unittest.main()
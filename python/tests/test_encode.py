@@ -57,6 +57,20 @@ class TestEncode(unittest.TestCase):
             msg = f"Encoded '{num:3}' (min_words={min_seq:1}), got: '{got:30}', prefix: '{prefix:>4}'"
             print(msg)
 
+    def test_single_representations(self):
+        for min_seq in range(1, 5):
+            encoder = WordEncoder(self.wordlist, min_phrase_size=min_seq)
+            for num in range(encoder.get_max()):
+                encoded = encoder.encode(num)
+                self.assertEqual(encoder.encode_keyphrase(num), encoded.keyphrase)
+                self.assertEqual(encoder.encode_abbr(num), encoded.abbr)
+
+        encoder = WordEncoder(self.wordlist, min_phrase_size=1)
+        with self.assertRaises(EncoderException):
+            encoder.encode_keyphrase(encoder.get_max())
+        with self.assertRaises(EncoderException):
+            encoder.encode_abbr(encoder.get_max())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,74 @@
+import random
+import unittest
+
+from jazzy_fish.encoder import EncoderException, WordEncoder, Wordlist
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+
+@unittest.skipUnless(np is not None, "requires numpy")
+class TestEncodeMany(unittest.TestCase):
+    def setUp(self):
+        # Define word lists
+        adverbs = ["absurdly", "busily", "capably"]
+        verbs = ["abandoned", "bearded", "checked"]
+        adjectives = ["able", "blond", "chubby"]
+        nouns = ["apple", "bird", "cat", "dog"]
+        words = [adverbs, verbs, adjectives, nouns]
+        self.wordlist = Wordlist("0_NOVERIFY", words, verify_checksum=False)
+
+    def test_matches_scalar_methods_for_all_values(self):
+        for min_words in range(1, 5):
+            encoder = WordEncoder(self.wordlist, min_phrase_size=min_words)
+            values = list(range(encoder.get_max()))
+
+            encoded = encoder.encode_many(values)
+            self.assertEqual(encoded, [encoder.encode(v) for v in values])
+
+            self.assertEqual(encoder.decode_many(k.keyphrase for k in encoded), values)
+            self.assertEqual(encoder.decode_abbr_many(k.abbr for k in encoded), values)
+
+    def test_matches_scalar_methods_for_default_wordlist(self):
+        wordlist = Wordlist.load("resources/012_8562fb9", "jazzy_fish")
+        encoder = WordEncoder(wordlist, min_phrase_size=2)
+        rng = random.Random(42)
+        values = [rng.randrange(encoder.get_max()) for _ in range(1000)] + [0, 1]
+
+        encoded = encoder.encode_many(np.array(values, dtype=np.uint64))
+        self.assertEqual(encoded, [encoder.encode(v) for v in values])
+
+        # Mixed phrase lengths are decoded in the original order
+        self.assertEqual(encoder.decode_many([k.keyphrase for k in encoded]), values)
+        self.assertEqual(encoder.decode_abbr_many([k.abbr for k in encoded]), values)
+
+    def test_empty_input(self):
+        encoder = WordEncoder(self.wordlist)
+
+        self.assertEqual(encoder.encode_many([]), [])
+        self.assertEqual(encoder.decode_many([]), [])
+        self.assertEqual(encoder.decode_abbr_many([]), [])
+
+    def test_iterators(self):
+        encoder = WordEncoder(self.wordlist, min_phrase_size=1)
+
+        expected = [encoder.encode(i) for i in range(0, 100, 7)]
+        self.assertEqual(encoder.encode_many(i for i in range(0, 100, 7)), expected)
+        self.assertEqual(encoder.encode_many(range(0, 100, 7)), expected)
+        self.assertEqual(encoder.encode_many(iter([])), [])
+
+    def test_raises_like_scalar_methods(self):
+        encoder = WordEncoder(self.wordlist, min_phrase_size=1)
+
+        with self.assertRaises(EncoderException):
+            encoder.encode_many([0, encoder.get_max()])
+        with self.assertRaises(EncoderException):
+            encoder.decode_many(["dog", "able-able-able-able-dog"])
+        with self.assertRaises(KeyError):
+            encoder.decode_many(["dog", "fish"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+import random
+import unittest
+
+from jazzy_fish.encoder import EncoderException, WordEncoder, Wordlist
+from jazzy_fish.fuzzy import FuzzyIndex, FuzzyMatch, edit_distance
+
+
+def reference_distance(a: str, b: str) -> int:
+    # Optimal string alignment distance, without any bound or shortcut
+    d = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+    for i in range(len(a) + 1):
+        d[i][0] = i
+    for j in range(len(b) + 1):
+        d[0][j] = j
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            d[i][j] = min(d[i - 1][j] + 1, d[i][j - 1] + 1, d[i - 1][j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                d[i][j] = min(d[i][j], d[i - 2][j - 2] + 1)
+    return d[len(a)][len(b)]
+
+
+class TestFuzzyIndex(unittest.TestCase):
+    def test_edit_distance(self):
+        self.assertEqual(edit_distance("kitten", "sitting", 3), 3)
+        self.assertEqual(edit_distance("kitten", "sitting", 2), 3)
+        self.assertEqual(edit_distance("niftier", "nitfier", 1), 1)
+        self.assertEqual(edit_distance("engine", "engine", 0), 0)
+        self.assertEqual(edit_distance("engine", "engines", 0), 1)
+
+        rng = random.Random(42)
+        for _ in range(2000):
+            a = "".join(rng.choice("abc") for _ in range(rng.randrange(6)))
+            b = "".join(rng.choice("abc") for _ in range(rng.randrange(6)))
+            expected = reference_distance(a, b)
+            for max_distance in range(4):
+                self.assertEqual(
+                    edit_distance(a, b, max_distance),
+                    min(expected, max_distance + 1),
+                    (a, b, max_distance),
+                )
+
+    def test_search_finds_all_matches(self):
+        rng = random.Random(7)
+        words = sorted(
+            {
+                "".join(rng.choice("abcd") for _ in range(rng.randrange(1, 6)))
+                for _ in range(300)
+            }
+        )
+        index = FuzzyIndex({word: i for i, word in enumerate(words)}, 2)
+
+        for _ in range(200):
+            query = "".join(rng.choice("abcde") for _ in range(rng.randrange(6)))
+            for max_distance in range(3):
+                expected = sorted(
+                    (reference_distance(query, word), i, word)
+                    for i, word in enumerate(words)
+                    if reference_distance(query, word) <= max_distance
+                )
+                self.assertEqual(index.search(query, max_distance), expected)
+
+    def test_invalid_distances(self):
+        with self.assertRaises(ValueError):
+            FuzzyIndex({"a": 0}, 4)
+        with self.assertRaises(ValueError):
+            FuzzyIndex({"a": 0}, 1).search("a", 2)
+
+
+class TestDecodeFuzzy(unittest.TestCase):
+    def setUp(self):
+        adverbs = ["absurdly", "busily", "capably"]
+        verbs = ["abandoned", "bearded", "checked"]
+        adjectives = ["able", "blond", "chubby"]
+        nouns = ["apple", "bird", "cat", "dog", "cot"]
+        wordlist = Wordlist(
+            "01_NOVERIFY",
+            [adverbs, verbs, adjectives, nouns],
+            verify_checksum=False,
+        )
+        self.encoder = WordEncoder(wordlist, min_phrase_size=1)
+
+    def test_exact_keyphrases(self):
+        encoded = self.encoder.encode(107)
+        self.assertEqual(
+            self.encoder.decode_fuzzy(encoded.keyphrase)[0],
+            FuzzyMatch(107, 0, encoded.keyphrase),
+        )
+
+    def test_corrects_typos(self):
+        encoded = self.encoder.encode(107)
+        words = encoded.keyphrase.split("-")
+
+        # A substitution, and a transposition
+        mistyped = "-".join([words[0], words[1], words[2][:-1] + "x", words[3]])
+        self.assertEqual(
+            self.encoder.decode_fuzzy(mistyped),
+            [FuzzyMatch(107, 1, encoded.keyphrase)],
+        )
+        transposed = "-".join([words[0][1] + words[0][0] + words[0][2:]] + words[1:])
+        self.assertEqual(self.encoder.decode_fuzzy(transposed)[0].id, 107)
+
+        # Typos in two words exceed the default distance
+        both = "-".join([words[0][:-1], words[1][:-1]] + words[2:])
+        self.assertEqual(self.encoder.decode_fuzzy(both), [])
+        self.assertEqual(
+            self.encoder.decode_fuzzy(both, max_distance=2)[0],
+            FuzzyMatch(107, 2, encoded.keyphrase),
+        )
+
+    def test_matches_are_ranked(self):
+        # 'cat', and 'cot' are both one substitution away from 'cut'
+        matches = self.encoder.decode_fuzzy("cut")
+        self.assertEqual(
+            matches,
+            [FuzzyMatch(2, 1, "cat"), FuzzyMatch(4, 1, "cot")],
+        )
+        self.assertEqual(self.encoder.decode_fuzzy("cut", limit=1), matches[:1])
+
+        # Exact matches rank first, and stop the search once the limit is reached
+        self.assertEqual(
+            self.encoder.decode_fuzzy("cat", limit=1), [FuzzyMatch(2, 0, "cat")]
+        )
+        self.assertEqual(
+            [match.distance for match in self.encoder.decode_fuzzy("cat")], [0, 1]
+        )
+
+    def test_abbreviations(self):
+        encoded = self.encoder.encode(107)
+        self.assertEqual(
+            self.encoder.decode_abbr_fuzzy(encoded.abbr)[0],
+            FuzzyMatch(107, 0, encoded.abbr),
+        )
+
+        mistyped = "x" + encoded.abbr[1:]
+        self.assertIn(
+            FuzzyMatch(107, 1, encoded.abbr),
+            self.encoder.decode_abbr_fuzzy(mistyped),
+        )
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(EncoderException):
+            self.encoder.decode_fuzzy("a-b-c-d-e")
+        with self.assertRaises(EncoderException):
+            self.encoder.decode_fuzzy("cat", max_distance=4)
+        with self.assertRaises(EncoderException):
+            self.encoder.decode_fuzzy("cat", limit=0)
+
+    def test_packaged_wordlist(self):
+        encoder = WordEncoder(Wordlist.load("resources/012_8562fb9", "jazzy_fish"))
+        encoded = encoder.encode(123456789)
+        mistyped = encoded.keyphrase[:3] + encoded.keyphrase[4:]
+        self.assertEqual(encoder.decode_fuzzy(mistyped)[0].id, 123456789)
+
+
+if __name__ == "__main__":
+    unittest.main()
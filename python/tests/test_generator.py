@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+import threading
 import time
 from typing import List
 import unittest
@@ -8,9 +9,12 @@ from jazzy_fish.generator import (
     Generator,
     GeneratorException,
     Resolution,
+    ShardedGenerator,
     ThreadSafeGenerator,
 )
 
+from .clocks import ManualClock
+
 
 class TestGenerator(unittest.TestCase):
     def test_generate_id(self):
@@ -54,6 +58,44 @@ class TestGenerator(unittest.TestCase):
         unique_ids = set(result)
         self.assertEqual(len(unique_ids), len(result))
 
+    def test_sharded_generator_is_threadsafe(self):
+        for machine_ids in [[0], [0, 1], list(range(16))]:
+            result = parameterized_generator(
+                num_threads=10,
+                batch_size=1000,
+                machine_ids=machine_ids,
+                machine_id_bits=4,
+                sequence_bits=4,
+                generator_class=ShardedGenerator,
+            )
+
+            # Check for uniqueness of the generated IDs
+            unique_ids = set(result)
+            self.assertEqual(len(unique_ids), len(result))
+
+    def test_sharded_generator_assigns_one_machine_per_thread(self):
+        generator = ShardedGenerator(
+            epoch=time.time(),
+            machine_ids=list(range(8)),
+            machine_id_bits=3,
+            sequence_bits=1,
+            resolution=Resolution.MILLISECOND,
+        )
+        barrier = threading.Barrier(4)
+
+        def machines_used():
+            barrier.wait()
+            ids = generator.next_ids(100) + [generator.next_id() for _ in range(100)]
+            return {(id >> 1) & 0b111 for id in ids}
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(machines_used) for _ in range(4)]
+            machines = [f.result() for f in futures]
+
+        for used in machines:
+            self.assertEqual(len(used), 1)
+        self.assertEqual(len(set.union(*machines)), 4)
+
     def test_generator_does_not_overlap_machines(self):
         result1 = parameterized_generator(
             num_threads=10, batch_size=1000, machine_ids=[0], machine_id_bits=1
@@ -95,6 +137,91 @@ class TestGenerator(unittest.TestCase):
         unique_ids = set(result)
         self.assertEqual(len(unique_ids), len(result))
 
+    def test_sharded_single_sequence(self):
+        result = parameterized_generator(
+            num_threads=10,
+            batch_size=100,
+            machine_ids=[0, 1],
+            sequence_bits=0,
+            generator_class=ShardedGenerator,
+        )
+
+        # Check for uniqueness of the generated IDs
+        unique_ids = set(result)
+        self.assertEqual(len(unique_ids), len(result))
+
+    def test_next_ids_matches_next_id(self):
+        for machine_ids, machine_id_bits, sequence_bits in [
+            ([0], 0, 0),
+            ([1], 3, 1),
+            ([0, 1, 2], 2, 0),
+            ([0, 1, 2], 2, 2),
+        ]:
+            single = frozen_generator(machine_ids, machine_id_bits, sequence_bits)
+            batch = frozen_generator(machine_ids, machine_id_bits, sequence_bits)
+
+            expected = [single.next_id() for _ in range(5)]
+            expected += [single.next_id() for _ in range(100)]
+            got = [batch.next_id() for _ in range(5)]
+            got += batch.next_ids(100)
+
+            self.assertEqual(got, expected)
+            self.assertEqual(len(set(got)), len(got))
+
+    def test_reserve_block(self):
+        generator = frozen_generator([0, 1], machine_id_bits=1, sequence_bits=3)
+
+        block = generator.reserve_block(64)
+
+        self.assertEqual(block.typecode, "Q")
+        self.assertEqual(len(set(block)), 64)
+        self.assertEqual(generator.next_ids(0), [])
+
+    def test_seconds_until_next_time(self):
+        generator = frozen_generator([0], machine_id_bits=0, sequence_bits=0)
+        assert isinstance(generator.clock, ManualClock)
+
+        generator.clock.now = 1_000_250
+        self.assertAlmostEqual(generator.seconds_until_next_time(), 0.75)
+        generator.clock.now = 1_001_000
+        self.assertAlmostEqual(generator.seconds_until_next_time(), 1.0)
+
+    def test_next_ids_is_threadsafe(self):
+        generator = ThreadSafeGenerator(
+            epoch=time.time(),
+            machine_ids=[0, 1],
+            machine_id_bits=1,
+            sequence_bits=4,
+            resolution=Resolution.MILLISECOND,
+        )
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+            futures = [executor.submit(generator.next_ids, 500) for _ in range(10)]
+            result = [id for f in futures for id in f.result()]
+
+        self.assertEqual(len(set(result)), len(result))
+
+
+def frozen_generator(machine_ids, machine_id_bits, sequence_bits) -> Generator:
+    """Creates a generator whose clock only advances when waiting for the next time unit."""
+
+    clock = ManualClock(1_000_000)
+    generator = Generator(
+        epoch=0,
+        machine_ids=machine_ids,
+        machine_id_bits=machine_id_bits,
+        sequence_bits=sequence_bits,
+        resolution=Resolution.SECOND,
+        clock=clock,
+    )
+
+    def wait_for_next_time(current_time, last_time):
+        clock.now = (last_time + 1) * 1000
+        return last_time + 1
+
+    generator._wait_for_next_time = wait_for_next_time  # type: ignore[method-assign]
+    return generator
+
 
 def generate_ids(generator, num_ids):
     ids = []
@@ -110,10 +237,11 @@ def parameterized_generator(
     machine_id_bits=1,
     sequence_bits=1,
     resolution=Resolution.MILLISECOND,
+    generator_class=ThreadSafeGenerator,
 ) -> List[int]:
     epoch = time.time()
 
-    generator = ThreadSafeGenerator(
+    generator = generator_class(
         epoch=epoch,
         machine_ids=machine_ids,
         machine_id_bits=machine_id_bits,
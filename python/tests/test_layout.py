@@ -0,0 +1,146 @@
+import unittest
+
+from jazzy_fish.encoder import EncoderException, WordEncoder, Wordlist
+from jazzy_fish.generator import Generator, GeneratorException, Resolution
+from jazzy_fish.layout import (
+    IdParts,
+    decompose,
+    decompose_many,
+    id_range,
+    id_ranges,
+    keyphrase_range,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+
+def layout_generator() -> Generator:
+    return Generator(
+        epoch=1_000,
+        machine_ids=[5],
+        machine_id_bits=3,
+        sequence_bits=4,
+        resolution=Resolution.SECOND,
+    )
+
+
+class TestLayout(unittest.TestCase):
+    def test_decompose(self):
+        generator = layout_generator()
+
+        id = (42 << 7) | (5 << 4) | 9
+        self.assertEqual(decompose(generator, id), IdParts(1_042_000, 5, 9))
+
+    def test_decompose_generated_id(self):
+        generator = layout_generator()
+
+        before = generator._current_time()
+        parts = decompose(generator, generator.next_id())
+
+        self.assertEqual(parts.machine_id, 5)
+        self.assertEqual(parts.sequence, 0)
+        self.assertGreaterEqual(parts.timestamp, before * 1000 + 1_000_000)
+
+    def test_id_range(self):
+        generator = layout_generator()
+
+        # [1042.5, 1044) covers time units 42 and 43
+        min_id, max_id = id_range(generator, 1_042.5, 1_044)
+        self.assertEqual(min_id, 42 << 7)
+        self.assertEqual(max_id, (44 << 7) - 1)
+
+        self.assertLessEqual(min_id, (42 << 7) | (5 << 4) | 9)
+        self.assertGreaterEqual(max_id, (43 << 7) | (7 << 4) | 15)
+
+    def test_empty_id_range(self):
+        generator = layout_generator()
+
+        with self.assertRaises(GeneratorException):
+            id_range(generator, 1_044, 1_044)
+
+    def test_keyphrase_range(self):
+        adverbs = ["absurdly", "busily", "capably"]
+        verbs = ["abandoned", "bearded", "checked"]
+        adjectives = ["able", "blond", "chubby"]
+        nouns = ["apple", "bird", "cat", "dog"]
+        wordlist = Wordlist(
+            "0_NOVERIFY", [adverbs, verbs, adjectives, nouns], verify_checksum=False
+        )
+        encoder = WordEncoder(wordlist, min_phrase_size=4)
+        generator = Generator(
+            epoch=0,
+            machine_ids=[0],
+            machine_id_bits=0,
+            sequence_bits=0,
+            resolution=Resolution.SECOND,
+        )
+
+        first, last = keyphrase_range(generator, encoder, 10, 20)
+        self.assertEqual(first.id, 10)
+        self.assertEqual(last.id, 19)
+        self.assertLess(first.keyphrase, last.keyphrase)
+
+        # Permuted identifiers are not encoded in order
+        permuted = WordEncoder(wordlist, min_phrase_size=4, permutation_key=b"secret")
+        with self.assertRaises(EncoderException):
+            keyphrase_range(generator, permuted, 10, 20)
+
+        # The range is clipped to the encoder's maximum value
+        _, last = keyphrase_range(generator, encoder, 10, 1_000)
+        self.assertEqual(last.id, encoder.get_max() - 1)
+
+        # Keyphrases with different numbers of words do not sort like their identifiers
+        short = WordEncoder(wordlist, min_phrase_size=1)
+        first, last = keyphrase_range(generator, short, 0, 4)
+        self.assertEqual((first.keyphrase, last.keyphrase), ("apple", "dog"))
+        with self.assertRaises(EncoderException):
+            keyphrase_range(generator, short, 2, 6)
+
+        # The separator must sort before all word characters
+        self.assertTrue(encoder.ordered)
+        tilde = WordEncoder(wordlist, min_phrase_size=4, separator="~")
+        self.assertFalse(tilde.ordered)
+        with self.assertRaises(EncoderException):
+            keyphrase_range(generator, tilde, 10, 20)
+
+        # The word lists must be sorted
+        unsorted = Wordlist(
+            "0_NOVERIFY",
+            [adverbs, verbs, adjectives, list(reversed(nouns))],
+            verify_checksum=False,
+        )
+        with self.assertRaises(EncoderException):
+            keyphrase_range(generator, WordEncoder(unsorted), 10, 20)
+
+
+@unittest.skipUnless(np is not None, "requires numpy")
+class TestLayoutVectorized(unittest.TestCase):
+    def test_decompose_many(self):
+        generator = layout_generator()
+        ids = [(42 << 7) | (5 << 4) | 9, (43 << 7) | (7 << 4) | 15, 0]
+
+        got = decompose_many(generator, np.array(ids, dtype=np.uint64))
+
+        for i, id in enumerate(ids):
+            expected = decompose(generator, id)
+            self.assertEqual(got.timestamps[i], expected.timestamp)
+            self.assertEqual(got.machine_ids[i], expected.machine_id)
+            self.assertEqual(got.sequences[i], expected.sequence)
+
+    def test_id_ranges(self):
+        generator = layout_generator()
+        windows = [(1_042.5, 1_044), (1_000, 1_001), (1_100.25, 1_200.75)]
+
+        min_ids, max_ids = id_ranges(
+            generator, [w[0] for w in windows], [w[1] for w in windows]
+        )
+
+        for i, window in enumerate(windows):
+            self.assertEqual((min_ids[i], max_ids[i]), id_range(generator, *window))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import os
+import sqlite3
+import tempfile
+import time
+from typing import List, Optional
+import unittest
+
+from jazzy_fish.generator import Generator, Resolution
+from jazzy_fish.lease import Lease, LeaseException, LeaseManager, SQLiteLeaseBackend
+
+
+class FailingBackend(SQLiteLeaseBackend):
+    """Fails to renew leases (as if the database was locked by another process), the specified number of times."""
+
+    def __init__(self, path: str, failures: int):
+        super().__init__(path)
+        self.failures = failures
+        self.timeouts: List[Optional[float]] = []
+
+    def renew(
+        self, leases: List[Lease], ttl: float, timeout: Optional[float] = None
+    ) -> List[Lease]:
+        self.timeouts.append(timeout)
+        if self.failures:
+            self.failures -= 1
+            raise sqlite3.OperationalError("database is locked")
+        return super().renew(leases, ttl, timeout)
+
+
+class TestLease(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.backend = SQLiteLeaseBackend(os.path.join(self.tmp.name, "leases.db"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_claims_distinct_machine_ids(self):
+        first = LeaseManager(self.backend, machine_id_bits=2, count=2)
+        second = LeaseManager(self.backend, machine_id_bits=2, count=2)
+
+        self.assertEqual(first.acquire(), [0, 1])
+        self.assertEqual(second.acquire(), [2, 3])
+
+        # No more machine IDs are available
+        with self.assertRaises(LeaseException):
+            LeaseManager(self.backend, machine_id_bits=2).acquire()
+
+        # Released machine IDs can be claimed again
+        first.release()
+        self.assertEqual(LeaseManager(self.backend, machine_id_bits=2).acquire(), [0])
+
+    def test_expired_leases_can_be_claimed(self):
+        first = LeaseManager(self.backend, machine_id_bits=0, ttl=0.05)
+        first.acquire()
+        with self.assertRaises(LeaseException):
+            LeaseManager(self.backend, machine_id_bits=0).acquire()
+
+        time.sleep(0.1)
+        second = LeaseManager(self.backend, machine_id_bits=0)
+        self.assertEqual(second.acquire(), [0])
+
+        # The original owner lost its lease
+        with self.assertRaises(LeaseException):
+            first.renew()
+
+    def test_renewal_keeps_leases_alive(self):
+        lost: List[LeaseException] = []
+        with LeaseManager(
+            self.backend, machine_id_bits=1, ttl=0.2, on_lost=lost.append
+        ) as manager:
+            self.assertEqual(manager.machine_ids, [0])
+            time.sleep(0.5)
+
+            # Still held, so the other machine ID is claimed
+            self.assertEqual(
+                LeaseManager(self.backend, machine_id_bits=1).acquire(), [1]
+            )
+        self.assertEqual(lost, [])
+        self.assertEqual(manager.leases, [])
+
+    def test_renewal_retries_failures(self):
+        backend = FailingBackend(os.path.join(self.tmp.name, "leases.db"), 2)
+        lost: List[LeaseException] = []
+        with LeaseManager(
+            backend, machine_id_bits=1, ttl=0.5, on_lost=lost.append
+        ) as manager:
+            time.sleep(0.7)
+            self.assertEqual(backend.failures, 0)
+            self.assertGreater(manager.leases[0].expires_at, time.time())
+        self.assertEqual(lost, [])
+
+        # The backend never waits for longer than the leases are valid
+        self.assertTrue(all(t is not None and 0 < t <= 0.5 for t in backend.timeouts))
+
+    def test_renewal_reports_expired_leases(self):
+        backend = FailingBackend(os.path.join(self.tmp.name, "leases.db"), 1000)
+        lost: List[LeaseException] = []
+        manager = LeaseManager(backend, machine_id_bits=1, ttl=0.2, on_lost=lost.append)
+        manager.acquire()
+        manager.start_renewal()
+        time.sleep(0.4)
+        manager.stop_renewal()
+
+        self.assertEqual(len(lost), 1)
+        self.assertIsInstance(lost[0].__cause__, sqlite3.OperationalError)
+
+    def test_renewal_requires_leases(self):
+        manager = LeaseManager(self.backend, machine_id_bits=1, ttl=0.2)
+        with self.assertRaises(LeaseException):
+            manager.start_renewal()
+
+        manager.acquire()
+        manager.release()
+        with self.assertRaises(LeaseException):
+            manager.start_renewal()
+        self.assertIsNone(manager._renewal)
+
+    def test_renewal_stops_once_released(self):
+        lost: List[LeaseException] = []
+        manager = LeaseManager(
+            self.backend, machine_id_bits=1, ttl=0.2, on_lost=lost.append
+        )
+        manager.acquire()
+        manager.start_renewal(interval=0.01)
+        renewal = manager._renewal
+        assert renewal is not None
+
+        # Releasing the leases directly (without stopping the renewal) ends the renewal thread
+        self.backend.release(manager.leases)
+        manager.leases = []
+        renewal.join(timeout=1)
+        self.assertFalse(renewal.is_alive())
+        self.assertEqual(lost, [])
+        manager.stop_renewal()
+
+    def test_generator_uses_leased_machine_ids(self):
+        with LeaseManager(self.backend, machine_id_bits=3, count=2) as manager:
+            generator = Generator(
+                epoch=time.time(),
+                machine_ids=manager.machine_ids,
+                machine_id_bits=3,
+                sequence_bits=1,
+                resolution=Resolution.MILLISECOND,
+            )
+            ids = generator.next_ids(100)
+
+        self.assertEqual(len(set(ids)), len(ids))
+
+
+if __name__ == "__main__":
+    unittest.main()
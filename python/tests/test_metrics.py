@@ -0,0 +1,190 @@
+import threading
+from typing import cast
+import unittest
+
+from jazzy_fish.generator import (
+    Generator,
+    GeneratorException,
+    Resolution,
+    ShardedGenerator,
+    ThreadSafeGenerator,
+)
+from jazzy_fish.metrics import (
+    CLOCK_REGRESSION,
+    IDS_ISSUED,
+    SEQUENCE_EXHAUSTED,
+    WAIT,
+    GeneratorMetrics,
+)
+from jazzy_fish.wait import NoWait
+
+from .clocks import ManualClock
+
+
+class TestMetrics(unittest.TestCase):
+    def test_records_generator_events(self):
+        events = []
+        clock = ManualClock(10_000)
+        metrics = GeneratorMetrics(
+            max_value=1 << 20, hooks=[lambda e, v: events.append((e, v))]
+        )
+        generator = Generator(
+            epoch=0,
+            machine_ids=[0, 1],
+            machine_id_bits=1,
+            sequence_bits=1,
+            resolution=Resolution.SECOND,
+            wait_strategy=NoWait(),
+            clock=clock,
+            metrics=metrics,
+        )
+
+        generator.next_ids(3)
+        generator.next_id()
+        self.assertIsNone(generator.try_next_id())
+        clock.now = 5_000
+        self.assertEqual(generator.next_ids(1), [])
+
+        snapshot = generator.metrics_snapshot()
+        self.assertEqual(snapshot.ids_issued, {0: 2, 1: 2})
+        self.assertEqual(snapshot.sequence_exhaustions, 2)
+        self.assertEqual(snapshot.wait_time.observations, 2)
+        self.assertEqual(snapshot.clock_regressions, 1)
+        self.assertEqual(snapshot.lock_wait_time.observations, 0)
+        # 2 bits are used by the machine ID and sequence: the time component overflows at 2^18 seconds
+        self.assertIsNotNone(snapshot.seconds_until_overflow)
+        self.assertAlmostEqual(
+            cast(float, snapshot.seconds_until_overflow), (1 << 18) - 5
+        )
+
+        self.assertEqual(
+            [e for e, _ in events],
+            [IDS_ISSUED, IDS_ISSUED, IDS_ISSUED]
+            + [SEQUENCE_EXHAUSTED, WAIT]
+            + [CLOCK_REGRESSION, SEQUENCE_EXHAUSTED, WAIT],
+        )
+
+    def test_records_lock_wait_time(self):
+        generator = ThreadSafeGenerator(
+            epoch=0,
+            machine_ids=[0],
+            machine_id_bits=0,
+            sequence_bits=8,
+            resolution=Resolution.MILLISECOND,
+            metrics=GeneratorMetrics(),
+        )
+
+        generator.next_id()
+        generator.next_ids(10)
+
+        snapshot = generator.metrics_snapshot()
+        self.assertEqual(snapshot.lock_wait_time.observations, 2)
+        self.assertEqual(sum(snapshot.ids_issued.values()), 11)
+        self.assertIsNone(snapshot.seconds_until_overflow)
+
+    def test_combines_shard_metrics(self):
+        generator = ShardedGenerator(
+            epoch=0,
+            machine_ids=[0, 1],
+            machine_id_bits=1,
+            sequence_bits=8,
+            resolution=Resolution.MILLISECOND,
+            metrics=GeneratorMetrics(max_value=1 << 60),
+        )
+
+        generator.next_ids(10)
+        generator.next_id()
+
+        snapshot = generator.metrics_snapshot()
+        self.assertEqual(sum(snapshot.ids_issued.values()), 11)
+        self.assertEqual(snapshot.lock_wait_time.observations, 2)
+        self.assertIsNotNone(snapshot.seconds_until_overflow)
+        self.assertGreater(cast(float, snapshot.seconds_until_overflow), 0)
+
+    def test_shards_record_into_the_passed_metrics(self):
+        clock = ManualClock(10_000)
+        metrics = GeneratorMetrics()
+        generator = ShardedGenerator(
+            epoch=0,
+            machine_ids=[0, 1],
+            machine_id_bits=1,
+            sequence_bits=8,
+            resolution=Resolution.SECOND,
+            wait_strategy=NoWait(),
+            clock=clock,
+            metrics=metrics,
+        )
+
+        thread = threading.Thread(target=lambda: generator.next_ids(20))
+        thread.start()
+        thread.join()
+        for _ in range(30):
+            generator.next_id()
+        clock.now = 5_000
+        generator.next_id()
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(sum(snapshot.ids_issued.values()), 51)
+        self.assertEqual(snapshot.clock_regressions, 1)
+        self.assertEqual(generator.clock_regressions, 1)
+        self.assertEqual(generator.metrics_snapshot().ids_issued, snapshot.ids_issued)
+
+    def test_snapshots_under_load(self):
+        generator = ThreadSafeGenerator(
+            epoch=0,
+            machine_ids=list(range(64)),
+            machine_id_bits=6,
+            sequence_bits=4,
+            resolution=Resolution.MILLISECOND,
+            metrics=GeneratorMetrics(),
+        )
+        stopped = threading.Event()
+
+        def generate() -> None:
+            while not stopped.is_set():
+                generator.next_id()
+
+        workers = [threading.Thread(target=generate) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        try:
+            issued = [
+                sum(generator.metrics_snapshot().ids_issued.values())
+                for _ in range(1000)
+            ]
+        finally:
+            stopped.set()
+            for worker in workers:
+                worker.join()
+
+        self.assertEqual(issued, sorted(issued))
+
+    def test_snapshots_are_immutable(self):
+        metrics = GeneratorMetrics()
+        metrics.record_issued(0, 1)
+        metrics.record_wait(0.5)
+        snapshot = metrics.snapshot()
+
+        with self.assertRaises(TypeError):
+            snapshot.ids_issued[0] = 2  # type: ignore[index]
+        with self.assertRaises(TypeError):
+            snapshot.wait_time.counts[0] = 2  # type: ignore[index]
+
+        metrics.record_issued(0, 1)
+        self.assertEqual(snapshot.ids_issued, {0: 1})
+
+    def test_disabled_by_default(self):
+        generator = Generator(
+            epoch=0,
+            machine_ids=[0],
+            machine_id_bits=0,
+            sequence_bits=0,
+            resolution=Resolution.MILLISECOND,
+        )
+
+        with self.assertRaises(GeneratorException):
+            generator.metrics_snapshot()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import unittest
+
+from jazzy_fish.cache import CachingWordEncoder
+from jazzy_fish.encoder import EncoderException, WordEncoder, Wordlist
+from jazzy_fish.permutation import FeistelPermutation
+
+
+class TestFeistelPermutation(unittest.TestCase):
+    def test_is_a_bijection(self):
+        for domain in [1, 2, 3, 108, 1000, 4096, 12345]:
+            for rounds in [4, 6, 8]:
+                permutation = FeistelPermutation(b"key", domain, rounds)
+                permuted = [permutation.permute(i) for i in range(domain)]
+                self.assertEqual(sorted(permuted), list(range(domain)))
+                self.assertEqual(
+                    [permutation.invert(value) for value in permuted],
+                    list(range(domain)),
+                )
+
+    def test_vectorized_results_match(self):
+        for domain in [108, 1205876531200, 1 << 63, 1 << 100]:
+            permutation = FeistelPermutation("secret", domain)
+            values = list(range(0, domain, domain // 1000 + 1))
+            permuted = [permutation.permute(value) for value in values]
+            self.assertEqual(permutation.permute_many(values), permuted)
+            self.assertEqual(permutation.invert_many(permuted), values)
+            self.assertEqual(permutation.permute_many(iter(values)), permuted)
+            self.assertEqual(permutation.invert_many(p for p in permuted), values)
+        self.assertEqual(permutation.permute_many([]), [])
+
+    def test_keys_select_different_permutations(self):
+        first = FeistelPermutation(b"first", 1 << 40)
+        second = FeistelPermutation(b"second", 1 << 40)
+        self.assertNotEqual(
+            [first.permute(i) for i in range(10)],
+            [second.permute(i) for i in range(10)],
+        )
+        self.assertEqual(
+            [first.permute(i) for i in range(10)],
+            [FeistelPermutation("first", 1 << 40).permute(i) for i in range(10)],
+        )
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            FeistelPermutation(b"", 100)
+        with self.assertRaises(ValueError):
+            FeistelPermutation(b"k" * 65, 100)
+        with self.assertRaises(ValueError):
+            FeistelPermutation(b"key", 0)
+        with self.assertRaises(ValueError):
+            FeistelPermutation(b"key", 100, rounds=5)
+        with self.assertRaises(ValueError):
+            FeistelPermutation(b"key", (1 << 128) + 1)
+
+        permutation = FeistelPermutation(b"key", 100)
+        for value in [-1, 100]:
+            with self.assertRaises(ValueError):
+                permutation.permute(value)
+            with self.assertRaises(ValueError):
+                permutation.invert(value)
+            with self.assertRaises(ValueError):
+                permutation.permute_many([0, value])
+
+
+class TestPermutedWordEncoder(unittest.TestCase):
+    wordlist: Wordlist
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.wordlist = Wordlist.load("resources/012_8562fb9", "jazzy_fish")
+
+    def setUp(self):
+        self.encoder = WordEncoder(self.wordlist, permutation_key=b"secret")
+
+    def test_round_trip(self):
+        plain = WordEncoder(self.wordlist)
+        for number in [0, 1, 2, 1701, 123456789, self.encoder.get_max() - 1]:
+            encoded = self.encoder.encode(number)
+            self.assertEqual(encoded.id, number)
+            self.assertNotEqual(encoded.keyphrase, plain.encode(number).keyphrase)
+
+            self.assertEqual(self.encoder.decode(encoded.keyphrase), number)
+            self.assertEqual(self.encoder.decode_abbr(encoded.abbr), number)
+            self.assertEqual(self.encoder.decode_bytes(encoded.abbr.encode()), number)
+            self.assertEqual(self.encoder.encode_keyphrase(number), encoded.keyphrase)
+            self.assertEqual(self.encoder.decode_fuzzy(encoded.keyphrase)[0].id, number)
+
+            buffer = bytearray(128)
+            end = self.encoder.encode_into(number, buffer, fields=("id", "abbr"))
+            self.assertEqual(buffer[:end], f"{number},{encoded.abbr}".encode())
+
+    def test_sequential_integers_do_not_share_words(self):
+        # Without a permutation, these keyphrases all start with the same adverb;
+        # about 89 distinct ones are expected when drawing 100 of the 440 adverbs at random
+        first_words = {
+            self.encoder.encode(number).keyphrase.split("-")[0]
+            for number in range(1000, 1100)
+        }
+        self.assertGreater(len(first_words), 75)
+
+    def test_batches(self):
+        numbers = list(range(10**9, 10**9 + 500))
+        encoded = self.encoder.encode_many(numbers)
+        self.assertEqual(encoded, [self.encoder.encode(number) for number in numbers])
+        self.assertEqual(
+            self.encoder.decode_many([e.keyphrase for e in encoded]), numbers
+        )
+        self.assertEqual(
+            self.encoder.decode_abbr_many([e.abbr for e in encoded]), numbers
+        )
+
+    def test_keys_must_match(self):
+        keyphrase = self.encoder.encode(42).keyphrase
+        other = WordEncoder(self.wordlist, permutation_key=b"other")
+        self.assertNotEqual(other.decode(keyphrase), 42)
+
+    def test_prefix_ranges_are_not_supported(self):
+        with self.assertRaises(EncoderException):
+            self.encoder.prefix_ranges("ab")
+        with self.assertRaises(EncoderException):
+            self.encoder.complete("ab")
+        self.assertTrue(self.encoder.permuted)
+        self.assertFalse(WordEncoder(self.wordlist).permuted)
+
+    def test_caching_encoder(self):
+        encoder = CachingWordEncoder(self.wordlist, permutation_key=b"secret")
+        self.assertEqual(encoder.encode(42), self.encoder.encode(42))
+        self.assertEqual(encoder.decode(self.encoder.encode(42).keyphrase), 42)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+import time
+from typing import Callable, List
+import unittest
+
+from jazzy_fish.clock import Clock
+from jazzy_fish.encoder import EncoderException, WordEncoder, Wordlist
+from jazzy_fish.generator import Generator, GeneratorException, Resolution
+from jazzy_fish.pool import IdPool
+from jazzy_fish.wait import NoWait
+
+from .clocks import ManualClock
+
+
+def pool_generator(clock: Clock) -> Generator:
+    return Generator(
+        epoch=0,
+        machine_ids=[0, 1],
+        machine_id_bits=1,
+        sequence_bits=3,
+        resolution=Resolution.MILLISECOND,
+        wait_strategy=NoWait(),
+        clock=clock,
+    )
+
+
+class FailingGenerator(Generator):
+    def __init__(self, clock: Clock, errors: List[Exception]):
+        super().__init__(
+            epoch=0,
+            machine_ids=[0],
+            machine_id_bits=0,
+            sequence_bits=3,
+            resolution=Resolution.MILLISECOND,
+            wait_strategy=NoWait(),
+            clock=clock,
+        )
+        self.errors = errors
+
+    def next_ids(self, count: int) -> List[int]:
+        if self.errors:
+            raise self.errors.pop(0)
+        return super().next_ids(count)
+
+
+def wait_until(condition: Callable[[], bool], timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Timed out")
+        time.sleep(0.001)
+
+
+class TestPool(unittest.TestCase):
+    def test_serves_prefilled_ids(self):
+        clock = ManualClock(1_000)
+        with IdPool(pool_generator(clock), high_watermark=8, low_watermark=4) as pool:
+            wait_until(lambda: pool.size == 8)
+
+            ids = [pool.next_id() for _ in range(4)]
+            self.assertEqual(len(set(ids)), 4)
+            self.assertEqual(pool.stats().hits, 4)
+            self.assertEqual(pool.stats().misses, 0)
+
+            # Dropping below the low watermark refills the pool in the next time unit
+            clock.now += 1
+            pool.next_id()
+            wait_until(lambda: pool.size == 8)
+
+            ids += [pool.next_id() for _ in range(8)]
+            self.assertEqual(len(set(ids)), 12)
+
+    def test_generates_on_demand_when_empty(self):
+        pool = IdPool(pool_generator(ManualClock(1_000)))
+
+        first, second = pool.next_id(), pool.next_id()
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(pool.stats(), (0, 2, 0))
+
+    def test_prefills_keyphrases(self):
+        adverbs = ["absurdly", "busily", "capably"]
+        verbs = ["abandoned", "bearded", "checked"]
+        adjectives = ["able", "blond", "chubby"]
+        nouns = ["apple", "bird", "cat", "dog"]
+        wordlist = Wordlist(
+            "0_NOVERIFY", [adverbs, verbs, adjectives, nouns], verify_checksum=False
+        )
+        encoder = WordEncoder(wordlist, min_phrase_size=1)
+        generator = Generator(
+            epoch=0,
+            machine_ids=[0],
+            machine_id_bits=0,
+            sequence_bits=2,
+            resolution=Resolution.MILLISECOND,
+            wait_strategy=NoWait(),
+            clock=ManualClock(3),
+        )
+
+        with IdPool(generator, encoder, high_watermark=4) as pool:
+            wait_until(lambda: pool.size == 4)
+
+            keyphrase = pool.next_keyphrase()
+            self.assertEqual(encoder.decode(keyphrase.keyphrase), keyphrase.id)
+            self.assertEqual(pool.next_id(), keyphrase.id + 1)
+
+    def test_reports_refill_errors(self):
+        errors = [GeneratorException("Refill failed"), OSError("Checkpoint failed")]
+        generator = FailingGenerator(ManualClock(1_000), list(errors))
+
+        with IdPool(generator, high_watermark=4) as pool:
+            # Each error is raised once, then the refill is retried
+            for error in errors:
+                wait_until(lambda: pool._error is not None)
+                with self.assertRaises(type(error)) as raised:
+                    pool.next_id()
+                self.assertIs(raised.exception, error)
+
+            wait_until(lambda: pool.size == 4)
+            self.assertEqual(len({pool.next_id() for _ in range(4)}), 4)
+
+    def test_misses_do_not_wait_for_the_whole_refill(self):
+        # A single identifier per millisecond: a full refill takes about 500ms
+        generator = Generator(
+            epoch=0,
+            machine_ids=[0],
+            machine_id_bits=0,
+            sequence_bits=0,
+            resolution=Resolution.MILLISECOND,
+        )
+
+        with IdPool(generator, high_watermark=500, low_watermark=500) as pool:
+            latencies = []
+            ids = []
+            for _ in range(100):
+                started = time.perf_counter()
+                ids.append(pool.next_id())
+                latencies.append(time.perf_counter() - started)
+
+        self.assertEqual(len(set(ids)), 100)
+        self.assertGreater(pool.stats().misses, 0)
+        self.assertLess(max(latencies), 0.1)
+
+    def test_requires_encoder_for_keyphrases(self):
+        pool = IdPool(pool_generator(ManualClock(1_000)))
+
+        with self.assertRaises(EncoderException):
+            pool.next_keyphrase()
+
+    def test_rejects_invalid_watermarks(self):
+        generator = pool_generator(ManualClock(1_000))
+
+        with self.assertRaises(GeneratorException):
+            IdPool(generator, high_watermark=0)
+        with self.assertRaises(GeneratorException):
+            IdPool(generator, high_watermark=4, low_watermark=5)
+
+
+if __name__ == "__main__":
+    unittest.main()
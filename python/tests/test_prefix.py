@@ -0,0 +1,162 @@
+from typing import Iterable, Optional, Set, Tuple
+import unittest
+
+from jazzy_fish.encoder import EncoderException, WordEncoder, Wordlist
+from jazzy_fish.prefix import Completion, PrefixIndex
+
+
+def covered(ranges: Iterable[Tuple[int, int]]) -> Set[int]:
+    return {i for start, end in ranges for i in range(start, end)}
+
+
+class TestPrefixIndex(unittest.TestCase):
+    def test_sorted_keys(self):
+        index = PrefixIndex(["apple", "apricot", "banana", "blueberry", "cherry"])
+        self.assertEqual(index.find("ap"), range(0, 2))
+        self.assertEqual(index.find("b"), range(2, 4))
+        self.assertEqual(index.find(""), range(0, 5))
+        self.assertEqual(index.find("z"), range(5, 5))
+        self.assertEqual(index.ranges("b"), [range(2, 4)])
+        self.assertEqual(index.ranges("kiwi"), [])
+        self.assertEqual(index.key(3), "blueberry")
+        self.assertEqual(index.position(3), 3)
+
+    def test_unsorted_keys(self):
+        index = PrefixIndex(["bb", "ab", "ba", "aa", "bc"])
+        ranks = index.find("b")
+        self.assertEqual([index.key(rank) for rank in ranks], ["ba", "bb", "bc"])
+        self.assertEqual([index.position(rank) for rank in ranks], [2, 0, 4])
+        self.assertEqual(index.ranges("b"), [range(0, 1), range(2, 3), range(4, 5)])
+        self.assertEqual(index.ranges("a"), [range(1, 2), range(3, 4)])
+
+
+class TestComplete(unittest.TestCase):
+    def setUp(self):
+        adverbs = ["absurdly", "busily", "capably"]
+        verbs = ["abandoned", "bearded", "checked"]
+        adjectives = ["able", "blond", "bold", "chubby"]
+        nouns = ["apple", "bird", "cat", "cot", "dog"]
+        # Abbreviations use the second character, so they are not sorted
+        self.wordlist = Wordlist(
+            "1_NOVERIFY", [adverbs, verbs, adjectives, nouns], verify_checksum=False
+        )
+        self.encoder = WordEncoder(self.wordlist, min_phrase_size=2)
+        self.encoded = [self.encoder.encode(i) for i in range(self.encoder.get_max())]
+
+    def expected(
+        self, partial: str, attribute: str, phrase_size: Optional[int] = None
+    ) -> Set[int]:
+        # The integers whose keyphrases (or abbreviations) start with the partial phrase
+        typed = partial.split("-")
+        result: Set[int] = set()
+        for encoded in self.encoded:
+            words = getattr(encoded, attribute).split("-")
+            if phrase_size is not None and len(words) != phrase_size:
+                continue
+            if (
+                len(words) >= len(typed)
+                and words[: len(typed) - 1] == typed[:-1]
+                and words[len(typed) - 1].startswith(typed[-1])
+            ):
+                result.add(encoded.id)
+        return result
+
+    def test_ranges_cover_all_matching_keyphrases(self):
+        partials = ["", "b", "c", "busily-", "busily-b", "capably-checked-b", "ch"]
+        partials += ["bird", "busily-bearded-bold-c", "x", "busily-x-"]
+        for partial in partials:
+            ranges = self.encoder.prefix_ranges(partial)
+            self.assertEqual(covered(ranges), self.expected(partial, "keyphrase"))
+            self.assertEqual(ranges, sorted(ranges))
+
+            for phrase_size in range(2, 5):
+                self.assertEqual(
+                    covered(self.encoder.prefix_ranges(partial, phrase_size)),
+                    self.expected(partial, "keyphrase", phrase_size),
+                    (partial, phrase_size),
+                )
+
+    def test_abbreviation_ranges(self):
+        for partial in ["", "h", "u-", "u-e", "a-h-l-"]:
+            self.assertEqual(
+                covered(self.encoder.abbr_prefix_ranges(partial)),
+                self.expected(partial, "abbr"),
+                partial,
+            )
+
+    def test_completions(self):
+        completions = self.encoder.complete("busily-bearded-b", phrase_size=4)
+        self.assertEqual(
+            [c.phrase for c in completions],
+            ["busily-bearded-blond", "busily-bearded-bold"],
+        )
+        for completion in completions:
+            self.assertEqual(
+                set(range(completion.start, completion.end)),
+                self.expected(completion.phrase + "-", "keyphrase", 4),
+            )
+
+        # Each completion covers the keyphrases that start with it
+        for completion in self.encoder.complete("b", limit=100):
+            self.assertTrue(
+                all(
+                    self.encoded[i].keyphrase.startswith(completion.phrase + "-")
+                    for i in range(completion.start, completion.end)
+                )
+            )
+
+    def test_completions_exclude_keyphrases_that_are_never_encoded(self):
+        # Keyphrases that start with the first word of their list encode integers that fit in fewer words
+        self.assertEqual(self.encoder.complete("ab", phrase_size=4), [])
+        self.assertEqual(self.encoder.complete("ab", phrase_size=3), [])
+        self.assertEqual(
+            self.encoder.complete("ab", phrase_size=2), [Completion("able", 0, 5)]
+        )
+        self.assertEqual(
+            self.encoder.complete("b", phrase_size=3),
+            [Completion("bearded", 20, 40)],
+        )
+
+    def test_pagination(self):
+        everything = self.encoder.complete("", limit=100)
+        self.assertEqual(
+            [c.phrase for c in everything],
+            # Two-word keyphrases start with an adjective, three-word ones with a verb, and so on
+            ["able", "blond", "bold", "chubby"]
+            + ["bearded", "checked"]
+            + ["busily", "capably"],
+        )
+        self.assertEqual(self.encoder.complete("", offset=2, limit=3), everything[2:5])
+        self.assertEqual(self.encoder.complete("", offset=100), [])
+
+    def test_abbreviation_completions(self):
+        completions = self.encoder.complete_abbr("u-", phrase_size=4)
+        self.assertEqual([c.phrase for c in completions], ["u-b", "u-e", "u-h"])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(EncoderException):
+            self.encoder.complete("a-b-c-d-e")
+        with self.assertRaises(EncoderException):
+            self.encoder.complete("a", phrase_size=1)
+        with self.assertRaises(EncoderException):
+            self.encoder.complete("a", limit=0)
+        with self.assertRaises(EncoderException):
+            self.encoder.complete("a", offset=-1)
+
+    def test_packaged_wordlist(self):
+        encoder = WordEncoder(Wordlist.load("resources/012_8562fb9", "jazzy_fish"))
+        keyphrase = encoder.encode(123456789).keyphrase
+        partial = keyphrase[: keyphrase.rindex("-") + 3]
+
+        ranges = encoder.prefix_ranges(partial)
+        self.assertEqual(len(ranges), 1)
+        start, end = ranges[0]
+        self.assertTrue(start <= 123456789 < end)
+        for i in (start, end - 1):
+            self.assertTrue(encoder.encode(i).keyphrase.startswith(partial))
+        for i in (start - 1, end):
+            self.assertFalse(encoder.encode(i).keyphrase.startswith(partial))
+
+
+if __name__ == "__main__":
+    unittest.main()
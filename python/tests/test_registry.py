@@ -0,0 +1,115 @@
+import os
+import threading
+import unittest
+from unittest import mock
+
+from jazzy_fish.encoder import EncoderException, WordEncoder, Wordlist
+from jazzy_fish.registry import WordlistRegistry, get_encoder, get_wordlist
+
+RESOURCES = os.path.join(
+    os.path.dirname(__file__), "..", "src", "jazzy_fish", "resources"
+)
+
+
+class TestWordlistRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = WordlistRegistry()
+
+    def test_wordlists_are_loaded_once(self):
+        with mock.patch.object(Wordlist, "load", wraps=Wordlist.load) as load:
+            first = self.registry.get_wordlist("resources/012_8562fb9", "jazzy_fish")
+            second = self.registry.get_wordlist("resources/012_8562fb9", "jazzy_fish")
+
+        self.assertIs(first, second)
+        self.assertEqual(load.call_count, 1)
+
+    def test_wordlists_are_keyed_by_name_package_and_order(self):
+        packaged = self.registry.get_wordlist("resources/012_8562fb9", "jazzy_fish")
+        on_disk = self.registry.get_wordlist(os.path.join(RESOURCES, "012_8562fb9"))
+        reordered = self.registry.get_wordlist(
+            "resources/012_8562fb9",
+            "jazzy_fish",
+            word_order=["noun", "adjective", "verb", "adverb"],
+        )
+        other = self.registry.get_wordlist("resources/024_84f184f", "jazzy_fish")
+
+        self.assertEqual(len({id(packaged), id(on_disk), id(reordered), id(other)}), 4)
+
+        # The same name on disk resolves to the same instance, regardless of the path
+        self.assertIs(
+            on_disk,
+            self.registry.get_wordlist(
+                os.path.join(RESOURCES, "..", "resources", "012_8562fb9")
+            ),
+        )
+
+    def test_encoders_are_cached_per_configuration(self):
+        encoder = self.registry.get_encoder("resources/012_8562fb9", "jazzy_fish")
+        self.assertIs(
+            encoder,
+            self.registry.get_encoder(
+                "resources/012_8562fb9", "jazzy_fish", min_phrase_size=4
+            ),
+        )
+
+        short = self.registry.get_encoder(
+            "resources/012_8562fb9", "jazzy_fish", min_phrase_size=1, separator="."
+        )
+        self.assertIsNot(encoder, short)
+        self.assertEqual(short.separator, ".")
+
+        # Encoders share the wordlist, and its precomputed values
+        self.assertIs(encoder._wordlist, short._wordlist)
+        self.assertIs(encoder._max_values, short._max_values)
+
+        encoded = short.encode(12345)
+        self.assertEqual(encoder.decode(encoded.keyphrase.replace(".", "-")), 12345)
+
+    def test_invalid_configurations_are_not_cached(self):
+        with self.assertRaises(EncoderException):
+            self.registry.get_encoder(
+                "resources/012_8562fb9", "jazzy_fish", min_phrase_size=5
+            )
+        with self.assertRaises(EncoderException):
+            self.registry.get_encoder(
+                "resources/012_8562fb9", "jazzy_fish", separator="--"
+            )
+        self.assertEqual(len(self.registry._encoders), 0)
+
+    def test_concurrent_loads(self):
+        results = []
+
+        def load():
+            results.append(
+                self.registry.get_wordlist("resources/012_8562fb9", "jazzy_fish")
+            )
+
+        with mock.patch.object(Wordlist, "load", wraps=Wordlist.load) as wrapped:
+            threads = [threading.Thread(target=load) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(wrapped.call_count, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_clear(self):
+        wordlist = self.registry.get_wordlist("resources/012_8562fb9", "jazzy_fish")
+        self.registry.clear()
+        self.assertIsNot(
+            wordlist,
+            self.registry.get_wordlist("resources/012_8562fb9", "jazzy_fish"),
+        )
+
+    def test_process_wide_registry(self):
+        encoder = get_encoder("resources/012_8562fb9", "jazzy_fish")
+        self.assertIsInstance(encoder, WordEncoder)
+        self.assertIs(encoder, get_encoder("resources/012_8562fb9", "jazzy_fish"))
+        self.assertIs(
+            encoder._wordlist, get_wordlist("resources/012_8562fb9", "jazzy_fish")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
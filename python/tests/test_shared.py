@@ -0,0 +1,103 @@
+import gc
+import multiprocessing
+import os
+import tempfile
+import time
+from typing import List
+import unittest
+import weakref
+
+from jazzy_fish.generator import GeneratorException, Resolution
+from jazzy_fish import shared
+from jazzy_fish.shared import ProcessSafeGenerator
+
+
+def generate_ids(generator, num_ids, queue):
+    ids = generator.next_ids(num_ids // 2)
+    ids += [generator.next_id() for _ in range(num_ids // 2)]
+    queue.put(ids)
+
+
+@unittest.skipUnless(hasattr(os, "fork"), "requires fork()")
+class TestProcessSafeGenerator(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.state_path = os.path.join(self.tmp.name, "generator.state")
+        self.epoch = time.time()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def create(
+        self,
+        machine_ids: List[int] = [0, 1],
+        machine_id_bits: int = 1,
+        sequence_bits: int = 2,
+    ) -> ProcessSafeGenerator:
+        return ProcessSafeGenerator(
+            state_path=self.state_path,
+            epoch=self.epoch,
+            machine_ids=machine_ids,
+            machine_id_bits=machine_id_bits,
+            sequence_bits=sequence_bits,
+            resolution=Resolution.MILLISECOND,
+        )
+
+    def test_forked_workers_do_not_overlap(self):
+        # The generator is created before forking, like in a pre-fork server
+        generator = self.create()
+        generator.next_id()
+
+        ctx = multiprocessing.get_context("fork")
+        queue = ctx.Queue()
+        workers = [
+            ctx.Process(target=generate_ids, args=(generator, 500, queue))
+            for _ in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        results = [id for _ in workers for id in queue.get(timeout=60)]
+        for worker in workers:
+            worker.join()
+        results += generator.next_ids(100)
+        generator.close()
+
+        self.assertEqual(len(results), 2100)
+        self.assertEqual(len(set(results)), len(results))
+
+    def test_state_is_shared_between_instances(self):
+        first = self.create()
+        second = self.create()
+
+        results = []
+        for _ in range(500):
+            results.append(first.next_id())
+            results.append(second.next_id())
+        first.close()
+        second.close()
+
+        self.assertEqual(len(set(results)), len(results))
+
+    def test_fork_hook_tracks_live_instances(self):
+        # A single fork hook re-opens all live instances, which are not kept alive by it
+        first, second = self.create(), self.create()
+        self.assertTrue({first, second} <= set(shared._instances))
+
+        collected = weakref.ref(second)
+        first.close()
+        del second
+        gc.collect()
+        self.assertNotIn(first, shared._instances)
+        self.assertIsNone(collected())
+
+    def test_rejects_different_configuration(self):
+        self.create().close()
+
+        with self.assertRaises(GeneratorException):
+            self.create(machine_ids=[0])
+        with self.assertRaises(GeneratorException):
+            self.create(sequence_bits=3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from jazzy_fish.encoder import Wordlist
+from jazzy_fish.verification import FileIdentity, VerificationCache
+
+RESOURCES = os.path.join(
+    os.path.dirname(__file__), "..", "src", "jazzy_fish", "resources"
+)
+
+
+class TestVerification(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.wordlist_dir = os.path.join(self.tmp, "012_8562fb9")
+        shutil.copytree(os.path.join(RESOURCES, "012_8562fb9"), self.wordlist_dir)
+        self.cache_path = os.path.join(self.tmp, "cache", "verified.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def load(self, cache: VerificationCache) -> int:
+        # Returns how many times the checksum was computed
+        with mock.patch.object(
+            Wordlist, "compute_checksum", wraps=Wordlist.compute_checksum
+        ) as compute:
+            Wordlist.load(self.wordlist_dir, verification_cache=cache)
+            return compute.call_count
+
+    def test_skips_verified_files(self):
+        self.assertEqual(self.load(VerificationCache(self.cache_path)), 1)
+
+        # Warm starts (in another process) read the persisted entries
+        self.assertTrue(os.path.exists(self.cache_path))
+        self.assertEqual(self.load(VerificationCache(self.cache_path)), 0)
+
+    def test_verifies_modified_files(self):
+        cache = VerificationCache(persist=False)
+        self.assertEqual(self.load(cache), 1)
+        self.assertIsNone(cache.path)
+
+        noun_path = os.path.join(self.wordlist_dir, "noun.txt")
+        with open(noun_path, "a") as file:
+            file.write("zebra\n")
+
+        with self.assertRaises(ValueError):
+            self.load(cache)
+
+    def test_file_identity(self):
+        path = os.path.join(self.wordlist_dir, "noun.txt")
+        identity = FileIdentity.of(path)
+
+        self.assertEqual(identity.size, os.path.getsize(path))
+        self.assertEqual(identity, FileIdentity.of(path))
+
+    def test_ignores_corrupted_cache(self):
+        os.makedirs(os.path.dirname(self.cache_path))
+        with open(self.cache_path, "w") as file:
+            file.write("{not json")
+
+        self.assertEqual(self.load(VerificationCache(self.cache_path)), 1)
+        self.assertEqual(self.load(VerificationCache(self.cache_path)), 0)
+
+    def test_checksum_matches_concatenated_words(self):
+        words = [f"word{i}" for i in range(10_000)]
+        expected = hashlib.sha1("\n".join(words).encode("utf-8")).hexdigest()
+
+        self.assertEqual(Wordlist.checksum(words), expected)
+        self.assertEqual(Wordlist.checksum([]), hashlib.sha1(b"").hexdigest())
+
+    def test_parallel_checksum(self):
+        wordlists = [["able", "blond"], ["apple", "bird", "cat"]]
+        expected = Wordlist.compute_checksum(wordlists, "0")
+
+        with mock.patch("jazzy_fish.encoder._PARALLEL_CHECKSUM_WORDS", 1):
+            self.assertEqual(Wordlist.compute_checksum(wordlists, "0"), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import time
+from typing import cast
+import unittest
+
+from jazzy_fish.generator import (
+    Generator,
+    Resolution,
+    SequenceExhaustedException,
+)
+from jazzy_fish.wait import HybridWait, NoWait, SleepWait, SpinWait
+
+from .clocks import ManualClock
+
+
+class TestWait(unittest.TestCase):
+    def test_strategies_wait_for_next_time_unit(self):
+        for strategy in [SpinWait(), SleepWait(), HybridWait(spin_threshold=0.001)]:
+            generator = Generator(
+                epoch=time.time(),
+                machine_ids=[0],
+                machine_id_bits=0,
+                sequence_bits=0,
+                resolution=Resolution.MILLISECOND,
+                wait_strategy=strategy,
+            )
+
+            current_time = generator._current_time()
+            result = strategy.wait(generator, current_time, current_time)
+
+            self.assertIsNotNone(result.time)
+            self.assertGreater(cast(int, result.time), current_time)
+            self.assertGreater(result.waited, 0.0)
+
+    def test_ids_are_increasing(self):
+        for strategy in [SleepWait(), HybridWait()]:
+            generator = Generator(
+                epoch=time.time(),
+                machine_ids=[0],
+                machine_id_bits=0,
+                sequence_bits=0,
+                resolution=Resolution.MILLISECOND,
+                wait_strategy=strategy,
+            )
+
+            results = [generator.next_id() for _ in range(20)]
+
+            for i in range(1, len(results)):
+                self.assertGreater(results[i], results[i - 1])
+
+    def test_no_wait_sheds_load(self):
+        clock = ManualClock(1_000_000)
+        generator = Generator(
+            epoch=0,
+            machine_ids=[0, 1],
+            machine_id_bits=1,
+            sequence_bits=0,
+            resolution=Resolution.SECOND,
+            wait_strategy=NoWait(),
+            clock=clock,
+        )
+
+        first = generator.next_id()
+        second = generator.next_id()
+        with self.assertRaises(SequenceExhaustedException):
+            generator.next_id()
+        self.assertIsNone(generator.try_next_id())
+        self.assertEqual(generator.next_ids(5), [])
+
+        # The machine index did not advance while failing
+        clock.now = 1_001_000
+        self.assertEqual(generator.next_ids(5), [first + 2, second + 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+
+from jazzy_fish.encoder import ABBR_INDEX, WORD_INDEX, WordEncoder, Wordlist
+
+
+class TestWordlist(unittest.TestCase):
+    def setUp(self):
+        # Define word lists
+        adverbs = ["absurdly", "busily", "capably"]
+        verbs = ["abandoned", "bearded", "checked"]
+        adjectives = ["able", "blond", "chubby"]
+        nouns = ["apple", "bird", "cat", "dog"]
+        self.words = [adverbs, verbs, adjectives, nouns]
+
+    def test_indexes_are_built_on_first_use(self):
+        for compact in [False, True]:
+            wordlist = Wordlist(
+                "0_NOVERIFY", self.words, verify_checksum=False, compact=compact
+            )
+            encoder = WordEncoder(wordlist, min_phrase_size=1)
+
+            # Encoding does not require any index
+            encoded = encoder.encode(107)
+            self.assertIsNone(wordlist._word_index)
+            self.assertIsNone(wordlist._abbr_index)
+
+            self.assertEqual(encoder.decode_abbr(encoded.abbr), 107)
+            self.assertIsNone(wordlist._word_index)
+            self.assertIsNotNone(wordlist._abbr_index)
+
+            self.assertEqual(encoder.decode(encoded.keyphrase), 107)
+            self.assertIsNotNone(wordlist._word_index)
+
+    def test_indexes_can_be_built_eagerly(self):
+        wordlist = Wordlist(
+            "0_NOVERIFY", self.words, verify_checksum=False, indexes=[WORD_INDEX]
+        )
+        self.assertIsNotNone(wordlist._word_index)
+        self.assertIsNone(wordlist._abbr_index)
+
+        wordlist = Wordlist(
+            "0_NOVERIFY",
+            self.words,
+            verify_checksum=False,
+            indexes=[WORD_INDEX, ABBR_INDEX],
+        )
+        self.assertIsNotNone(wordlist._word_index)
+        self.assertIsNotNone(wordlist._abbr_index)
+
+    def test_abbreviations_are_computed_once(self):
+        for compact in [False, True]:
+            wordlist = Wordlist(
+                "0_NOVERIFY", self.words, verify_checksum=False, compact=compact
+            )
+            abbrs = wordlist._get_abbreviations()
+            self.assertEqual(
+                [list(lst) for lst in abbrs],
+                [[word[0] for word in lst] for lst in self.words],
+            )
+            self.assertIs(wordlist._get_abbreviations(), abbrs)
+
+            # Also used by the abbreviation index
+            WordEncoder(wordlist).decode_abbr("a-a-a-a")
+            self.assertIs(wordlist._get_abbreviations(), abbrs)
+
+    def test_rejects_unknown_indexes(self):
+        with self.assertRaises(ValueError):
+            Wordlist("0_NOVERIFY", self.words, verify_checksum=False, indexes=["x"])
+
+    def test_load_without_verification(self):
+        wordlist = Wordlist.load(
+            "resources/012_8562fb9",
+            "jazzy_fish",
+            indexes=[ABBR_INDEX],
+            verify_checksum=False,
+        )
+
+        self.assertIsNone(wordlist._word_index)
+        self.assertIsNotNone(wordlist._abbr_index)
+
+
+if __name__ == "__main__":
+    unittest.main()
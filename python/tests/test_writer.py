@@ -0,0 +1,127 @@
+import io
+import mmap
+import unittest
+
+from jazzy_fish.encoder import EncoderException, WordEncoder, Wordlist
+from jazzy_fish.writer import KeyPhraseWriter
+
+
+class TestEncodeInto(unittest.TestCase):
+    wordlist: Wordlist
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.wordlist = Wordlist.load("resources/012_8562fb9", "jazzy_fish")
+
+    def setUp(self):
+        self.encoder = WordEncoder(self.wordlist, min_phrase_size=1)
+
+    def test_matches_encode(self):
+        buffer = bytearray(256)
+        for number in [0, 1, 1701, 987654321, self.encoder.get_max() - 1]:
+            encoded = self.encoder.encode(number)
+            end = self.encoder.encode_into(number, buffer)
+            self.assertEqual(buffer[:end], encoded.keyphrase.encode())
+
+            end = self.encoder.encode_into(
+                number, buffer, 10, ("id", "keyphrase", "abbr"), "\t"
+            )
+            self.assertEqual(
+                buffer[10:end],
+                f"{number}\t{encoded.keyphrase}\t{encoded.abbr}".encode(),
+            )
+
+    def test_separator(self):
+        encoder = WordEncoder(self.wordlist, separator=".")
+        buffer = bytearray(128)
+        end = encoder.encode_into(31337, buffer, fields=("abbr",))
+        self.assertEqual(buffer[:end], encoder.encode(31337).abbr.encode())
+
+    def test_writable_buffers(self):
+        expected = self.encoder.encode(42).keyphrase.encode()
+        with mmap.mmap(-1, 64) as mapped:
+            end = self.encoder.encode_into(42, mapped, 3)
+            self.assertEqual(mapped[3:end], expected)
+
+        buffer = bytearray(64)
+        end = self.encoder.encode_into(42, memoryview(buffer), 5)
+        self.assertEqual(buffer[5:end], expected)
+
+    def test_max_record_size(self):
+        fields = ("id", "keyphrase", "abbr")
+        size = self.encoder.max_record_size(fields)
+        buffer = bytearray(size)
+        for number in range(0, self.encoder.get_max(), 9876543):
+            self.assertLessEqual(
+                self.encoder.encode_into(number, buffer, 0, fields), size
+            )
+
+    def test_invalid_arguments(self):
+        buffer = bytearray(8)
+        with self.assertRaises(EncoderException):
+            self.encoder.encode_into(self.encoder.get_max(), bytearray(128))
+        for fields in [("words",), (), ("id", "words")]:
+            with self.assertRaises(EncoderException):
+                self.encoder.encode_into(42, bytearray(128), fields=fields)
+            with self.assertRaises(EncoderException):
+                self.encoder.max_record_size(fields)
+
+        # Nothing is written, if the record does not fit
+        with self.assertRaises(EncoderException):
+            self.encoder.encode_into(987654321, buffer)
+        self.assertEqual(buffer, bytearray(8))
+
+
+class TestKeyPhraseWriter(unittest.TestCase):
+    encoder: WordEncoder
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.encoder = WordEncoder(Wordlist.load("resources/012_8562fb9", "jazzy_fish"))
+
+    def test_writes_records(self):
+        numbers = list(range(0, 10**12, 7919 * 10**6))
+        file = io.BytesIO()
+        # A small buffer, which is flushed many times
+        with KeyPhraseWriter(file, self.encoder, ("id", "abbr"), buffer_size=64) as w:
+            w.write(123)
+            self.assertEqual(w.write_many(numbers), len(numbers))
+
+        expected = "".join(
+            f"{k.id},{k.abbr}\n" for k in map(self.encoder.encode, [123] + numbers)
+        )
+        self.assertEqual(file.getvalue().decode(), expected)
+
+    def test_flush(self):
+        file = io.BytesIO()
+        writer = KeyPhraseWriter(file, self.encoder)
+        writer.write(42)
+        self.assertEqual(file.getvalue(), b"")
+
+        writer.flush()
+        expected = (self.encoder.encode(42).keyphrase + "\n").encode()
+        self.assertEqual(file.getvalue(), expected)
+
+        writer.close()
+        with self.assertRaises(ValueError):
+            writer.write(43)
+
+    def test_keeps_records_written_before_an_error(self):
+        file = io.BytesIO()
+        with KeyPhraseWriter(file, self.encoder) as writer:
+            with self.assertRaises(EncoderException):
+                writer.write_many([1, 2, self.encoder.get_max()])
+        self.assertEqual(file.getvalue().count(b"\n"), 2)
+
+    def test_buffer_too_small(self):
+        with self.assertRaises(EncoderException):
+            KeyPhraseWriter(io.BytesIO(), self.encoder, buffer_size=16)
+
+    def test_invalid_fields(self):
+        for fields in [(), ("keyphrase", "words")]:
+            with self.assertRaises(EncoderException):
+                KeyPhraseWriter(io.BytesIO(), self.encoder, fields)
+
+
+if __name__ == "__main__":
+    unittest.main()